@@ -0,0 +1,92 @@
+"""주제 마무리(CONCLUDE) 턴 벤치마크: 분석+피드백 2회 호출 vs 통합 1회 호출
+
+실제 API 대신 호출당 지연(왕복 + 출력 토큰 생성 시간)을 흉내 내는 가짜 모델을 사용합니다.
+
+    PYTHONPATH=src python benchmarks/bench_conclusion_turn.py --turns 20 --rtt 0.4
+"""
+
+import argparse
+import json
+import statistics
+import time
+from unittest.mock import patch
+
+from interview_coach.core.interviewer import MockInterviewer
+from interview_coach.core.session import InterviewSession
+from interview_coach.config.constants import LLMSettings
+
+ANALYSIS_TEXT = """액션: CONCLUDE
+답변_완성도: 4
+다음_응답: 수고하셨습니다. 다음 주제로 넘어가겠습니다.
+피드백: 핵심을 잘 설명했습니다."""
+
+FEEDBACK_TEXT = """이해도 평가:
+- 전반적인 개념 이해도: 상
+강점:
+- 개념 설명이 정확함
+개선 필요:
+- 실무 예시 보완
+학습 제안:
+- 심화 학습"""
+
+COMBINED_TEXT = json.dumps({
+    "action": "CONCLUDE",
+    "completion_score": 4,
+    "next_response": "수고하셨습니다. 다음 주제로 넘어가겠습니다.",
+    "feedback": "핵심을 잘 설명했습니다.",
+    "topic_feedback": {
+        "understanding": "상",
+        "strengths": ["개념 설명이 정확함"],
+        "improvements": ["실무 예시 보완"],
+        "suggestions": ["심화 학습"]
+    }
+}, ensure_ascii=False)
+
+def make_fake_model(rtt: float, per_char: float):
+    """호출마다 왕복 지연 + 출력 길이 비례 지연을 주는 가짜 응답 함수"""
+    def fake_response(prompt, retry_count=3, cache_key=None, priority=None):
+        if '"topic_feedback"' in prompt:
+            text = COMBINED_TEXT
+        elif '피드백 작성 시 주의사항' in prompt:
+            text = FEEDBACK_TEXT
+        else:
+            text = ANALYSIS_TEXT
+        time.sleep(rtt + per_char * len(text))
+        return text
+    return fake_response
+
+def run_turns(interviewer: MockInterviewer, turns: int, combined: bool):
+    """CONCLUDE 턴을 반복 실행하고 턴별 소요 시간(초) 반환"""
+    timings = []
+    with patch.object(LLMSettings, 'COMBINED_CONCLUSION', combined), \
+         patch.object(interviewer, 'prefetch_next_topic'), \
+         patch.object(interviewer, 'schedule_topic_summary'):
+        for _ in range(turns):
+            session = InterviewSession(position="프론트엔드", current_topic="JavaScript/TypeScript 기초")
+            session.add_message('interviewer', "클로저에 대해 설명해주세요.")
+            start = time.perf_counter()
+            result = interviewer.handle_answer(session, "클로저는 함수가 선언될 때의 환경을 기억하는 것입니다.")
+            timings.append(time.perf_counter() - start)
+            assert result['type'] == 'conclude' and result['feedback']['strengths']
+    return timings
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--turns', type=int, default=10)
+    parser.add_argument('--rtt', type=float, default=0.3, help='호출당 왕복 지연(초)')
+    parser.add_argument('--per-char', type=float, default=0.0005, help='출력 글자당 생성 시간(초)')
+    args = parser.parse_args()
+
+    interviewer = MockInterviewer("benchmark-key")
+    fake_response = make_fake_model(args.rtt, args.per_char)
+    with patch.object(interviewer, 'get_model_response', side_effect=fake_response):
+        two_call = run_turns(interviewer, args.turns, combined=False)
+        one_call = run_turns(interviewer, args.turns, combined=True)
+
+    for label, timings in (("2회 호출 (분석 + 피드백)", two_call), ("통합 1회 호출", one_call)):
+        print(f"{label:<24} mean={statistics.mean(timings) * 1000:8.1f}ms  "
+              f"p95={sorted(timings)[int(len(timings) * 0.95) - 1] * 1000:8.1f}ms")
+    print(f"속도 향상: {statistics.mean(two_call) / statistics.mean(one_call):.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""세션 메모리 벤치마크: 기존 dataclass 대화 모델 vs __slots__ 압축 모델
+
+tracemalloc으로 세션 N개를 만들 때 늘어난 메모리를 측정해 세션당 바이트를 출력합니다.
+기존 모델(인스턴스 __dict__, datetime, dict 피드백)은 이 파일에 그대로 재현해 비교합니다.
+
+    PYTHONPATH=src python benchmarks/bench_session_memory.py --sessions 500 --topics 5 --turns 8
+    PYTHONPATH=src python benchmarks/bench_session_memory.py --formatted   # 대화록 캐시 포함
+"""
+
+import argparse
+import gc
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from interview_coach.core.models import Conversation
+from interview_coach.core.session import InterviewSession
+
+@dataclass
+class LegacyConversation:
+    """변경 전 대화 모델"""
+    role: str
+    content: str
+    timestamp: datetime = field(default_factory=datetime.now)
+    feedback: Optional[Dict] = None
+
+def make_feedback(topic: str) -> Dict:
+    return {
+        'understanding': f"{topic} 전반적인 개념 이해도: 중",
+        'strengths': ["기본 개념을 정확히 알고 있음", "예시를 들어 설명함"],
+        'improvements': ["실무 적용 사례 보완", "성능 측면 고려 부족"],
+        'suggestions': ["공식 문서 학습", "토이 프로젝트로 실습"],
+    }
+
+def build_sessions(
+    factory: Callable, sessions: int, topics: int, turns: int, answer_chars: int, formatted: bool = False
+) -> List[InterviewSession]:
+    """면접관 질문과 지원자 답변이 번갈아 쌓인 세션 목록 (주제 마지막 메시지에 피드백)"""
+    result = []
+    for s in range(sessions):
+        session = InterviewSession(position="백엔드")
+        for t in range(topics):
+            topic = f"주제{t}"
+            messages = []
+            for turn in range(turns):
+                role = 'interviewer' if turn % 2 == 0 else 'candidate'
+                # 세션마다 다른 문자열 (실제처럼 내용 공유 없음)
+                content = f"[{s}-{t}-{turn}] " + ("답" if role == 'candidate' else "질") * (
+                    answer_chars if role == 'candidate' else answer_chars // 3
+                )
+                feedback = make_feedback(topic) if turn == turns - 1 else None
+                messages.append(factory(role=role, content=content, feedback=feedback))
+            session.conversations[topic] = messages
+            session.completed_topics.append(topic)
+            if formatted:
+                # 답변 분석 프롬프트를 만들 때처럼 주제 대화록 캐시 생성
+                session.get_formatted_conversation(topic)
+        result.append(session)
+    return result
+
+def measure(factory: Callable, args) -> int:
+    """세션당 할당 바이트"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    sessions = build_sessions(factory, args.sessions, args.topics, args.turns, args.answer_chars, args.formatted)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    del sessions
+    return total // args.sessions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sessions', type=int, default=500)
+    parser.add_argument('--topics', type=int, default=5)
+    parser.add_argument('--turns', type=int, default=8, help='주제당 메시지 수')
+    parser.add_argument('--answer-chars', type=int, default=300, help='지원자 답변 글자 수')
+    parser.add_argument('--formatted', action='store_true', help='주제별 대화록 캐시까지 포함해 측정')
+    args = parser.parse_args()
+
+    print(f"세션 {args.sessions}개, 주제 {args.topics}개 x 메시지 {args.turns}개, 답변 {args.answer_chars}자")
+    legacy = measure(LegacyConversation, args)
+    compact = measure(Conversation, args)
+    for label, size in (("기존 dataclass", legacy), ("__slots__ 압축", compact)):
+        print(f"{label:<14} {size:>10,d} bytes/session")
+    print(f"절감: {(legacy - compact):,d} bytes/session ({(1 - compact / legacy) * 100:.1f}%)")
+
+if __name__ == "__main__":
+    main()
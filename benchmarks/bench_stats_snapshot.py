@@ -0,0 +1,82 @@
+"""통계 조회 벤치마크: st.cache_data(ttl=300) 방식 vs 세대 번호 스냅샷 캐시
+
+기록과 조회를 섞어 실행하며 조회 지연과 오래된 값(stale)을 반환한 비율을 비교합니다.
+TTL 방식은 st.cache_data와 같은 동작(만료 전에는 캐시, 만료 후 다시 읽기)을 흉내 냅니다.
+
+    PYTHONPATH=src python benchmarks/bench_stats_snapshot.py --reads 20000 --write-every 200
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from datetime import date
+from typing import Callable, Dict
+
+from interview_coach.stats.backends import create_backend
+from interview_coach.stats.models import StatisticsEvent
+from interview_coach.stats.snapshot import StatisticsSnapshotCache
+
+class TTLCache:
+    """st.cache_data(ttl=...)와 같은 만료 기반 캐시"""
+
+    def __init__(self, load: Callable[[], Dict], ttl: float):
+        self.load = load
+        self.ttl = ttl
+        self._value = None
+        self._loaded_at = float('-inf')
+
+    def get(self) -> Dict:
+        now = time.monotonic()
+        if now - self._loaded_at >= self.ttl:
+            self._value = self.load()
+            self._loaded_at = now
+        return self._value
+
+def run(kind: str, reads: int, write_every: int, ttl: float):
+    """(방식별 조회 지연 목록, 방식별 stale 비율) 반환"""
+    with tempfile.TemporaryDirectory() as stats_dir:
+        backend = create_backend(kind, stats_dir)
+        today = date.today()
+        ttl_cache = TTLCache(lambda: backend.load(today), ttl)
+        snapshot = StatisticsSnapshotCache(backend)
+        readers = {
+            "캐시 없음": lambda: backend.load(today),
+            f"TTL {ttl:g}초": ttl_cache.get,
+            "스냅샷": lambda: snapshot.get_day(today),
+        }
+        timings = {label: [] for label in readers}
+        stale = {label: 0 for label in readers}
+        written = 0
+
+        for i in range(reads):
+            if i % write_every == 0:
+                backend.record(StatisticsEvent(position="백엔드", completed=True))
+                snapshot.invalidate()
+                written += 1
+            for label, read in readers.items():
+                start = time.perf_counter()
+                stats = read()
+                timings[label].append(time.perf_counter() - start)
+                stale[label] += stats["total_interviews"] != written
+
+        return timings, {label: count / reads for label, count in stale.items()}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--backend', choices=['sqlite', 'json', 'event_log'], default='sqlite')
+    parser.add_argument('--reads', type=int, default=5000)
+    parser.add_argument('--write-every', type=int, default=100, help='조회 N회마다 기록 1회')
+    parser.add_argument('--ttl', type=float, default=300.0)
+    args = parser.parse_args()
+
+    timings, stale = run(args.backend, args.reads, args.write_every, args.ttl)
+    print(f"저장소: {args.backend}, 조회 {args.reads}회, 기록 {args.reads // args.write_every}회")
+    for label, values in timings.items():
+        values.sort()
+        print(f"{label:<10} mean={statistics.mean(values) * 1e6:8.1f}us  "
+              f"p99={values[int(len(values) * 0.99) - 1] * 1e6:8.1f}us  "
+              f"stale={stale[label] * 100:5.1f}%")
+
+if __name__ == "__main__":
+    main()
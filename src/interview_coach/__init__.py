@@ -1,6 +1,7 @@
 """AI 면접 코치 - LLM 기반 개발자 기술면접 연습 시스템"""
 
 from .core.interviewer import MockInterviewer
+from .core.async_interviewer import AsyncMockInterviewer
 from .core.session import InterviewSession
 from .core.models import Conversation
 
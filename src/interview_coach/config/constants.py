@@ -49,4 +49,101 @@ POSITION_TOPICS: Dict[str, List[str]] = {
 class UsageLimits:
     MAX_ANSWER_LENGTH = 3000  # 답변 최대 글자수
     MAX_TOPICS_PER_SESSION = 5  # 세션당 최대 주제 수
-    MAX_RESPONSES_PER_TOPIC = 10  # 주제당 최대 답변 횟수
\ No newline at end of file
+    MAX_RESPONSES_PER_TOPIC = 10  # 주제당 최대 답변 횟수
+
+class LLMSettings:
+    MODEL_NAME = 'gemini-pro'  # 사용 모델
+    TEMPERATURE = 0.7  # 생성 온도
+    MAX_CONCURRENT_CALLS = 32  # 프로세스(이벤트 루프)당 동시 LLM 호출 수
+    PREFETCH_WORKERS = 8  # 다음 주제 질문 선행 생성용 백그라운드 스레드 수
+    COMBINED_CONCLUSION = True  # 답변 분석과 주제 피드백을 한 번의 호출(JSON)로 생성
+    HIERARCHICAL_EVALUATION = True  # 최종 평가를 주제별 요약으로부터 생성
+    SUMMARY_WAIT_SECONDS = 20.0  # 최종 평가 시 진행 중인 주제 요약 최대 대기 시간(초)
+    WARM_UP_TIMEOUT = 5.0  # 시작 시 Gemini 채널 연결 대기 시간(초)
+
+class CacheSettings:
+    MAX_ENTRIES = 256  # 캐시 키 최대 개수 (LRU)
+    TTL_SECONDS = 7 * 24 * 60 * 60  # 응답 변형 유효 기간
+    VARIANTS_PER_KEY = 5  # 키당 보관할 응답 변형 수
+    STORAGE_PATH = ".streamlit/cache/responses.json"  # None이면 메모리에만 보관
+    SAVE_DELAY_SECONDS = 2.0  # 변경 후 디스크 기록까지 대기 시간(초), 그 사이 변경은 한 번에 기록
+
+class RetrySettings:
+    BASE_DELAY = 0.5  # 첫 재시도 기본 대기 시간(초), 시도마다 2배 증가
+    MAX_DELAY = 8.0  # 재시도 대기 시간 상한(초)
+    RATE_LIMIT_MULTIPLIER = 4.0  # 할당량 초과 오류 시 대기 시간 배수
+    BREAKER_FAILURE_THRESHOLD = 5  # 서킷 브레이커가 열리는 연속 실패 횟수
+    BREAKER_RESET_TIMEOUT = 30.0  # 브레이커가 열린 뒤 시험 호출까지 대기 시간(초)
+
+class SchedulerSettings:
+    RATE_PER_SECOND = 1.0  # 프로세스 전체 Gemini 호출 속도 (초당 요청 수)
+    BURST = 10  # 순간적으로 허용하는 최대 호출 수
+    MAX_WAIT_SECONDS = 60.0  # 토큰 대기 최대 시간(초)
+    MIN_POLL_SECONDS = 0.05  # 앞선 요청을 기다리는 비동기 대기자의 최소 재확인 간격(초)
+
+class PromptBudgets:
+    # 작업별 프롬프트 최대 토큰 수 (추정치 기준)
+    TASK_LIMITS = {
+        "analyze_answer": 4000,
+        "refresh_topic": 2500,
+        "topic_feedback": 5000,
+        "topic_summary": 5000,
+    }
+    MAX_ANSWER_TOKENS = 1500  # 대화 내역을 줄여도 예산을 넘을 때 답변에 보장하는 최소 토큰 수
+    KEEP_LAST_TURNS = 4  # 예산 초과 시 원문 그대로 유지하는 최근 발화 수
+    DIGEST_CHARS = 200  # 이전 발화를 축약할 때 남기는 글자 수
+
+class SessionSettings:
+    PERSIST = True  # 세션 변경 내역을 저장해 재시작/새로고침 후 이어서 진행
+    STORE_PATH = ".streamlit/sessions/sessions.db"  # 세션 저널 SQLite 파일
+    SQLITE_TIMEOUT = 30.0  # 다른 프로세스의 쓰기 잠금 최대 대기 시간(초)
+    SNAPSHOT_EVERY = 50  # 이 개수만큼 저널이 쌓이면 스냅샷으로 압축
+    TTL_DAYS = 7  # 마지막 변경 후 세션 보관 기간(일)
+    QUERY_PARAM = "sid"  # 세션 토큰을 담는 URL 쿼리 파라미터 이름
+    MAX_ACTIVE_SESSIONS = 200  # 메모리에 유지하는 최대 세션 수 (초과 시 오래된 세션부터 디스크로)
+    MEMORY_CEILING_MB = 64  # 활성 세션 추정 메모리 상한(MB)
+    IDLE_SECONDS = 600  # 이 시간 동안 접근이 없으면 디스크로 내보냄(초)
+
+class ArchiveSettings:
+    FORMAT = 'jsonl.gz'  # 일괄 내보내기 형식 ('parquet'은 pyarrow 필요)
+    PARTITION_SIZE = 200  # 작업 프로세스 하나가 한 번에 처리해 파일 하나로 쓰는 세션 수
+    COMPRESSION_LEVEL = 6  # jsonl.gz 압축 수준 (1-9)
+
+class AssetSettings:
+    STATIC_DIR = "static"  # Streamlit 정적 파일 디렉토리 (run.py가 있는 앱 루트 기준, server.enableStaticServing 필요)
+    STATIC_URL = "app/static"  # 정적 파일 URL 경로 (앱 페이지 기준 상대 경로)
+    HASH_LENGTH = 12  # 파일명에 붙이는 내용 해시 길이
+    FETCH_TIMEOUT = 30.0  # 빌드 단계 vendor 파일 내려받기 제한 시간(초)
+    # 내려받아 패키지에 포함하는 외부 라이브러리 (파일명: 원본 URL, 로드 순서대로)
+    VENDOR_ASSETS = {
+        "react.production.min.js": "https://unpkg.com/react@17.0.2/umd/react.production.min.js",
+        "react-dom.production.min.js": "https://unpkg.com/react-dom@17.0.2/umd/react-dom.production.min.js",
+        "tailwind.min.css": "https://cdn.jsdelivr.net/npm/tailwindcss@2.2.19/dist/tailwind.min.css",
+    }
+
+class StatisticsSettings:
+    BACKEND = 'sqlite'  # 통계 저장소 ('sqlite', 'event_log', 'sharded', 'json')
+    STATS_DIR = ".streamlit/statistics"  # 통계 저장 디렉토리
+    SQLITE_FILE = "stats.db"  # SQLite 백엔드 파일명 (STATS_DIR 기준)
+    SQLITE_TIMEOUT = 30.0  # 다른 프로세스의 쓰기 잠금 최대 대기 시간(초)
+    DAYS_TO_KEEP = 30  # 통계 보관 기간(일)
+    EVENT_LOG_FILE = "events.jsonl"  # 이벤트 로그 백엔드의 추가 전용 로그 파일명
+    ROLLUP_FILE = "rollups.json"  # 이벤트 로그를 일/주/월 단위로 접은 집계 파일명
+    COMPACT_EVERY = 100  # 이 개수만큼 이벤트가 쌓이면 집계 파일로 압축
+    SCORE_FILE = "scores.bin"  # 답변 점수 고정 길이 레코드 파일명
+    SCORE_VOCAB_FILE = "scores_vocab.json"  # 점수 레코드의 포지션/주제 코드 사전 파일명
+    RANKING_FILE = "ranking.jsonl"  # 세션별 포지션/주제 평균 점수를 덧붙이는 순위 색인 로그 파일명
+    SHARD_DIR = "shards"  # 샤드 카운터 백엔드의 프로세스별 샤드 디렉토리 (STATS_DIR 기준)
+    SHARD_BASE_FILE = "base.json"  # 종료된 프로세스의 샤드를 합쳐 두는 기본 샤드 파일명 (SHARD_DIR 기준)
+    WRITE_BEHIND = True  # 통계를 메모리에 모아 백그라운드 스레드에서 일괄 반영
+    FLUSH_INTERVAL = 5.0  # 지연 쓰기 버퍼 반영 주기(초)
+    FLUSH_BATCH_SIZE = 50  # 이 개수만큼 쌓이면 주기와 관계없이 반영
+    DURABILITY = 'spool'  # 버퍼 장애 대비 수준 ('memory', 'spool', 'fsync')
+    SNAPSHOT_FALLBACK_TTL = 5.0  # 변경 감지를 지원하지 않는 저장소의 스냅샷 재사용 시간(초)
+    SNAPSHOT_MAX_ENTRIES = 64  # 스냅샷 캐시에 보관하는 최대 키(일자/기간) 수 (LRU)
+    # 대시보드 기간 선택 (표시 이름: 오늘 포함 일수)
+    DASHBOARD_RANGES = {
+        "오늘": 1,
+        "최근 7일": 7,
+        "최근 30일": 30,
+    }
@@ -0,0 +1,210 @@
+"""비동기 면접관 로직 구현"""
+
+import asyncio
+import weakref
+from typing import Dict, Optional
+
+from .interviewer import MockInterviewer
+from .models import AnswerAnalysis
+from .scheduler import RequestPriority
+from .session import InterviewSession
+from ..prompts.interview import InterviewPrompts
+from ..prompts.evaluation import EvaluationPrompts
+from ..config.constants import LLMSettings, SchedulerSettings
+
+# 이벤트 루프별 동시 호출 제한 (같은 루프의 모든 세션이 공유)
+_loop_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+def _get_loop_semaphore(limit: int) -> asyncio.Semaphore:
+    """현재 이벤트 루프에 연결된 공유 세마포어 반환"""
+    loop = asyncio.get_running_loop()
+    semaphore = _loop_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(limit)
+        _loop_semaphores[loop] = semaphore
+    return semaphore
+
+class AsyncMockInterviewer(MockInterviewer):
+    """asyncio 기반 AI 면접관 구현
+
+    Gemini 비동기 API(generate_content_async)를 사용하므로 네트워크 대기 중에
+    스레드를 점유하지 않습니다. 동시 호출 수는 이벤트 루프 단위로 제한되어
+    한 프로세스에서 여러 세션의 LLM 호출을 동시에 처리할 수 있습니다.
+    """
+
+    def __init__(self, api_key: str, max_concurrency: Optional[int] = None):
+        super().__init__(api_key)
+        # None이면 같은 이벤트 루프의 모든 면접관이 기본 제한을 공유
+        self.max_concurrency = max_concurrency
+        # 세마포어는 만든 이벤트 루프에 묶이므로 루프별로 따로 보관
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _acquire_slot(self) -> asyncio.Semaphore:
+        """현재 이벤트 루프의 동시 호출 슬롯 반환"""
+        if self.max_concurrency is None:
+            return _get_loop_semaphore(LLMSettings.MAX_CONCURRENT_CALLS)
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def _wait_for_slot_async(self, priority: RequestPriority) -> bool:
+        """스케줄러에서 호출 토큰을 비동기로 획득 (대기 시간 초과 시 False)"""
+        try:
+            await self.scheduler.acquire_async(priority, timeout=SchedulerSettings.MAX_WAIT_SECONDS)
+            return True
+        except TimeoutError:
+            return False
+
+    async def get_model_response_async(
+        self, prompt: str, retry_count: int = 3, cache_key: Optional[str] = None,
+        priority: RequestPriority = RequestPriority.QUESTION_GENERATION
+    ) -> Optional[str]:
+        """Gemini 비동기 API를 사용하여 응답을 생성"""
+        if cache_key:
+            cached = self.response_cache.get(cache_key)
+            if cached:
+                return cached
+
+            response_text = await self.get_model_response_async(prompt, retry_count, priority=priority)
+            if response_text:
+                self.response_cache.put(cache_key, response_text)
+            return response_text
+
+        permit = self.circuit_breaker.allow_request()
+        if permit is None:
+            return None
+
+        try:
+            for i in range(retry_count):
+                if not await self._wait_for_slot_async(priority):
+                    return None
+                try:
+                    async with self._acquire_slot():
+                        model = self.client_pool.get_async_model(self.api_key, LLMSettings.MODEL_NAME)
+                        response = await model.generate_content_async(
+                            prompt,
+                            generation_config=self._generation_config()
+                        )
+                    self.circuit_breaker.record_success()
+                    if response.text:
+                        return response.text
+                except Exception as e:
+                    delay = self._retry_delay_or_raise(e, i, retry_count)
+                    if delay is None:
+                        return None
+                    await asyncio.sleep(delay)
+            return None
+        finally:
+            # 결과를 기록하지 못하고 끝난 시험 호출이 half_open 상태를 막지 않도록 정리
+            self.circuit_breaker.release_trial(permit)
+
+    async def analyze_answer_async(self, answer: str, question_context: dict) -> AnswerAnalysis:
+        """답변 분석 및 다음 액션 결정"""
+        prompt = self._analysis_prompt(answer, question_context)
+        response = await self.get_model_response_async(prompt, priority=RequestPriority.ANSWER_ANALYSIS)
+        return self._parse_analysis_response(response)
+
+    async def handle_answer_async(self, session: InterviewSession, answer: str) -> Dict:
+        """답변 처리 및 다음 상호작용 결정"""
+        current_context = {
+            'position': session.position,
+            'topic': session.current_topic,
+            'history': session.get_current_conversation(),
+            'formatted_history': session.get_formatted_conversation()
+        }
+
+        analysis = await self.analyze_answer_async(answer, current_context)
+        session.add_message('candidate', answer)
+        # 기본 분석의 점수는 실제 평가가 아니므로 통계/순위에 넣지 않음
+        if not analysis.fallback:
+            session.record_score(analysis.completion_score)
+
+        if analysis.action == 'FOLLOW_UP' or analysis.action == 'HINT':
+            session.add_message('interviewer', analysis.next_response)
+            return {
+                'type': analysis.action.lower(),
+                'response': analysis.next_response
+            }
+        else:  # CONCLUDE
+            feedback = analysis.topic_feedback or await self._generate_topic_feedback_async(session)
+            session.add_message('interviewer', analysis.next_response, feedback=feedback)
+            self.schedule_topic_summary(session, feedback)
+            return {
+                'type': 'conclude',
+                'response': analysis.next_response,
+                'feedback': feedback
+            }
+
+    async def start_topic_async(self, session: InterviewSession, topic: str) -> str:
+        """새로운 주제로 면접 시작"""
+        prompt = InterviewPrompts.start_topic(
+            position=session.position,
+            topic=topic
+        )
+
+        first_question = await self.get_model_response_async(
+            prompt, cache_key=self._start_topic_cache_key(session.position, topic)
+        )
+        if first_question:
+            session.current_topic = topic
+            session.add_message('interviewer', first_question)
+            return first_question
+
+        return f"{topic}에 대해 설명해주시겠습니까?"
+
+    async def refresh_current_topic_async(self, session: InterviewSession) -> str:
+        """현재 주제에 대해 새로운 질문 생성"""
+        prompt = self._build_budgeted_prompt(
+            'refresh_topic',
+            InterviewPrompts.refresh_topic,
+            history=session.get_current_conversation(),
+            formatted_history=session.get_formatted_conversation(),
+            position=session.position,
+            topic=session.current_topic
+        )
+
+        new_question = await self.get_model_response_async(prompt)
+        if new_question:
+            session.reset_current_conversation()
+            session.add_message('interviewer', new_question)
+            return new_question
+
+        return f"{session.current_topic}에 대해 다른 관점에서 이야기해보시겠어요?"
+
+    async def generate_final_evaluation_async(self, session: InterviewSession) -> str:
+        """최종 평가 생성"""
+        # 더 진행할 주제가 없으므로 미리 준비한 질문은 버림
+        self.discard_prefetched()
+        if not session.get_all_conversations():
+            return EvaluationPrompts.get_empty_evaluation_message()
+
+        # 주제 요약 대기는 블로킹이므로 이벤트 루프 밖에서 수행
+        prompt = await asyncio.to_thread(self._final_evaluation_prompt, session)
+        return (
+            await self.get_model_response_async(prompt, priority=RequestPriority.FINAL_EVALUATION)
+            or "평가를 생성할 수 없습니다."
+        )
+
+    async def _generate_topic_feedback_async(self, session: InterviewSession) -> Dict:
+        """주제별 상세 피드백 생성"""
+        prompt = self._build_budgeted_prompt(
+            'topic_feedback',
+            EvaluationPrompts.topic_feedback,
+            history=session.get_current_conversation(),
+            formatted_history=session.get_formatted_conversation(),
+            position=session.position,
+            topic=session.current_topic
+        )
+
+        try:
+            feedback = await self.get_model_response_async(prompt, priority=RequestPriority.TOPIC_FEEDBACK)
+            return self._parse_feedback_response(feedback)
+        except:
+            return self._default_topic_feedback()
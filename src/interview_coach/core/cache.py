@@ -0,0 +1,197 @@
+"""LLM 응답 캐시"""
+
+import atexit
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from ..config.constants import CacheSettings
+
+logger = logging.getLogger(__name__)
+
+class ResponseCache:
+    """대화 이력에 의존하지 않는 프롬프트의 응답 캐시
+
+    키마다 최대 N개의 응답 변형을 모아 두고, 풀이 가득 차면 순환하며 반환합니다.
+    엔트리는 LRU 순서로 관리되며 각 변형은 TTL이 지나면 만료됩니다.
+    저장 경로가 주어지면 디스크에 기록해 재시작 후에도 캐시를 유지합니다.
+    디스크 기록은 변경 후 save_delay초 뒤에 한 번으로 모아서 잠금 밖에서 수행하며,
+    프로세스 종료 시 남은 변경을 기록합니다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = CacheSettings.MAX_ENTRIES,
+        ttl_seconds: float = CacheSettings.TTL_SECONDS,
+        variants_per_key: int = CacheSettings.VARIANTS_PER_KEY,
+        storage_path: Optional[Path] = None,
+        clock: Callable[[], float] = time.time,
+        save_delay: float = CacheSettings.SAVE_DELAY_SECONDS
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.variants_per_key = variants_per_key
+        self.storage_path = Path(storage_path) if storage_path else None
+        self._clock = clock
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.save_delay = save_delay
+        self._save_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+        self._dirty = False
+        self._load()
+        if self.storage_path:
+            atexit.register(self.flush)
+
+    @staticmethod
+    def make_key(*parts: object) -> str:
+        """캐시 키 생성"""
+        return '|'.join(str(part) for part in parts)
+
+    def get(self, key: str) -> Optional[str]:
+        """변형 풀이 가득 찬 경우 순환하여 응답 반환 (채우는 중이면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            self._expire_variants(entry)
+            if not entry['variants']:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            if len(entry['variants']) < self.variants_per_key:
+                return None
+
+            index = entry['cursor'] % len(entry['variants'])
+            entry['cursor'] = index + 1
+            return entry['variants'][index]['text']
+
+    def put(self, key: str, text: str) -> None:
+        """응답 변형 추가"""
+        if not text:
+            return
+
+        with self._lock:
+            entry = self._entries.setdefault(key, {'cursor': 0, 'variants': []})
+            self._expire_variants(entry)
+            variants: List[Dict] = entry['variants']
+            variants.append({'text': text, 'created_at': self._clock()})
+            if len(variants) > self.variants_per_key:
+                del variants[0]
+
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+            self._schedule_save()
+
+    def clear(self) -> None:
+        """캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+            self._schedule_save()
+
+    def flush(self) -> None:
+        """예약된 디스크 기록을 바로 수행"""
+        with self._lock:
+            timer, self._save_timer = self._save_timer, None
+        if timer is not None:
+            timer.cancel()
+        self._save()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _expire_variants(self, entry: Dict) -> None:
+        """TTL이 지난 변형 제거"""
+        deadline = self._clock() - self.ttl_seconds
+        entry['variants'] = [
+            variant for variant in entry['variants']
+            if variant['created_at'] > deadline
+        ]
+
+    def _load(self) -> None:
+        """디스크에서 캐시 로드"""
+        if not self.storage_path or not self.storage_path.exists():
+            return
+        try:
+            with open(self.storage_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            for key, entry in data.get('entries', []):
+                self._expire_variants(entry)
+                if entry['variants']:
+                    self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        except Exception:
+            logger.warning("응답 캐시 파일을 읽지 못해 비운 상태로 시작합니다: %s", self.storage_path, exc_info=True)
+            self._entries.clear()
+
+    def _schedule_save(self) -> None:
+        """save_delay초 뒤 디스크 기록 예약 (이미 예약되어 있으면 합침, 호출자가 _lock 보유)"""
+        if not self.storage_path:
+            return
+        self._dirty = True
+        if self._save_timer is None:
+            self._save_timer = threading.Timer(self.save_delay, self._save_scheduled)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _save_scheduled(self) -> None:
+        with self._lock:
+            self._save_timer = None
+        self._save()
+
+    def _save(self) -> None:
+        """디스크에 캐시 기록 (LRU 순서 유지, 변경이 없으면 생략)"""
+        if not self.storage_path:
+            return
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                # 직렬화/파일 기록은 잠금 밖에서 하도록 현재 상태만 복사
+                entries = [
+                    (key, {'cursor': entry['cursor'], 'variants': list(entry['variants'])})
+                    for key, entry in self._entries.items()
+                ]
+                self._dirty = False
+
+            tmp_name = None
+            try:
+                self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+                # 여러 프로세스가 같은 파일을 저장해도 임시 파일이 겹치지 않도록 고유 이름 사용
+                with tempfile.NamedTemporaryFile(
+                    'w', encoding='utf-8', dir=self.storage_path.parent,
+                    prefix=self.storage_path.name + '.', suffix='.tmp', delete=False
+                ) as f:
+                    tmp_name = f.name
+                    json.dump({'entries': entries}, f, ensure_ascii=False)
+                os.replace(tmp_name, self.storage_path)
+            except Exception:
+                logger.warning("응답 캐시를 디스크에 저장하지 못했습니다: %s", self.storage_path, exc_info=True)
+                if tmp_name is not None:
+                    Path(tmp_name).unlink(missing_ok=True)
+                with self._lock:
+                    # 다음 변경 때 다시 저장
+                    self._dirty = True
+
+_shared_cache: Optional[ResponseCache] = None
+_shared_cache_lock = threading.Lock()
+
+def get_response_cache() -> ResponseCache:
+    """프로세스 공용 응답 캐시 반환"""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            storage_path = CacheSettings.STORAGE_PATH
+            _shared_cache = ResponseCache(storage_path=Path(storage_path) if storage_path else None)
+        return _shared_cache
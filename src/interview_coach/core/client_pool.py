@@ -0,0 +1,110 @@
+"""프로세스 공용 Gemini 클라이언트 풀"""
+
+import asyncio
+import threading
+import weakref
+from typing import Dict, Optional, Tuple
+
+import google.ai.generativelanguage as glm
+import google.generativeai as genai
+import grpc
+from google.api_core import client_options as client_options_lib
+from google.api_core import gapic_v1
+
+from ..config.constants import LLMSettings
+
+class GeminiClientPool:
+    """API 키/모델별 Gemini 클라이언트 공유
+
+    genai.configure는 프로세스 전역 설정을 바꾸므로 세션마다 호출하면 서로 다른 키가
+    덮어써질 수 있고, 세션마다 새 채널을 만들어 연결을 재사용하지 못합니다.
+    이 풀은 키마다 하나의 gRPC 클라이언트(채널)를 만들어 모든 세션이 공유합니다.
+    gRPC 채널과 GenerativeModel은 상태가 없어 여러 스레드에서 동시에 사용해도 안전합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._clients: Dict[str, glm.GenerativeServiceClient] = {}
+        self._models: Dict[Tuple[str, str], genai.GenerativeModel] = {}
+        # 비동기 클라이언트는 생성된 이벤트 루프에 묶이므로 루프별로 보관
+        self._async_models: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @staticmethod
+    def _client_kwargs(api_key: str) -> Dict:
+        """클라이언트 생성 옵션"""
+        return {
+            'client_options': client_options_lib.ClientOptions(api_key=api_key),
+            'client_info': gapic_v1.client_info.ClientInfo(user_agent="ai-interview-coach"),
+        }
+
+    def get_client(self, api_key: str) -> glm.GenerativeServiceClient:
+        """API 키별 공유 동기 클라이언트 반환"""
+        with self._lock:
+            client = self._clients.get(api_key)
+            if client is None:
+                client = glm.GenerativeServiceClient(**self._client_kwargs(api_key))
+                self._clients[api_key] = client
+            return client
+
+    def get_model(self, api_key: str, model_name: str = LLMSettings.MODEL_NAME) -> genai.GenerativeModel:
+        """공유 클라이언트를 사용하는 모델 반환"""
+        key = (api_key, model_name)
+        with self._lock:
+            model = self._models.get(key)
+        if model is not None:
+            return model
+
+        client = self.get_client(api_key)
+        with self._lock:
+            model = self._models.get(key)
+            if model is None:
+                model = genai.GenerativeModel(model_name)
+                model._client = client
+                self._models[key] = model
+            return model
+
+    def get_async_model(self, api_key: str, model_name: str = LLMSettings.MODEL_NAME) -> genai.GenerativeModel:
+        """현재 이벤트 루프에서 공유하는 비동기 모델 반환"""
+        loop = asyncio.get_running_loop()
+        key = (api_key, model_name)
+        with self._lock:
+            models = self._async_models.setdefault(loop, {})
+            model = models.get(key)
+            if model is None:
+                model = genai.GenerativeModel(model_name)
+                model._client = self._clients.get(api_key)
+                model._async_client = glm.GenerativeServiceAsyncClient(**self._client_kwargs(api_key))
+                models[key] = model
+            return model
+
+    def warm_up(self, api_key: str, model_name: str = LLMSettings.MODEL_NAME,
+                timeout: float = LLMSettings.WARM_UP_TIMEOUT) -> bool:
+        """클라이언트를 미리 만들고 채널 연결(TLS 핸드셰이크)까지 수립"""
+        self.get_model(api_key, model_name)
+        try:
+            channel = self.get_client(api_key)._transport.grpc_channel
+            grpc.channel_ready_future(channel).result(timeout=timeout)
+            return True
+        except Exception:
+            # 연결은 첫 호출 시 다시 시도되므로 실패해도 무시
+            return False
+
+    def clear(self) -> None:
+        """풀 비우기"""
+        with self._lock:
+            self._clients.clear()
+            self._models.clear()
+            self._async_models.clear()
+
+_shared_pool: Optional[GeminiClientPool] = None
+_shared_pool_lock = threading.Lock()
+
+def get_client_pool() -> GeminiClientPool:
+    """프로세스 공용 클라이언트 풀 반환"""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = GeminiClientPool()
+        return _shared_pool
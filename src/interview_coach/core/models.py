@@ -1,24 +1,144 @@
 """핵심 데이터 모델 정의"""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Optional
+from enum import Enum
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
-@dataclass
-class Conversation:
-    """대화 내용을 저장하는 모델"""
-    role: str  # 'interviewer' 또는 'candidate'
-    content: str
-    timestamp: datetime = field(default_factory=datetime.now)
-    feedback: Optional[Dict] = None
+class Role(str, Enum):
+    """발화자 (문자열과 그대로 비교 가능, 인스턴스마다 문자열을 따로 두지 않음)"""
+    INTERVIEWER = 'interviewer'
+    CANDIDATE = 'candidate'
+
+    def __str__(self) -> str:
+        return self.value
 
-@dataclass
 class InterviewFeedback:
-    """면접 답변에 대한 피드백 모델"""
-    understanding: str
-    strengths: list[str]
-    improvements: list[str]
-    suggestions: list[str]
+    """면접 답변에 대한 피드백 모델
+
+    항목 목록은 튜플로 보관하며, 기존 dict 피드백과 같은 방식
+    (feedback['strengths'], feedback.get(...))으로도 읽을 수 있습니다.
+    """
+
+    __slots__ = ('understanding', 'strengths', 'improvements', 'suggestions')
+    _KEYS = __slots__
+
+    def __init__(
+        self,
+        understanding: str,
+        strengths: List[str] = (),
+        improvements: List[str] = (),
+        suggestions: List[str] = ()
+    ):
+        self.understanding = understanding
+        self.strengths: Tuple[str, ...] = tuple(strengths)
+        self.improvements: Tuple[str, ...] = tuple(improvements)
+        self.suggestions: Tuple[str, ...] = tuple(suggestions)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'InterviewFeedback':
+        """dict 피드백을 변환"""
+        return cls(
+            understanding=data.get('understanding', ''),
+            strengths=data.get('strengths', ()),
+            improvements=data.get('improvements', ()),
+            suggestions=data.get('suggestions', ())
+        )
+
+    def to_dict(self) -> Dict:
+        """JSON 저장용 dict"""
+        return {
+            'understanding': self.understanding,
+            'strengths': list(self.strengths),
+            'improvements': list(self.improvements),
+            'suggestions': list(self.suggestions),
+        }
+
+    def __getitem__(self, key: str):
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in self._KEYS else default
+
+    def keys(self) -> Tuple[str, ...]:
+        return self._KEYS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._KEYS)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, dict):
+            other = InterviewFeedback.from_dict(other)
+        if not isinstance(other, InterviewFeedback):
+            return NotImplemented
+        return all(getattr(self, key) == getattr(other, key) for key in self._KEYS)
+
+    def __repr__(self) -> str:
+        return f"InterviewFeedback({self.to_dict()!r})"
+
+class Conversation:
+    """대화 내용을 저장하는 모델
+
+    세션마다 수십~수백 개가 메모리에 상주하므로 __slots__를 사용하고,
+    발화자는 Role 열거형, 시각은 epoch 초(int), 피드백은 InterviewFeedback으로
+    보관합니다. role/timestamp/feedback 접근 방식은 이전과 같습니다.
+    """
+
+    __slots__ = ('_role', 'content', 'epoch', '_feedback')
+
+    def __init__(
+        self,
+        role: Union[Role, str],  # 'interviewer' 또는 'candidate'
+        content: str,
+        timestamp: Union[datetime, float, None] = None,
+        feedback: Union['InterviewFeedback', Dict, None] = None
+    ):
+        self.role = role
+        self.content = content
+        if timestamp is None:
+            timestamp = datetime.now()
+        if isinstance(timestamp, datetime):
+            timestamp = timestamp.timestamp()
+        self.epoch = int(timestamp)
+        self.feedback = feedback
+
+    @property
+    def role(self) -> Union[Role, str]:
+        return self._role
+
+    @role.setter
+    def role(self, value: Union[Role, str]) -> None:
+        try:
+            self._role = Role(value)
+        except ValueError:
+            self._role = value
+
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self.epoch)
+
+    @property
+    def feedback(self) -> Optional[InterviewFeedback]:
+        return self._feedback
+
+    @feedback.setter
+    def feedback(self, value: Union[InterviewFeedback, Dict, None]) -> None:
+        if isinstance(value, dict):
+            value = InterviewFeedback.from_dict(value)
+        self._feedback = value
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Conversation):
+            return NotImplemented
+        return (self._role, self.content, self.epoch, self._feedback) == (
+            other._role, other.content, other.epoch, other._feedback
+        )
+
+    def __repr__(self) -> str:
+        return (f"Conversation(role={str(self._role)!r}, content={self.content!r}, "
+                f"timestamp={self.timestamp!r}, feedback={self._feedback!r})")
 
 @dataclass
 class AnswerAnalysis:
@@ -26,4 +146,6 @@ class AnswerAnalysis:
     action: str  # 'FOLLOW_UP', 'HINT', 'CONCLUDE' 중 하나
     completion_score: int  # 1-5 사이의 점수
     next_response: str
-    feedback: Optional[str] = None
\ No newline at end of file
+    feedback: Optional[str] = None
+    topic_feedback: Optional[Dict] = None  # CONCLUDE 시 통합 응답에 포함된 주제 피드백
+    fallback: bool = False  # 응답이 없거나 해석하지 못해 만든 기본 분석 (점수를 기록하지 않음)
@@ -0,0 +1,70 @@
+"""다음 주제 첫 질문 선행 생성"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+
+from ..config.constants import LLMSettings
+
+# 모든 세션이 공유하는 백그라운드 작업 풀
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+def get_background_executor() -> ThreadPoolExecutor:
+    """프로세스 공용 백그라운드 실행기 반환"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=LLMSettings.PREFETCH_WORKERS,
+                thread_name_prefix="interview-prefetch"
+            )
+        return _executor
+
+class TopicPrefetcher:
+    """다음 주제의 첫 질문을 백그라운드에서 미리 생성
+
+    첫 질문 프롬프트는 (포지션, 주제)에만 의존하므로 지원자가 현재 주제에
+    답변하는 동안 미리 요청해 두고, 주제 전환 시 완료된 결과를 사용합니다.
+    """
+
+    def __init__(self, generate: Callable[..., Optional[str]]):
+        self._generate = generate
+        self._futures: Dict[Tuple[str, str], Future] = {}
+        self._lock = threading.Lock()
+
+    def schedule(self, position: str, topic: str, prompt: str, **kwargs) -> None:
+        """첫 질문 생성 예약 (이미 진행 중이면 무시)"""
+        key = (position, topic)
+        with self._lock:
+            if key in self._futures:
+                return
+            self._futures[key] = get_background_executor().submit(self._generate, prompt, **kwargs)
+
+    def is_scheduled(self, position: str, topic: str) -> bool:
+        """예약 여부 확인"""
+        with self._lock:
+            return (position, topic) in self._futures
+
+    def pop(self, position: str, topic: str) -> Optional[Future]:
+        """예약된 작업을 꺼내 반환"""
+        with self._lock:
+            return self._futures.pop((position, topic), None)
+
+    def take(self, position: str, topic: str, timeout: Optional[float] = None) -> Optional[str]:
+        """선행 생성된 질문 반환 (진행 중이면 완료까지 대기, 실패 시 None)"""
+        future = self.pop(position, topic)
+        if future is None:
+            return None
+        try:
+            return future.result(timeout=timeout)
+        except Exception:
+            return None
+
+    def clear(self) -> None:
+        """예약된 작업 모두 취소"""
+        with self._lock:
+            futures = list(self._futures.values())
+            self._futures.clear()
+        for future in futures:
+            future.cancel()
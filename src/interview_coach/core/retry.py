@@ -0,0 +1,201 @@
+"""LLM 호출 재시도 정책 및 서킷 브레이커"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Optional
+
+from google.api_core import exceptions as api_exceptions
+
+from ..config.constants import RetrySettings
+
+class ErrorKind(Enum):
+    """LLM 호출 오류 분류"""
+    RATE_LIMIT = 'rate_limit'  # 할당량 초과 (429)
+    TRANSIENT = 'transient'  # 일시적 장애 (타임아웃, 5xx)
+    PERMANENT = 'permanent'  # 재시도해도 실패하는 오류 (잘못된 요청, 인증)
+
+_RATE_LIMIT_ERRORS = (
+    api_exceptions.ResourceExhausted,
+    api_exceptions.TooManyRequests,
+)
+
+_TRANSIENT_ERRORS = (
+    api_exceptions.DeadlineExceeded,
+    api_exceptions.ServiceUnavailable,
+    api_exceptions.InternalServerError,
+    api_exceptions.BadGateway,
+    api_exceptions.GatewayTimeout,
+    api_exceptions.Aborted,
+    api_exceptions.Unknown,
+    TimeoutError,
+    ConnectionError,
+)
+
+_PERMANENT_ERRORS = (
+    api_exceptions.InvalidArgument,
+    api_exceptions.BadRequest,
+    api_exceptions.PermissionDenied,
+    api_exceptions.Unauthenticated,
+    api_exceptions.Unauthorized,
+    api_exceptions.Forbidden,
+    api_exceptions.NotFound,
+    api_exceptions.FailedPrecondition,
+    api_exceptions.MethodNotImplemented,
+)
+
+def classify_error(error: BaseException) -> ErrorKind:
+    """오류 종류 판별 (알 수 없는 오류는 일시적 장애로 간주)"""
+    if isinstance(error, _RATE_LIMIT_ERRORS):
+        return ErrorKind.RATE_LIMIT
+    if isinstance(error, _PERMANENT_ERRORS):
+        return ErrorKind.PERMANENT
+    if isinstance(error, _TRANSIENT_ERRORS):
+        return ErrorKind.TRANSIENT
+    return ErrorKind.TRANSIENT
+
+def retry_after_hint(error: BaseException) -> Optional[float]:
+    """오류에 포함된 재시도 대기 시간(초) 추출"""
+    hint = getattr(error, 'retry_after', None)
+    if isinstance(hint, (int, float)):
+        return float(hint)
+
+    # gRPC RetryInfo 상세 정보
+    for detail in getattr(error, 'details', None) or ():
+        retry_delay = getattr(detail, 'retry_delay', None)
+        if retry_delay is not None:
+            return retry_delay.seconds + retry_delay.nanos / 1e9
+
+    # HTTP Retry-After 헤더
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None) or {}
+    try:
+        value = headers.get('Retry-After') or headers.get('retry-after')
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+@dataclass
+class RetryPolicy:
+    """지수 백오프 + 지터 재시도 정책"""
+    base_delay: float = RetrySettings.BASE_DELAY
+    max_delay: float = RetrySettings.MAX_DELAY
+    rate_limit_multiplier: float = RetrySettings.RATE_LIMIT_MULTIPLIER
+
+    def should_retry(self, kind: ErrorKind) -> bool:
+        """재시도 여부 판단"""
+        return kind is not ErrorKind.PERMANENT
+
+    def compute_delay(self, attempt: int, error: BaseException) -> float:
+        """다음 재시도까지 대기 시간(초) 계산 (attempt는 0부터 시작)"""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        if classify_error(error) is ErrorKind.RATE_LIMIT:
+            ceiling = min(self.max_delay, ceiling * self.rate_limit_multiplier)
+
+        # Full jitter: 동시에 실패한 요청들이 같은 시점에 몰리지 않도록 분산
+        delay = random.uniform(0, ceiling)
+
+        hint = retry_after_hint(error)
+        if hint is not None:
+            delay = max(delay, min(hint, self.max_delay))
+        return delay
+
+# closed 상태에서 허용된 호출의 토큰 (시험 호출이 아님)
+_PASS = object()
+
+class CircuitBreaker:
+    """연속 실패 시 호출을 차단하는 서킷 브레이커
+
+    closed: 정상 호출
+    open: 일정 시간 동안 호출 차단 (호출부는 즉시 폴백 응답 사용)
+    half_open: 대기 시간이 지나면 한 번의 시험 호출 허용
+
+    allow_request()는 허용 시 토큰을 반환하며, half_open의 시험 호출 토큰만
+    release_trial(token)로 시험 호출을 정리할 수 있습니다.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(
+        self,
+        failure_threshold: int = RetrySettings.BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = RetrySettings.BREAKER_RESET_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial: Optional[object] = None  # 진행 중인 시험 호출 토큰
+
+    @property
+    def state(self) -> str:
+        """현재 상태"""
+        with self._lock:
+            if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow_request(self) -> Optional[object]:
+        """호출 허용 여부 (허용하면 토큰, 차단하면 None)"""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return _PASS
+            if self._state == self.OPEN:
+                if self._clock() - self._opened_at < self.reset_timeout:
+                    return None
+                self._state = self.HALF_OPEN
+                self._trial = None
+            # half_open: 시험 호출은 한 번만 허용
+            if self._trial is not None:
+                return None
+            self._trial = object()
+            return self._trial
+
+    def record_success(self) -> None:
+        """호출 성공 기록"""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial = None
+
+    def record_failure(self) -> None:
+        """호출 실패 기록"""
+        with self._lock:
+            self._failures += 1
+            self._trial = None
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+
+    def release_trial(self, token: Optional[object]) -> None:
+        """결과 없이 끝난 시험 호출 정리 (대기 시간 초과, 스트림 조기 종료 등)
+
+        token이 진행 중인 시험 호출의 토큰일 때만 정리하므로, 다른 호출이나 이미
+        성공/실패를 기록한 호출이 넘긴 토큰은 무시됩니다.
+        """
+        with self._lock:
+            if token is not None and token is self._trial:
+                self._trial = None
+
+    def reset(self) -> None:
+        """상태 초기화"""
+        self.record_success()
+
+_shared_breaker: Optional[CircuitBreaker] = None
+_shared_breaker_lock = threading.Lock()
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """프로세스 공용 서킷 브레이커 반환"""
+    global _shared_breaker
+    with _shared_breaker_lock:
+        if _shared_breaker is None:
+            _shared_breaker = CircuitBreaker()
+        return _shared_breaker
@@ -0,0 +1,176 @@
+"""프로세스 공용 LLM 요청 스케줄러"""
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from enum import IntEnum
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..config.constants import SchedulerSettings
+
+class RequestPriority(IntEnum):
+    """요청 우선순위 (값이 작을수록 먼저 처리)"""
+    ANSWER_ANALYSIS = 0  # 지원자가 기다리는 답변 분석
+    QUESTION_GENERATION = 1  # 첫 질문/새 질문 생성
+    TOPIC_FEEDBACK = 2  # 주제별 피드백, 요약
+    FINAL_EVALUATION = 3  # 최종 평가
+
+class RequestScheduler:
+    """토큰 버킷 속도 제한 + 우선순위 대기열
+
+    모든 세션의 Gemini 호출은 acquire()로 토큰을 받은 뒤 실행됩니다.
+    토큰이 부족하면 우선순위가 높은 요청부터, 같은 우선순위는 도착 순서대로 처리합니다.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float = SchedulerSettings.RATE_PER_SECOND,
+        burst: int = SchedulerSettings.BURST,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._last_refill = clock()
+        self._condition = threading.Condition()
+        self._queue: List[Tuple[int, int]] = []
+        self._sequence = itertools.count()
+        self._stats: Dict[RequestPriority, Dict[str, float]] = {
+            priority: {'requests': 0, 'timeouts': 0, 'total_wait': 0.0, 'max_wait': 0.0}
+            for priority in RequestPriority
+        }
+
+    def acquire(self, priority: RequestPriority = RequestPriority.QUESTION_GENERATION,
+                timeout: Optional[float] = None) -> float:
+        """호출 토큰 획득까지 대기하고 대기 시간(초)을 반환
+
+        timeout 안에 토큰을 받지 못하면 TimeoutError를 발생시킵니다.
+        """
+        priority = RequestPriority(priority)
+        started = self._clock()
+        ticket = (int(priority), next(self._sequence))
+
+        with self._condition:
+            heapq.heappush(self._queue, ticket)
+            try:
+                while True:
+                    waited, wait = self._poll(ticket, priority, started, timeout)
+                    if waited is not None:
+                        return waited
+                    self._condition.wait(wait)
+            except BaseException:
+                self._abandon(ticket, priority)
+                raise
+
+    async def acquire_async(self, priority: RequestPriority = RequestPriority.QUESTION_GENERATION,
+                            timeout: Optional[float] = None) -> float:
+        """acquire()의 비동기 버전 (스레드를 점유하지 않고 asyncio.sleep으로 대기)
+
+        토큰 버킷 보충 시간과 앞선 대기 요청 수로 대기 시간을 계산해 잠들고, 깨어나면
+        다시 확인합니다. 동기 호출과 같은 대기열/우선순위를 공유합니다.
+        """
+        priority = RequestPriority(priority)
+        started = self._clock()
+        ticket = (int(priority), next(self._sequence))
+
+        with self._condition:
+            heapq.heappush(self._queue, ticket)
+        try:
+            while True:
+                with self._condition:
+                    waited, wait = self._poll(ticket, priority, started, timeout)
+                if waited is not None:
+                    return waited
+                await asyncio.sleep(wait)
+        except BaseException:
+            with self._condition:
+                self._abandon(ticket, priority)
+            raise
+
+    def _poll(self, ticket: Tuple[int, int], priority: RequestPriority, started: float,
+              timeout: Optional[float]) -> Tuple[Optional[float], Optional[float]]:
+        """차례가 되어 토큰을 받았으면 (대기 시간, None), 아니면 (None, 다음 확인까지 대기 시간)
+
+        _condition을 잡은 상태에서 호출해야 합니다.
+        """
+        self._refill()
+        if self._queue[0] == ticket and self._tokens >= 1:
+            heapq.heappop(self._queue)
+            self._tokens -= 1
+            waited = self._clock() - started
+            self._record(priority, waited)
+            self._condition.notify_all()
+            return waited, None
+
+        # 앞선 요청이 모두 토큰을 받고 내 차례의 토큰이 보충될 때까지의 예상 시간
+        ahead = sum(1 for queued in self._queue if queued < ticket)
+        wait = max(ahead + 1 - self._tokens, 0) / self.rate_per_second
+        if self._queue[0] != ticket:
+            # 동기 대기자는 알림으로 깨지만 비동기 대기자는 스스로 다시 확인해야 하므로 하한을 둠
+            wait = max(wait, SchedulerSettings.MIN_POLL_SECONDS)
+        if timeout is not None:
+            remaining = timeout - (self._clock() - started)
+            if remaining <= 0:
+                raise TimeoutError("LLM 요청 대기 시간이 초과되었습니다.")
+            wait = min(wait, remaining)
+        return None, wait
+
+    def _abandon(self, ticket: Tuple[int, int], priority: RequestPriority) -> None:
+        """시간 초과/취소된 요청을 대기열에서 제거 (_condition을 잡은 상태에서 호출)"""
+        if ticket in self._queue:
+            self._queue.remove(ticket)
+            heapq.heapify(self._queue)
+            self._stats[priority]['timeouts'] += 1
+            self._condition.notify_all()
+
+    def metrics(self) -> Dict:
+        """대기열 길이 및 우선순위별 대기 시간 지표"""
+        with self._condition:
+            self._refill()
+            depth = {priority.name: 0 for priority in RequestPriority}
+            for priority_value, _ in self._queue:
+                depth[RequestPriority(priority_value).name] += 1
+
+            return {
+                'queue_depth': len(self._queue),
+                'queue_depth_by_priority': depth,
+                'available_tokens': round(self._tokens, 2),
+                'wait_time': {
+                    priority.name: {
+                        'requests': int(stats['requests']),
+                        'timeouts': int(stats['timeouts']),
+                        'avg_wait': round(stats['total_wait'] / stats['requests'], 4) if stats['requests'] else 0.0,
+                        'max_wait': round(stats['max_wait'], 4)
+                    }
+                    for priority, stats in self._stats.items()
+                }
+            }
+
+    def _refill(self) -> None:
+        """경과 시간만큼 토큰 보충"""
+        now = self._clock()
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate_per_second)
+            self._last_refill = now
+
+    def _record(self, priority: RequestPriority, waited: float) -> None:
+        """대기 시간 기록"""
+        stats = self._stats[priority]
+        stats['requests'] += 1
+        stats['total_wait'] += waited
+        stats['max_wait'] = max(stats['max_wait'], waited)
+
+_shared_scheduler: Optional[RequestScheduler] = None
+_shared_scheduler_lock = threading.Lock()
+
+def get_request_scheduler() -> RequestScheduler:
+    """프로세스 공용 요청 스케줄러 반환"""
+    global _shared_scheduler
+    with _shared_scheduler_lock:
+        if _shared_scheduler is None:
+            _shared_scheduler = RequestScheduler()
+        return _shared_scheduler
@@ -1,11 +1,22 @@
 """면접 세션 관리"""
 
+import time
+from concurrent.futures import Future
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple, Optional
+from typing import Any, Callable, Dict, List, Tuple, Optional
 
 from .models import Conversation
 from ..config.constants import POSITION_TOPICS
 
+def feedback_dict(message: Conversation) -> Optional[Dict]:
+    """메시지 피드백의 JSON 저장용 dict (없으면 None)"""
+    return message.feedback.to_dict() if message.feedback is not None else None
+
+def format_transcript_line(message: Conversation) -> str:
+    """대화 한 줄을 프롬프트용 문자열로 포맷팅"""
+    role = "면접관" if message.role == "interviewer" else "지원자"
+    return f"{role}: {message.content}"
+
 @dataclass
 class InterviewSession:
     """면접 세션 상태 관리"""
@@ -17,6 +28,57 @@ class InterviewSession:
     waiting_for_next: bool = False
     interview_complete: bool = False
     final_feedback: Optional[str] = None
+    topic_summaries: Dict[str, str] = field(default_factory=dict)  # 완료된 주제별 요약 (최종 평가 입력)
+    scores: Dict[str, List[int]] = field(default_factory=dict)  # 주제별 답변 점수 (답변 순서대로, 1-5)
+    score_ranking: Optional[Dict[str, Dict]] = None  # 통계에 넣기 전에 계산한 점수 순위 (재실행마다 같은 결과)
+    
+    # 백그라운드에서 생성 중인 주제 요약
+    _summary_futures: Dict[str, Future] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # 포맷팅된 주제별 대화록 캐시 (주제 -> (반영한 메시지 수, 대화록), 새 메시지만 이어 붙임)
+    _transcript_text: Dict[str, Tuple[int, str]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _all_cache: Optional[Tuple[tuple, List[Conversation], Optional[str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # 변경 내역 기록기 (SessionStore.attach로 연결, 없으면 메모리에만 보관)
+    _journal: Optional[Any] = field(default=None, init=False, repr=False, compare=False)
+    # 변경 횟수 (revision 속성으로 조회)
+    _revision: int = field(default=0, init=False, repr=False, compare=False)
+    # 형식별 내보내기 결과 캐시 (형식 -> (revision, 데이터))
+    _export_cache: Dict[str, Tuple[int, bytes]] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    # 직접 대입되는 필드 중 저널에 기록할 필드
+    _JOURNALED_FIELDS = frozenset({
+        'position', 'current_topic', 'waiting_for_next', 'interview_complete', 'final_feedback',
+        'score_ranking'
+    })
+
+    def __setattr__(self, name: str, value) -> None:
+        super().__setattr__(name, value)
+        if name in self._JOURNALED_FIELDS:
+            self._record('set', {'k': name, 'v': value})
+
+    @property
+    def revision(self) -> int:
+        """세션 변경 횟수 (변경될 때마다 증가, 내보내기 캐시 키)"""
+        return self._revision
+
+    def cached_export(self, fmt: str, build: Callable[['InterviewSession'], bytes]) -> bytes:
+        """형식별 내보내기 결과 (세션이 바뀌지 않았으면 이전 결과 재사용, 아니면 build로 생성)"""
+        cached = self._export_cache.get(fmt)
+        if cached is not None and cached[0] == self._revision:
+            return cached[1]
+        revision = self._revision
+        data = build(self)
+        self._export_cache[fmt] = (revision, data)
+        return data
+
+    def _record(self, op: str, payload: Dict) -> None:
+        """변경 횟수를 올리고 변경 내역을 저널에 기록"""
+        # __init__에서 필드 대입 시에도 호출되므로 아직 없는 속성은 기본값으로 처리
+        self.__dict__['_revision'] = self.__dict__.get('_revision', 0) + 1
+        journal = self.__dict__.get('_journal')
+        if journal is not None:
+            journal.append(op, payload)
 
     def add_message(self, role: str, content: str, feedback: Optional[Dict] = None) -> None:
         """대화 내용을 현재 주제에 저장"""
@@ -25,23 +87,111 @@ class InterviewSession:
             
         new_message = Conversation(role=role, content=content, feedback=feedback)
         self.conversations[self.current_topic].append(new_message)
+        self._record('msg', {
+            't': self.current_topic, 'r': role, 'c': content,
+            'ts': new_message.epoch, 'f': feedback_dict(new_message)
+        })
 
     def get_current_conversation(self) -> List[Conversation]:
         """현재 주제의 대화 내용 반환"""
         return self.conversations.get(self.current_topic, [])
 
+    def reset_current_conversation(self) -> None:
+        """현재 주제의 대화 내용 비우기 (새 질문으로 다시 시작)"""
+        self.conversations[self.current_topic] = []
+        self.scores.pop(self.current_topic, None)
+        self._invalidate_transcript(self.current_topic)
+        self._record('retry', {'t': self.current_topic})
+
+    def record_score(self, score: int) -> None:
+        """현재 주제의 답변 점수 기록"""
+        self.scores.setdefault(self.current_topic, []).append(score)
+        self._record('score', {'t': self.current_topic, 's': score})
+
+    def get_average_score(self) -> Optional[float]:
+        """전체 답변 평균 점수 (기록된 점수가 없으면 None)"""
+        all_scores = [score for topic_scores in self.scores.values() for score in topic_scores]
+        return sum(all_scores) / len(all_scores) if all_scores else None
+
     def clear_current_conversation(self) -> None:
         """주제 완료 처리"""
         if self.current_topic:
             self.completed_topics.append(self.current_topic)
+            self._record('done', {'t': self.current_topic})
         self.current_topic = None
 
     def get_all_conversations(self) -> List[Conversation]:
-        """모든 대화 내용을 하나의 리스트로 반환"""
-        all_conversations = []
-        for topic in self.completed_topics:
-            all_conversations.extend(self.conversations.get(topic, []))
-        return all_conversations
+        """완료된 주제의 모든 대화 내용을 하나의 리스트로 반환 (읽기 전용)"""
+        return self._get_all_cache()[1]
+
+    def get_formatted_conversation(self, topic: Optional[str] = None) -> str:
+        """주제(기본값: 현재 주제)의 대화록을 "면접관:/지원자:" 형식으로 반환"""
+        topic = self.current_topic if topic is None else topic
+        return self._sync_transcript(topic)
+
+    def get_formatted_all_conversations(self) -> str:
+        """완료된 모든 주제의 대화록 반환"""
+        key, messages, text = self._get_all_cache()
+        if text is None:
+            text = "\n".join(
+                self.get_formatted_conversation(topic)
+                for topic in self.completed_topics
+                if self.conversations.get(topic)
+            )
+            self._all_cache = (key, messages, text)
+        return text
+
+    def _sync_transcript(self, topic: Optional[str]) -> str:
+        """주제 대화록 캐시를 대화 내용과 동기화 (새 메시지만 포맷팅해 이어 붙임)"""
+        messages = self.conversations.get(topic, [])
+        count, text = self._transcript_text.get(topic, (0, ""))
+        
+        if count != len(messages):
+            # 대화가 줄어든 경우에만 다시 생성 (목록 교체는 _invalidate_transcript가 처리)
+            if count > len(messages):
+                count, text = 0, ""
+            new_lines = "\n".join(format_transcript_line(message) for message in messages[count:])
+            text = f"{text}\n{new_lines}" if count and new_lines else (text or new_lines)
+            self._transcript_text[topic] = (len(messages), text)
+        return text
+
+    def _invalidate_transcript(self, topic: Optional[str]) -> None:
+        """주제 대화 목록을 교체했을 때 해당 주제와 전체 대화 캐시 비우기"""
+        self._transcript_text.pop(topic, None)
+        self._all_cache = None
+
+    def _get_all_cache(self) -> Tuple[tuple, List[Conversation], Optional[str]]:
+        """완료된 주제 전체 대화 캐시 (변경이 있을 때만 다시 생성)"""
+        key = tuple(
+            (topic, len(self.conversations.get(topic, [])))
+            for topic in self.completed_topics
+        )
+        if self._all_cache is None or self._all_cache[0] != key:
+            all_conversations = []
+            for topic in self.completed_topics:
+                all_conversations.extend(self.conversations.get(topic, []))
+            self._all_cache = (key, all_conversations, None)
+        return self._all_cache
+
+    def set_summary_future(self, topic: str, future: Future) -> None:
+        """주제 요약 작업 등록"""
+        self._summary_futures[topic] = future
+
+    def collect_topic_summaries(self, timeout: Optional[float] = None) -> Dict[str, str]:
+        """진행 중인 주제 요약을 기다려 반영한 뒤 요약 반환 (timeout은 전체 대기 시간)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for topic, future in list(self._summary_futures.items()):
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                summary = future.result(timeout=remaining)
+            except Exception:
+                summary = None
+            if summary and self.topic_summaries.get(topic) != summary:
+                self.topic_summaries[topic] = summary
+                self._record('summary', {'t': topic, 's': summary})
+            if future.done():
+                del self._summary_futures[topic]
+        return self.topic_summaries
 
     def get_remaining_topics(self) -> List[str]:
         """남은 주제 목록 반환"""
@@ -52,6 +202,73 @@ class InterviewSession:
             if topic not in self.completed_topics
         ]
 
+    def to_state(self) -> Dict[str, Any]:
+        """저장용 상태 (진행 중인 백그라운드 작업과 캐시는 제외)"""
+        return {
+            'position': self.position,
+            'current_topic': self.current_topic,
+            'conversations': {
+                topic: [
+                    {'r': msg.role, 'c': msg.content, 'ts': msg.epoch, 'f': feedback_dict(msg)}
+                    for msg in messages
+                ]
+                for topic, messages in self.conversations.items()
+            },
+            'completed_topics': list(self.completed_topics),
+            'waiting_for_next': self.waiting_for_next,
+            'interview_complete': self.interview_complete,
+            'final_feedback': self.final_feedback,
+            'topic_summaries': dict(self.topic_summaries),
+            'scores': {topic: list(values) for topic, values in self.scores.items()},
+            'score_ranking': self.score_ranking,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'InterviewSession':
+        """저장된 상태에서 복원"""
+        session = cls(
+            position=state.get('position'),
+            current_topic=state.get('current_topic'),
+            completed_topics=list(state.get('completed_topics', [])),
+            waiting_for_next=state.get('waiting_for_next', False),
+            interview_complete=state.get('interview_complete', False),
+            final_feedback=state.get('final_feedback'),
+            topic_summaries=dict(state.get('topic_summaries', {})),
+            scores={topic: list(values) for topic, values in state.get('scores', {}).items()},
+            score_ranking=state.get('score_ranking'),
+        )
+        for topic, messages in state.get('conversations', {}).items():
+            session.conversations[topic] = [
+                Conversation(role=msg['r'], content=msg['c'], timestamp=msg['ts'], feedback=msg.get('f'))
+                for msg in messages
+            ]
+        return session
+
+    def apply_journal_entry(self, op: str, payload: Dict[str, Any]) -> None:
+        """저널 항목 1건을 다시 적용 (복원 시 사용, 저널에는 다시 기록하지 않음)"""
+        journal, self._journal = self._journal, None
+        try:
+            if op == 'set':
+                setattr(self, payload['k'], payload['v'])
+            elif op == 'msg':
+                self.conversations.setdefault(payload['t'], []).append(Conversation(
+                    role=payload['r'], content=payload['c'], timestamp=payload['ts'], feedback=payload.get('f')
+                ))
+            elif op == 'retry':
+                self.conversations[payload['t']] = []
+                self.scores.pop(payload['t'], None)
+                self._invalidate_transcript(payload['t'])
+            elif op == 'score':
+                self.scores.setdefault(payload['t'], []).append(payload['s'])
+            elif op == 'done':
+                self.completed_topics.append(payload['t'])
+            elif op == 'summary':
+                self.topic_summaries[payload['t']] = payload['s']
+            elif op == 'reset':
+                self.reset()
+        finally:
+            self._journal = journal
+
     def reset(self) -> None:
         """세션 초기화"""
         self.position = None
@@ -60,4 +277,13 @@ class InterviewSession:
         self.completed_topics.clear()
         self.waiting_for_next = False
         self.interview_complete = False
-        self.final_feedback = None
\ No newline at end of file
+        self.final_feedback = None
+        self.topic_summaries.clear()
+        self.scores.clear()
+        self.score_ranking = None
+        for future in self._summary_futures.values():
+            future.cancel()
+        self._summary_futures.clear()
+        self._transcript_text.clear()
+        self._all_cache = None
+        self._record('reset', {})
\ No newline at end of file
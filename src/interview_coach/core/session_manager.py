@@ -0,0 +1,179 @@
+"""활성 면접 세션 LRU 관리 (유휴 세션은 디스크로 내보냄)"""
+
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from .session import InterviewSession
+from .session_store import SessionStore, get_session_store
+from ..config.constants import SessionSettings
+
+MESSAGE_OVERHEAD = 200  # 메시지 1개의 객체/리스트 슬롯 등 내용 외 대략적인 크기(바이트)
+
+def estimate_session_bytes(session: InterviewSession) -> int:
+    """세션이 차지하는 대략적인 메모리 (대화/피드백/요약 문자열 기준)"""
+    total = sys.getsizeof(session.final_feedback or "")
+    for summary in session.topic_summaries.values():
+        total += sys.getsizeof(summary)
+    for messages in session.conversations.values():
+        for msg in messages:
+            total += MESSAGE_OVERHEAD + sys.getsizeof(msg.content)
+            if msg.feedback is not None:
+                total += sys.getsizeof(msg.feedback.understanding)
+                total += sum(
+                    sys.getsizeof(item)
+                    for items in (msg.feedback.strengths, msg.feedback.improvements, msg.feedback.suggestions)
+                    for item in items
+                )
+    return total
+
+class SessionManager:
+    """최근 사용한 세션만 메모리에 두는 LRU
+
+    모든 변경은 SessionStore 저널에 이미 기록되므로, 내보낼 때는 스냅샷만
+    저장하고 참조를 놓습니다. 다음 접근 시 저장소에서 다시 읽어옵니다(재수화).
+    내보낸 세션을 아직 다른 곳(진행 중인 스크립트 실행)에서 참조하고 있으면
+    같은 객체를 되살려 같은 세션이 두 객체로 갈라지지 않게 합니다.
+
+    다음 중 하나라도 넘으면 가장 오래 쓰지 않은 세션부터 내보냅니다.
+    - 활성 세션 수 max_sessions
+    - 추정 메모리 합계 memory_ceiling 바이트
+    - 마지막 접근 후 idle_seconds 경과
+    """
+
+    def __init__(
+        self,
+        store: Optional[SessionStore] = None,
+        max_sessions: int = SessionSettings.MAX_ACTIVE_SESSIONS,
+        memory_ceiling: int = SessionSettings.MEMORY_CEILING_MB * 1024 * 1024,
+        idle_seconds: float = SessionSettings.IDLE_SECONDS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.store = store or get_session_store()
+        self.max_sessions = max_sessions
+        self.memory_ceiling = memory_ceiling
+        self.idle_seconds = idle_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        # 토큰 -> (세션, 마지막 접근 시각, 추정 크기), 오래된 순
+        self._active: "OrderedDict[str, Tuple[InterviewSession, float, int]]" = OrderedDict()
+        self._resident_bytes = 0
+        self._evicted: "weakref.WeakValueDictionary[str, InterviewSession]" = weakref.WeakValueDictionary()
+        self._stats = {"hits": 0, "misses": 0, "rehydrations": 0, "revivals": 0, "evictions": 0}
+
+    def create(self) -> Tuple[str, InterviewSession]:
+        """새 세션을 만들어 저장소에 연결하고 (토큰, 세션) 반환"""
+        session = InterviewSession()
+        token = self.store.attach(session)
+        self._activate(token, session)
+        return token, session
+
+    def get(self, token: str) -> Optional[InterviewSession]:
+        """토큰의 세션 반환 (메모리에 없으면 저장소에서 복원, 없는 토큰이면 None)"""
+        with self._lock:
+            entry = self._active.get(token)
+            if entry is not None:
+                self._stats["hits"] += 1
+                session = entry[0]
+            else:
+                self._stats["misses"] += 1
+                session = self._evicted.pop(token, None)
+                if session is not None:
+                    self._stats["revivals"] += 1
+
+        if session is None:
+            session = self.store.load(token)
+            if session is None:
+                return None
+            with self._lock:
+                self._stats["rehydrations"] += 1
+        self._activate(token, session)
+        return session
+
+    def evict(self, token: str) -> bool:
+        """세션을 디스크로 내보내기 (메모리에 없었으면 False)"""
+        with self._lock:
+            entry = self._active.pop(token, None)
+            if entry is None:
+                return False
+            self._resident_bytes -= entry[2]
+        self._spill(token, entry[0])
+        return True
+
+    def evict_idle(self) -> int:
+        """idle_seconds 동안 접근하지 않은 세션을 내보내고 개수 반환"""
+        return self._enforce()
+
+    def metrics(self) -> Dict:
+        """활성 세션 수, 추정 메모리, 적중/재수화/내보내기 횟수"""
+        with self._lock:
+            return {
+                "active_sessions": len(self._active),
+                "resident_bytes": self._resident_bytes,
+                "memory_ceiling": self.memory_ceiling,
+                **self._stats,
+            }
+
+    def _activate(self, token: str, session: InterviewSession) -> None:
+        """세션을 최근 사용으로 표시하고 크기 갱신 후 한도 적용"""
+        size = estimate_session_bytes(session)
+        with self._lock:
+            previous = self._active.pop(token, None)
+            if previous is not None:
+                self._resident_bytes -= previous[2]
+            self._active[token] = (session, self._clock(), size)
+            self._resident_bytes += size
+        self._enforce(keep=token)
+
+    def _enforce(self, keep: Optional[str] = None) -> int:
+        """한도를 넘거나 유휴 상태인 세션을 오래된 순으로 내보내기 (keep은 제외)"""
+        victims = []
+        with self._lock:
+            now = self._clock()
+            for token in list(self._active):
+                session, last_access, size = self._active[token]
+                over_limit = (
+                    len(self._active) > self.max_sessions
+                    or self._resident_bytes > self.memory_ceiling
+                )
+                idle = now - last_access >= self.idle_seconds
+                if not (over_limit or idle):
+                    # 이후 세션은 더 최근에 접근했으므로 유휴 상태도 아님
+                    break
+                if token == keep:
+                    continue
+                del self._active[token]
+                self._resident_bytes -= size
+                victims.append((token, session))
+
+        for token, session in victims:
+            self._spill(token, session)
+        return len(victims)
+
+    def _spill(self, token: str, session: InterviewSession) -> None:
+        """스냅샷을 저장해 다음 복원이 저널 재적용 없이 끝나도록 한 뒤 참조 해제
+
+        진행 중인 백그라운드 요약은 저장되지 않으며, 세션 객체가 해제된 뒤
+        복원하면 해당 주제는 원문 대화록으로 최종 평가합니다.
+        """
+        journal = session._journal
+        if journal is not None and journal.seq > journal.snapshot_seq:
+            self.store.snapshot(token, session, journal.seq)
+            journal.snapshot_seq = journal.seq
+        with self._lock:
+            self._evicted[token] = session
+            self._stats["evictions"] += 1
+
+_shared_manager: Optional[SessionManager] = None
+_shared_manager_lock = threading.Lock()
+
+def get_session_manager() -> SessionManager:
+    """프로세스 공용 세션 관리자 반환"""
+    global _shared_manager
+    with _shared_manager_lock:
+        if _shared_manager is None:
+            _shared_manager = SessionManager()
+        return _shared_manager
@@ -0,0 +1,207 @@
+"""면접 세션 저널 저장소 (재시작/새로고침 후 이어서 진행)"""
+
+import json
+import secrets
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .session import InterviewSession
+from ..config.constants import SessionSettings
+from ..utils.sqlite_util import ThreadLocalConnection
+
+class SessionJournal:
+    """세션 하나의 변경 내역 기록기 (InterviewSession._journal에 연결)"""
+
+    def __init__(self, store: 'SessionStore', token: str, session: InterviewSession, seq: int, snapshot_seq: int):
+        self.store = store
+        self.token = token
+        self.session = session
+        self.seq = seq
+        self.snapshot_seq = snapshot_seq
+
+    def append(self, op: str, payload: Dict) -> None:
+        """변경 1건 기록 (SNAPSHOT_EVERY건마다 스냅샷으로 압축)"""
+        self.seq += 1
+        self.store.append(self.token, self.seq, op, payload)
+        if self.seq - self.snapshot_seq >= self.store.snapshot_every:
+            self.store.snapshot(self.token, self.session, self.seq)
+            self.snapshot_seq = self.seq
+
+class SessionStore:
+    """SQLite(WAL) 세션 저널
+
+    세션 변경(메시지 추가, 주제 완료/재시작, 점수, 필드 대입)마다 짧은 JSON
+    항목 1건을 덧붙이고, 일정 개수마다 전체 상태 스냅샷을 저장한 뒤 그 이전
+    항목을 지웁니다. 복원은 스냅샷 + 이후 항목 재적용으로 수행합니다.
+    진행 중이던 백그라운드 주제 요약은 저장하지 않으며, 최종 평가는 요약이
+    없는 주제의 원문 대화록을 사용합니다.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS sessions (
+            token TEXT PRIMARY KEY,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL,
+            snapshot TEXT,
+            snapshot_seq INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE TABLE IF NOT EXISTS journal (
+            token TEXT NOT NULL,
+            seq INTEGER NOT NULL,
+            op TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            PRIMARY KEY (token, seq)
+        );
+    """
+
+    def __init__(
+        self,
+        db_path: str = SessionSettings.STORE_PATH,
+        snapshot_every: int = SessionSettings.SNAPSHOT_EVERY,
+        timeout: float = SessionSettings.SQLITE_TIMEOUT
+    ):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.snapshot_every = snapshot_every
+        self.timeout = timeout
+        self._connections = ThreadLocalConnection(self.db_path, timeout)
+        with self._connect() as conn:
+            conn.executescript(self._SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """현재 스레드의 연결 반환"""
+        return self._connections.get()
+
+    def attach(self, session: InterviewSession, token: Optional[str] = None) -> str:
+        """세션을 저장소에 연결하고 토큰 반환 (현재 상태를 첫 스냅샷으로 저장)"""
+        token = token or secrets.token_urlsafe(16)
+        now = time.time()
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM journal WHERE token = ?", (token,))
+            conn.execute(
+                "INSERT OR REPLACE INTO sessions (token, created_at, updated_at, snapshot, snapshot_seq) "
+                "VALUES (?, ?, ?, ?, 0)",
+                (token, now, now, self._dumps(session.to_state()))
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        session._journal = SessionJournal(self, token, session, seq=0, snapshot_seq=0)
+        return token
+
+    def append(self, token: str, seq: int, op: str, payload: Dict) -> None:
+        """저널 항목 1건 추가"""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO journal (token, seq, op, payload) VALUES (?, ?, ?, ?)",
+                (token, seq, op, self._dumps(payload))
+            )
+            conn.execute("UPDATE sessions SET updated_at = ? WHERE token = ?", (time.time(), token))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def snapshot(self, token: str, session: InterviewSession, seq: int) -> None:
+        """현재 상태를 스냅샷으로 저장하고 seq 이전 저널 삭제"""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "UPDATE sessions SET snapshot = ?, snapshot_seq = ?, updated_at = ? WHERE token = ?",
+                (self._dumps(session.to_state()), seq, time.time(), token)
+            )
+            conn.execute("DELETE FROM journal WHERE token = ? AND seq <= ?", (token, seq))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def load(self, token: str) -> Optional[InterviewSession]:
+        """토큰의 세션 복원 후 저장소에 다시 연결 (없으면 None)"""
+        conn = self._connect()
+        # 스냅샷과 저널을 같은 시점에서 읽음
+        conn.execute("BEGIN")
+        try:
+            row = conn.execute(
+                "SELECT snapshot, snapshot_seq FROM sessions WHERE token = ?", (token,)
+            ).fetchone()
+            entries = [] if row is None else conn.execute(
+                "SELECT seq, op, payload FROM journal WHERE token = ? AND seq > ? ORDER BY seq",
+                (token, row[1])
+            ).fetchall()
+        finally:
+            conn.execute("COMMIT")
+        if row is None:
+            return None
+
+        snapshot, snapshot_seq = row
+        session = InterviewSession.from_state(json.loads(snapshot)) if snapshot else InterviewSession()
+        seq = snapshot_seq
+        for seq, op, payload in entries:
+            session.apply_journal_entry(op, json.loads(payload))
+        session._journal = SessionJournal(self, token, session, seq=seq, snapshot_seq=snapshot_seq)
+        return session
+
+    def list_tokens(self, updated_since: Optional[float] = None) -> List[str]:
+        """저장된 세션 토큰 목록 (updated_since 이후 변경된 세션만, 생성 순)"""
+        query = "SELECT token FROM sessions"
+        params: tuple = ()
+        if updated_since is not None:
+            query += " WHERE updated_at >= ?"
+            params = (updated_since,)
+        rows = self._connect().execute(query + " ORDER BY created_at, token", params).fetchall()
+        return [row[0] for row in rows]
+
+    def delete(self, token: str) -> None:
+        """세션과 저널 삭제"""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM journal WHERE token = ?", (token,))
+            conn.execute("DELETE FROM sessions WHERE token = ?", (token,))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def cleanup(self, ttl_days: int = SessionSettings.TTL_DAYS) -> int:
+        """ttl_days 동안 변경이 없던 세션 삭제 후 삭제한 세션 수 반환"""
+        cutoff = time.time() - ttl_days * 86400
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "DELETE FROM journal WHERE token IN (SELECT token FROM sessions WHERE updated_at < ?)",
+                (cutoff,)
+            )
+            removed = conn.execute("DELETE FROM sessions WHERE updated_at < ?", (cutoff,)).rowcount
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return removed
+
+    @staticmethod
+    def _dumps(value) -> str:
+        return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+_shared_store: Optional[SessionStore] = None
+_shared_store_lock = threading.Lock()
+
+def get_session_store() -> SessionStore:
+    """프로세스 공용 세션 저장소 반환 (처음 생성 시 만료 세션 정리)"""
+    global _shared_store
+    with _shared_store_lock:
+        if _shared_store is None:
+            _shared_store = SessionStore()
+            _shared_store.cleanup()
+        return _shared_store
@@ -2,74 +2,76 @@
 
 import streamlit as st
 import streamlit.components.v1 as components
-import json
 from datetime import datetime
 
 from .core.interviewer import MockInterviewer
 from .core.session import InterviewSession
+from .core.session_manager import get_session_manager
+from .core.scheduler import get_request_scheduler
+from .core.client_pool import get_client_pool
+from .prompts.budget import get_budget_metrics
 from .utils.validation import enforce_limits
 from .utils.export import InterviewExporter
 from .stats.storage import FileStatisticsManager
 from .config.settings import Settings, get_api_key
 from .config.constants import VERSION, VERSION_INFO
-from .config.constants import POSITION_TOPICS
+from .config.constants import POSITION_TOPICS, SessionSettings
 from .ui.renderers import (
     render_conversation,
     render_position_selection,
     render_status_bar,
     render_control_buttons,
     render_answer_input,
-    render_final_evaluation
+    render_final_evaluation,
+    render_score_ranking
 )
-from .ui.components.react_components import DASHBOARD_COMPONENT
+from .ui.assets import render_dashboard_html
+
+# 다운로드 버튼 (형식, 버튼 이름, 도움말)
+EXPORT_BUTTONS = [
+    ('txt', "📝 면접 기록 다운로드 (TXT)", "면접 내용과 피드백을 텍스트 파일로 다운로드합니다."),
+    ('markdown', "📄 Markdown", "면접 내용과 피드백을 Markdown 문서로 다운로드합니다."),
+    ('jsonl', "🗂️ JSON Lines", "메시지 단위 JSON Lines 파일로 다운로드합니다."),
+]
+
+def start_new_session() -> InterviewSession:
+    """새 면접 세션 생성 (저장 사용 시 세션 관리자에 등록하고 URL에 토큰 기록)"""
+    if SessionSettings.PERSIST:
+        token, session = get_session_manager().create()
+        st.query_params[SessionSettings.QUERY_PARAM] = token
+        st.session_state.session_token = token
+    else:
+        session = InterviewSession()
+        st.session_state.session = session
+    st.session_state.submitted = False
+    return session
 
 def initialize_session():
-    """세션 초기화"""
-    if 'session' not in st.session_state:
+    """세션 초기화 (URL의 세션 토큰이 있으면 저장된 세션에서 이어서 진행)"""
+    if SessionSettings.PERSIST:
+        if 'session_token' not in st.session_state:
+            token = st.query_params.get(SessionSettings.QUERY_PARAM)
+            if token and get_session_manager().get(token) is not None:
+                st.session_state.session_token = token
+            else:
+                start_new_session()
+    elif 'session' not in st.session_state:
         st.session_state.session = InterviewSession()
     if 'submitted' not in st.session_state:
         st.session_state.submitted = False
 
-def create_react_container(root_id: str, data: dict) -> str:
-    """React 컴포넌트를 위한 HTML 컨테이너 생성"""
-    return f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="utf-8">
-        <script src="https://unpkg.com/react@17/umd/react.production.min.js"></script>
-        <script src="https://unpkg.com/react-dom@17/umd/react-dom.production.min.js"></script>
-        <link href="https://cdn.jsdelivr.net/npm/tailwindcss@2.2.19/dist/tailwind.min.css" rel="stylesheet">
-        <style>
-            body {{ margin: 0; padding: 1rem; }}
-        </style>
-    </head>
-    <body>
-        <div id="{root_id}"></div>
-        <script>
-            {DASHBOARD_COMPONENT}
-            
-            const stats = {json.dumps(data)};
-            
-            try {{
-                ReactDOM.render(
-                    React.createElement(StatisticsDashboard, {{ 
-                        statistics: stats 
-                    }}),
-                    document.getElementById('{root_id}')
-                );
-            }} catch (error) {{
-                console.error('렌더링 오류:', error);
-                document.getElementById('{root_id}').innerHTML = 
-                    `<div style="color: red; padding: 1rem;">
-                        오류 발생: ${{error.message}}
-                        <pre>${{error.stack}}</pre>
-                    </div>`;
-            }}
-        </script>
-    </body>
-    </html>
-    """
+def get_current_session() -> InterviewSession:
+    """현재 사용자의 세션 (디스크로 내보낸 세션은 다시 불러옴)"""
+    if not SessionSettings.PERSIST:
+        return st.session_state.session
+    session = get_session_manager().get(st.session_state.session_token)
+    # 보관 기간이 지나 삭제된 세션이면 새로 시작
+    return session if session is not None else start_new_session()
+
+@st.cache_resource(show_spinner=False)
+def warm_up_client(api_key: str) -> bool:
+    """API 키별로 프로세스에서 한 번만 Gemini 클라이언트 연결 준비"""
+    return get_client_pool().warm_up(api_key)
 
 def main():
     """메인 애플리케이션"""
@@ -93,6 +95,15 @@ def main():
                 st.write("**변경 이력:**")
                 for version, changes in VERSION_INFO["변경 이력"].items():
                     st.write(f"- v{version}: {changes}")
+        
+        # 개발 환경 - LLM 요청 대기열 지표
+        if Settings.DEBUG:
+            with st.expander("🛠️ LLM 요청 지표"):
+                st.json(get_request_scheduler().metrics())
+                st.write("**프롬프트 토큰 예산**")
+                st.json(get_budget_metrics().snapshot())
+                st.write("**활성 세션**")
+                st.json(get_session_manager().metrics())
 
     # 세션 초기화
     initialize_session()
@@ -107,11 +118,12 @@ def main():
         """)
         return
     
-    # 면접관 초기화
+    # 면접관 초기화 (클라이언트는 모든 세션이 공유)
+    warm_up_client(api_key)
     if 'interviewer' not in st.session_state:
         st.session_state.interviewer = MockInterviewer(api_key)
     
-    session = st.session_state.session
+    session = get_current_session()
     interviewer = st.session_state.interviewer
 
     # 포지션 선택
@@ -130,12 +142,12 @@ def main():
 
     # 면접 진행
     if not session.interview_complete:
-        # 현재 주제가 없으면 새 주제 시작
+        # 현재 주제가 없으면 새 주제 시작 (첫 질문은 생성되는 대로 표시)
+        opening_question = None
         if not session.current_topic:
             next_topic = interviewer.get_next_topic(session)
             if next_topic:
-                with st.spinner('다음 주제를 준비중입니다...'):
-                    interviewer.start_topic(session, next_topic)
+                opening_question = interviewer.stream_start_topic(session, next_topic)
             else:
                 session.interview_complete = True
                 st.rerun()
@@ -143,7 +155,9 @@ def main():
         
         # 현재 대화 표시
         st.write("---")
-        if session.current_topic:
+        if opening_question is not None:
+            render_conversation([], streaming_reply=opening_question)
+        elif session.current_topic:
             render_conversation(session.get_current_conversation())
 
         # 컨트롤 버튼
@@ -189,46 +203,55 @@ def main():
         if not session.final_feedback:
             st.write("## 🎉 면접이 모두 완료되었습니다!")
             
-            with st.spinner('최종 평가를 작성중입니다...'):
-                session.final_feedback = interviewer.generate_final_evaluation(session)
-                
-                # 통계 업데이트
-                stats_manager = FileStatisticsManager()
-                stats_manager.update_statistics(session)
-                st.rerun()
+            # 최종 평가는 생성되는 대로 표시
+            session.final_feedback = render_final_evaluation(
+                interviewer.stream_final_evaluation(session)
+            )
+            
+            # 통계 업데이트 (버퍼에만 기록하고 저장은 백그라운드 스레드에서 수행)
+            # 점수 순위는 이 세션을 빼고 계산한 결과를 세션에 보관해 재실행마다 같은 값 표시
+            stats_manager = FileStatisticsManager()
+            session.score_ranking = stats_manager.update_statistics(session)
+            st.rerun()
         
         else:
-            # 1. 최종 평가 표시
-            st.write("## 📋 최종 면접 평가")
-            st.markdown(session.final_feedback)
+            # 1. 최종 평가 및 점수 순위 표시
+            stats_manager = FileStatisticsManager()
+            render_final_evaluation(session.final_feedback)
+            render_score_ranking(session.score_ranking or {})
             
             # 2. 면접 기록 다운로드 옵션
             st.write("### 💾 면접 기록 다운로드")
-            txt_data = InterviewExporter.to_txt(session)
             timestamp = datetime.now().strftime('%Y%m%d_%H%M')
-            
-            st.download_button(
-                label="📝 면접 기록 다운로드 (TXT)",
-                data=txt_data.encode('utf-8'),
-                file_name=f"면접기록_{session.position}_{timestamp}.txt",
-                mime="text/plain",
-                help="면접 내용과 피드백을 텍스트 파일로 다운로드합니다."
-            )
+            download_cols = st.columns(len(EXPORT_BUTTONS))
+            for col, (fmt, label, help_text) in zip(download_cols, EXPORT_BUTTONS):
+                _, mime, extension = InterviewExporter.FORMATS[fmt]
+                with col:
+                    st.download_button(
+                        label=label,
+                        # 세션이 바뀌지 않았으면 재실행 시 이전 결과 재사용
+                        data=InterviewExporter.export(session, fmt),
+                        file_name=f"면접기록_{session.position}_{timestamp}.{extension}",
+                        mime=mime,
+                        help=help_text,
+                        key=f"download_{fmt}"
+                    )
             
             # 3. 새로운 면접 시작 옵션
             if st.button("새로운 면접 시작", key="new_interview", type="primary"):
-                st.session_state.session = InterviewSession()
-                st.session_state.submitted = False
+                interviewer.discard_prefetched()
+                start_new_session()
                 st.rerun()
 
             # 4. 통계 표시
             st.write("### 📊 전체 면접 통계")
-            stats_manager = FileStatisticsManager()
             stats_summary = stats_manager.get_statistics_summary()
+            stats_summary["ranges"] = stats_manager.get_range_summaries()
+            stats_summary["score_analytics"] = stats_manager.get_score_analytics(session.position)
 
             # React 컴포넌트 렌더링
             components.html(
-                create_react_container("stats-root", stats_summary),
+                render_dashboard_html("stats-root", stats_summary),
                 height=500
             )
 
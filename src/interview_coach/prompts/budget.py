@@ -0,0 +1,205 @@
+"""프롬프트 토큰 예산 관리"""
+
+import math
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..core.models import Conversation
+from ..core.session import format_transcript_line
+from ..config.constants import PromptBudgets
+
+def estimate_tokens(text: Optional[str]) -> int:
+    """토큰 수 추정 (ASCII 4자당 1토큰, 한글 등 비ASCII 문자는 1자당 1토큰)"""
+    if not text:
+        return 0
+    ascii_chars = sum(1 for char in text if ord(char) < 128)
+    return math.ceil(ascii_chars / 4) + (len(text) - ascii_chars)
+
+def _max_chars(build: Callable[[int], str], max_tokens: int, limit: int) -> int:
+    """build(n)의 추정 토큰 수가 max_tokens 이하인 가장 큰 n (0..limit 이진 탐색)"""
+    low, high = 0, limit
+    while low < high:
+        mid = (low + high + 1) // 2
+        if estimate_tokens(build(mid)) <= max_tokens:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+def _digest(text: str, max_chars: int) -> str:
+    """긴 텍스트를 앞부분만 남긴 요약으로 축약"""
+    if len(text) <= max_chars:
+        return text
+    return f"{text[:max_chars].rstrip()}…(이하 {len(text) - max_chars}자 생략)"
+
+@dataclass
+class BudgetReport:
+    """예산 적용 결과"""
+    task: str
+    before_tokens: int
+    after_tokens: int
+    digested_turns: int = 0
+    dropped_turns: int = 0
+    answer_truncated: bool = False
+
+    @property
+    def trimmed(self) -> bool:
+        return self.after_tokens < self.before_tokens
+
+class PromptBudget:
+    """작업별 프롬프트 토큰 예산
+
+    예산을 넘으면 다음 순서로 결정적으로 줄입니다. 지원자 답변이 가장 중요한
+    입력이므로 대화 내역을 먼저 줄입니다.
+    1. 최근 k개 발화를 제외한 이전 발화를 앞부분 요약으로 축약
+    2. 그래도 넘으면 가장 오래된 발화부터 생략
+    3. 그래도 넘으면 지원자 답변을 남은 초과분만큼만 앞/뒤를 남기고 축약
+    """
+
+    def __init__(
+        self,
+        task: str,
+        max_tokens: int,
+        keep_last_turns: int = PromptBudgets.KEEP_LAST_TURNS,
+        digest_chars: int = PromptBudgets.DIGEST_CHARS,
+        max_answer_tokens: int = PromptBudgets.MAX_ANSWER_TOKENS
+    ):
+        self.task = task
+        self.max_tokens = max_tokens
+        self.keep_last_turns = keep_last_turns
+        self.digest_chars = digest_chars
+        self.max_answer_tokens = max_answer_tokens
+
+    @classmethod
+    def for_task(cls, task: str) -> 'PromptBudget':
+        """설정된 작업별 예산으로 생성"""
+        return cls(task, PromptBudgets.TASK_LIMITS[task])
+
+    def apply(
+        self,
+        template: str,
+        history: List[Conversation],
+        formatted_history: Optional[str] = None,
+        answer: Optional[str] = None
+    ) -> Tuple[str, Optional[str]]:
+        """예산에 맞춘 (대화 내역, 답변) 반환
+
+        template은 대화 내역과 답변을 비운 프롬프트이며, formatted_history가 주어지면
+        예산 안일 때 그대로 사용합니다.
+        """
+        if formatted_history is None:
+            formatted_history = "\n".join(format_transcript_line(msg) for msg in history)
+
+        template_tokens = estimate_tokens(template)
+        before = template_tokens + estimate_tokens(formatted_history) + estimate_tokens(answer)
+        report = BudgetReport(task=self.task, before_tokens=before, after_tokens=before)
+        if before <= self.max_tokens:
+            _metrics.record(report)
+            return formatted_history, answer
+
+        answer_tokens = estimate_tokens(answer)
+        available = self.max_tokens - template_tokens - answer_tokens
+        lines = [format_transcript_line(msg) for msg in history]
+        history_text = "\n".join(lines)
+
+        # 1. 최근 발화를 제외하고 요약으로 축약
+        if estimate_tokens(history_text) > available:
+            split = max(0, len(history) - self.keep_last_turns)
+            for index in range(split):
+                message = history[index]
+                digested = _digest(message.content, self.digest_chars)
+                if digested != message.content:
+                    report.digested_turns += 1
+                lines[index] = format_transcript_line(
+                    Conversation(role=message.role, content=digested)
+                )
+            history_text = "\n".join(lines)
+
+        # 2. 오래된 발화부터 생략 (최근 발화는 최소 1개 유지)
+        while len(lines) > 1 and estimate_tokens(history_text) > available:
+            lines.pop(0)
+            report.dropped_turns += 1
+            history_text = self._join(lines, report.dropped_turns)
+
+        # 3. 마지막 수단으로 답변을 남은 초과분만큼만 축약 (앞/뒤 유지)
+        #    단, 최소 보장 분량(설정값과 예산 절반 중 작은 값)보다는 줄이지 않음
+        history_tokens = estimate_tokens(history_text)
+        room = self.max_tokens - template_tokens - history_tokens
+        if answer and answer_tokens > room:
+            floor = min(self.max_answer_tokens, max(0, self.max_tokens - template_tokens) // 2)
+            limit = max(room, floor)
+            if answer_tokens > limit:
+                answer = self._truncate_answer(answer, limit)
+                report.answer_truncated = True
+
+            # 최소 분량을 보장하느라 여전히 넘으면 남은 최근 발화를 축약
+            overflow = history_tokens + estimate_tokens(answer) - (self.max_tokens - template_tokens)
+            if overflow > 0 and lines:
+                lines[-1] = _digest(lines[-1], max(0, len(lines[-1]) - overflow - 20))
+                history_text = self._join(lines, report.dropped_turns)
+
+        report.after_tokens = template_tokens + estimate_tokens(history_text) + estimate_tokens(answer)
+        _metrics.record(report)
+        return history_text, answer
+
+    @staticmethod
+    def _join(lines: List[str], dropped_turns: int) -> str:
+        """대화 내역 줄 결합 (생략한 발화가 있으면 앞에 표시)"""
+        if dropped_turns:
+            lines = [f"(이전 대화 {dropped_turns}개 생략)"] + lines
+        return "\n".join(lines)
+
+    @staticmethod
+    def _truncate_answer(answer: str, max_tokens: int) -> str:
+        """답변의 앞/뒤를 남기고 가운데를 생략 (이미 예산 안이면 그대로)"""
+        if estimate_tokens(answer) <= max_tokens:
+            return answer
+        
+        # 생략 표시 분량을 빼고 남길 글자 수를 추정 토큰 기준으로 계산 (영문/코드는 4자당 1토큰)
+        keep = max_tokens - 20
+        if keep <= 0:
+            # 생략 표시를 넣을 여유도 없으면 앞부분만 남김
+            return answer[:_max_chars(lambda n: answer[:n], max_tokens, len(answer))]
+        
+        def head_and_tail(chars: int) -> Tuple[str, str]:
+            head = chars * 2 // 3
+            tail = chars - head
+            return answer[:head], answer[len(answer) - tail:] if tail else ""
+        
+        chars = _max_chars(lambda n: "".join(head_and_tail(n)), keep, len(answer))
+        head_text, tail_text = head_and_tail(chars)
+        omitted = len(answer) - chars
+        return f"{head_text.rstrip()}\n…(중간 {omitted}자 생략)…\n{tail_text.lstrip()}"
+
+class BudgetMetrics:
+    """작업별 프롬프트 크기 절감 지표"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def record(self, report: BudgetReport) -> None:
+        """예산 적용 결과 기록"""
+        with self._lock:
+            stats = self._stats.setdefault(report.task, {
+                'prompts': 0, 'trimmed': 0, 'tokens_before': 0, 'tokens_after': 0
+            })
+            stats['prompts'] += 1
+            stats['trimmed'] += int(report.trimmed)
+            stats['tokens_before'] += report.before_tokens
+            stats['tokens_after'] += report.after_tokens
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        """현재까지의 지표"""
+        with self._lock:
+            return {
+                task: dict(stats, tokens_saved=stats['tokens_before'] - stats['tokens_after'])
+                for task, stats in self._stats.items()
+            }
+
+_metrics = BudgetMetrics()
+
+def get_budget_metrics() -> BudgetMetrics:
+    """프로세스 공용 예산 지표 반환"""
+    return _metrics
@@ -1,6 +1,6 @@
 """평가 관련 프롬프트 템플릿"""
 
-from typing import List
+from typing import Dict, List
 
 class EvaluationPrompts:
     """평가 생성 관련 프롬프트"""
@@ -60,6 +60,49 @@ class EvaluationPrompts:
         {conversation_history}
         """
 
+    @staticmethod
+    def topic_summary(position: str, topic: str, conversation_history: str) -> str:
+        """주제별 요약 생성 프롬프트 (최종 평가 입력용)"""
+        return f"""
+        {position} 개발자 면접관으로서 다음 대화를 최종 평가에 사용할 수 있도록 요약해주세요.
+        
+        주제: {topic}
+        
+        대화 내역:
+        {conversation_history}
+        
+        요약 조건:
+        1. 5줄 이내의 짧은 글머리표 목록
+        2. 지원자가 실제로 답변한 핵심 내용과 근거만 포함
+        3. 정확했던 부분과 부족했던 부분을 구분하여 기록
+        4. 추측이나 대화에 없는 내용은 포함하지 않기
+        """
+
+    @staticmethod
+    def final_evaluation_from_summaries(position: str, completed_topics: List[str], topic_summaries: Dict[str, str]) -> str:
+        """주제별 요약을 종합하는 최종 평가 생성 프롬프트"""
+        topics_text = ', '.join(completed_topics) if completed_topics else '없음'
+        summaries_text = '\n\n'.join(
+            f"[{topic}]\n{summary}" for topic, summary in topic_summaries.items()
+        )
+        
+        return f"""
+        당신은 {position} 개발자 면접관입니다.
+        지원자와 나눈 실제 대화를 주제별로 요약한 내용만을 바탕으로 객관적인 평가를 진행해주세요.
+        
+        진행된 주제: {topics_text}
+        
+        평가 작성 시 주의사항:
+        1. 요약에 나온 내용만 평가해주세요
+        2. 답변이 부족한 부분은 명확히 지적해주세요
+        3. 보여준 강점은 구체적으로 언급해주세요
+        4. 실제 답변에 기반한 개선점을 제시해주세요
+        5. 과대평가나 과소평가를 피해주세요
+        
+        주제별 대화 요약:
+        {summaries_text}
+        """
+
     @staticmethod
     def get_empty_evaluation_message() -> str:
         """답변이 없는 경우의 메시지"""
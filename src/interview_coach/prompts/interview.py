@@ -5,6 +5,9 @@ from .base import PromptTemplate
 class InterviewPrompts:
     """면접 진행 관련 프롬프트"""
     
+    # 프롬프트 문구 변경 시 올려서 캐시된 응답을 무효화
+    PROMPT_VERSION = 1
+    
     @staticmethod
     def start_topic(position: str, topic: str) -> str:
         """첫 질문 생성 프롬프트"""
@@ -54,6 +57,55 @@ class InterviewPrompts:
         피드백: (현재 답변에 대한 간단한 피드백)
         """
 
+    @staticmethod
+    def analyze_answer_with_feedback(position: str, topic: str, conversation_history: str, answer: str) -> str:
+        """답변 분석 + 주제 마무리 피드백 통합 프롬프트 (JSON 응답)"""
+        return f"""
+        당신은 {position} 개발자 면접관입니다.
+        현재 주제: {topic}
+        현재까지의 대화:
+        {conversation_history}
+        
+        지원자의 답변: {answer}
+        
+        지원자의 답변을 분석하여 다음 행동을 결정해주세요.
+        
+        고려사항:
+        1. 답변이 명확하고 좋은 경우:
+           - 좀 더 깊이 있는 후속 질문
+           - 실제 경험이나 예시를 물어보는 질문
+           
+        2. 답변이 애매하거나 부족한 경우:
+           - 한번 정도는 힌트나 가이드를 주며 기회 제공
+           - 그래도 어려워한다면 다른 방향의 질문으로 전환
+           
+        3. 답변이 잘 못하거나 모른다고 할 경우:
+           - 더 이상 깊이 파고들지 않고 부드럽게 마무리
+           - 긍정적인 피드백과 함께 다음 주제로 전환
+        
+        액션이 CONCLUDE인 경우에만 이 주제 전체 대화에 대한 topic_feedback을 함께 작성해주세요.
+        topic_feedback 작성 시 주의사항:
+        1. 긍정적이고 건설적인 톤 유지
+        2. 부족한 부분에 대해서는 개선 방향 제시에 중점
+        3. 지원자의 현재 수준을 고려한 현실적인 학습 제안
+        4. 과도한 비판이나 부정적 평가 지양
+        
+        다른 설명 없이 다음 JSON 형식으로만 답변해주세요:
+        {{
+            "action": "FOLLOW_UP 또는 HINT 또는 CONCLUDE",
+            "completion_score": 1에서 5 사이의 정수,
+            "next_response": "면접관의 자연스러운 답변",
+            "feedback": "현재 답변에 대한 간단한 피드백",
+            "topic_feedback": {{
+                "understanding": "전반적인 개념 이해도(상/중/하)와 실무 적용 능력 분석",
+                "strengths": ["2-3가지 구체적인 장점과 예시"],
+                "improvements": ["2-3가지 구체적인 보완점과 예시"],
+                "suggestions": ["부족한 부분을 보완하기 위한 구체적인 학습 방향"]
+            }}
+        }}
+        CONCLUDE가 아니면 topic_feedback은 null로 작성해주세요.
+        """
+
     @staticmethod
     def refresh_topic(position: str, topic: str, conversation_history: str) -> str:
         """새로운 질문 생성 프롬프트"""
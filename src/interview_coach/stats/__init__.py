@@ -1,6 +1,21 @@
 """통계 관리 패키지"""
 
-from .models import InterviewStatistics
-from .storage import FileStatisticsManager
+from .models import InterviewStatistics, StatisticsEvent
+from .backends import StatisticsBackend, JsonFileBackend, SQLiteBackend, EventLogBackend, create_backend
+from .ranking import PercentileIndex, get_percentile_index
+from .scores import ScoreStore, get_score_store
+from .sharded import ShardedCounterBackend
+from .storage import FileStatisticsManager, get_statistics_backend
+from .snapshot import StatisticsSnapshotCache, get_snapshot_cache
+from .write_behind import BufferedStatisticsBackend, Durability
 
-__all__ = ['InterviewStatistics', 'FileStatisticsManager']
\ No newline at end of file
+__all__ = [
+    'InterviewStatistics', 'StatisticsEvent',
+    'StatisticsBackend', 'JsonFileBackend', 'SQLiteBackend', 'EventLogBackend',
+    'ShardedCounterBackend', 'create_backend',
+    'PercentileIndex', 'get_percentile_index',
+    'ScoreStore', 'get_score_store',
+    'StatisticsSnapshotCache', 'get_snapshot_cache',
+    'BufferedStatisticsBackend', 'Durability',
+    'FileStatisticsManager', 'get_statistics_backend'
+]
@@ -0,0 +1,591 @@
+"""통계 저장소 백엔드"""
+
+import json
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, Hashable, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from .models import StatisticsEvent
+from ..config.constants import StatisticsSettings
+from ..utils.sqlite_util import ThreadLocalConnection
+
+def default_stats() -> Dict:
+    """기본 통계 데이터 구조"""
+    return {
+        "total_interviews": 0,
+        "completed_interviews": 0,
+        "position_distribution": {
+            "프론트엔드": 0,
+            "백엔드": 0,
+            "풀스택": 0
+        },
+        "success_count": 0,
+        "last_updated": datetime.now().isoformat()
+    }
+
+def apply_event(stats: Dict, event: StatisticsEvent) -> Dict:
+    """통계 구조에 이벤트 1건 반영"""
+    stats["total_interviews"] += 1
+    if event.position:
+        distribution = stats["position_distribution"]
+        distribution[event.position] = distribution.get(event.position, 0) + 1
+    if event.completed:
+        stats["completed_interviews"] += 1
+        if event.success:
+            stats["success_count"] += 1
+    if event.score is not None:
+        stats["score_sum"] = stats.get("score_sum", 0.0) + event.score
+        stats["score_count"] = stats.get("score_count", 0) + 1
+    stats["last_updated"] = datetime.now().isoformat()
+    return stats
+
+def week_key(day: date) -> str:
+    """ISO 주 단위 집계 키 (예: 2024-W03)"""
+    iso = day.isocalendar()
+    return f"{iso[0]}-W{iso[1]:02d}"
+
+def month_key(day: date) -> str:
+    """월 단위 집계 키 (예: 2024-01)"""
+    return day.strftime("%Y-%m")
+
+def merge_stats(target: Dict, source: Dict) -> Dict:
+    """source 통계를 target에 합산"""
+    for key in ("total_interviews", "completed_interviews", "success_count", "score_sum", "score_count"):
+        if key in source:
+            target[key] = target.get(key, 0) + source[key]
+    for position, count in source.get("position_distribution", {}).items():
+        target["position_distribution"][position] = target["position_distribution"].get(position, 0) + count
+    if source.get("last_updated"):
+        target["last_updated"] = max(target["last_updated"], source["last_updated"])
+    return target
+
+def _month_end(day: date) -> date:
+    """해당 월의 마지막 날"""
+    next_month = (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return next_month - timedelta(days=1)
+
+def decompose_range(start: date, end: date) -> List[Tuple[str, str]]:
+    """[start, end] 기간을 가장 적은 수의 (월/주/일) 집계 키로 분할
+
+    기간 내에 통째로 들어가는 달은 월 집계, 남은 구간에서 통째로 들어가는 ISO 주는
+    주 집계, 나머지 경계 일자만 일 집계로 읽으므로 조회 횟수가 일수에 비례하지 않습니다.
+    """
+    keys: List[Tuple[str, str]] = []
+    cursor = start
+    while cursor <= end:
+        if cursor.day == 1 and _month_end(cursor) <= end:
+            keys.append(("monthly", month_key(cursor)))
+            cursor = _month_end(cursor) + timedelta(days=1)
+        elif cursor.weekday() == 0 and cursor + timedelta(days=6) <= end:
+            keys.append(("weekly", week_key(cursor)))
+            cursor += timedelta(days=7)
+        else:
+            keys.append(("daily", cursor.isoformat()))
+            cursor += timedelta(days=1)
+    return keys
+
+class StatisticsBackend(ABC):
+    """통계 저장소 인터페이스
+
+    record()는 이벤트 1건을 원자적으로 반영해야 하며,
+    load()는 default_stats()와 같은 구조의 일별 통계를 반환합니다.
+    """
+
+    @abstractmethod
+    def record(self, event: StatisticsEvent) -> None:
+        """이벤트 반영"""
+
+    def record_batch(self, events: List[StatisticsEvent]) -> None:
+        """여러 이벤트 반영 (기본 구현은 한 건씩 기록)"""
+        for event in events:
+            self.record(event)
+
+    @abstractmethod
+    def load(self, day: date) -> Dict:
+        """일별 통계 조회"""
+
+    @abstractmethod
+    def cleanup(self, before: date) -> None:
+        """before 이전 날짜의 통계 삭제"""
+
+    def load_range(self, start: date, end: date) -> Dict:
+        """[start, end] 기간 통계 조회 (기본 구현은 일별 합산)"""
+        stats = default_stats()
+        day = start
+        while day <= end:
+            merge_stats(stats, self.load(day))
+            day += timedelta(days=1)
+        return stats
+
+    def version(self) -> Optional[Hashable]:
+        """저장소 내용이 바뀌면 달라지는 값 (None이면 알 수 없음)
+
+        다른 프로세스의 기록을 감지하는 데 쓰이므로 파일 stat 수준으로 저렴해야 합니다.
+        """
+        return None
+
+class JsonFileBackend(StatisticsBackend):
+    """일별 JSON 파일 저장소 (기존 형식)
+
+    프로세스 내부 쓰기는 잠금으로 직렬화하지만, 여러 프로세스가 동시에 쓰면
+    갱신이 유실될 수 있습니다. 다중 프로세스 환경에서는 SQLiteBackend를 사용하세요.
+    """
+
+    def __init__(self, stats_dir: str = StatisticsSettings.STATS_DIR):
+        self.stats_dir = Path(stats_dir)
+        self.stats_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def _file_for(self, day: date) -> Path:
+        return self.stats_dir / f"stats_{day}.json"
+
+    def record(self, event: StatisticsEvent) -> None:
+        with self._lock:
+            stats = apply_event(self.load(event.day), event)
+
+            # 임시 파일에 쓴 뒤 교체하여 읽는 쪽이 깨진 파일을 보지 않도록 함
+            path = self._file_for(event.day)
+            tmp_path = path.with_suffix(".json.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(stats, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+
+    def load(self, day: date) -> Dict:
+        path = self._file_for(day)
+        if path.exists():
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return default_stats()
+
+    def cleanup(self, before: date) -> None:
+        for stats_file in self.stats_dir.glob("stats_*.json"):
+            if date.fromisoformat(stats_file.stem.split('_')[1]) < before:
+                stats_file.unlink()
+
+    def version(self) -> Optional[Hashable]:
+        # 파일 교체(os.replace)는 디렉토리 수정 시각을 바꿈
+        return self.stats_dir.stat().st_mtime_ns
+
+class SQLiteBackend(StatisticsBackend):
+    """SQLite(WAL) 저장소
+
+    카운터는 UPDATE ... SET x = x + 1 로 갱신하므로 여러 스레드/프로세스가
+    동시에 기록해도 증가분이 유실되지 않습니다.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS daily_stats (
+            day TEXT PRIMARY KEY,
+            total_interviews INTEGER NOT NULL DEFAULT 0,
+            completed_interviews INTEGER NOT NULL DEFAULT 0,
+            success_count INTEGER NOT NULL DEFAULT 0,
+            last_updated TEXT
+        );
+        CREATE TABLE IF NOT EXISTS position_counts (
+            day TEXT NOT NULL,
+            position TEXT NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, position)
+        );
+        CREATE TABLE IF NOT EXISTS period_stats (
+            period TEXT NOT NULL,
+            key TEXT NOT NULL,
+            total_interviews INTEGER NOT NULL DEFAULT 0,
+            completed_interviews INTEGER NOT NULL DEFAULT 0,
+            success_count INTEGER NOT NULL DEFAULT 0,
+            last_updated TEXT,
+            PRIMARY KEY (period, key)
+        );
+        CREATE TABLE IF NOT EXISTS period_position_counts (
+            period TEXT NOT NULL,
+            key TEXT NOT NULL,
+            position TEXT NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (period, key, position)
+        );
+    """
+
+    def __init__(
+        self,
+        db_path: str = os.path.join(StatisticsSettings.STATS_DIR, StatisticsSettings.SQLITE_FILE),
+        timeout: float = StatisticsSettings.SQLITE_TIMEOUT
+    ):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db_file = str(self.db_path)
+        self._wal_file = f"{self.db_path}-wal"
+        self.timeout = timeout
+        self._connections = ThreadLocalConnection(self.db_path, timeout)
+        with self._connect() as conn:
+            conn.executescript(self._SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """현재 스레드의 연결 반환"""
+        return self._connections.get()
+
+    def record(self, event: StatisticsEvent) -> None:
+        self.record_batch([event])
+
+    def record_batch(self, events: List[StatisticsEvent]) -> None:
+        # 이벤트를 (기간, 키)별 증가분으로 합친 뒤 한 트랜잭션에서 반영
+        deltas: Dict[Tuple[str, str], Dict] = {}
+        for event in events:
+            for period, key in (
+                ("daily", event.day.isoformat()),
+                ("weekly", week_key(event.day)),
+                ("monthly", month_key(event.day))
+            ):
+                delta = deltas.setdefault((period, key), {
+                    "total": 0, "completed": 0, "success": 0, "positions": {}
+                })
+                delta["total"] += 1
+                delta["completed"] += int(event.completed)
+                delta["success"] += int(event.completed and event.success)
+                if event.position:
+                    delta["positions"][event.position] = delta["positions"].get(event.position, 0) + 1
+        if not deltas:
+            return
+
+        now = datetime.now().isoformat()
+        conn = self._connect()
+        # 쓰기 잠금을 먼저 잡아 모든 증가분이 하나의 트랜잭션으로 반영되도록 함
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for (period, key), delta in deltas.items():
+                if period == "daily":
+                    self._increment_daily(conn, key, delta, now)
+                else:
+                    self._increment_period(conn, period, key, delta, now)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    @staticmethod
+    def _increment_daily(conn: sqlite3.Connection, day: str, delta: Dict, now: str) -> None:
+        """일별 집계 증가"""
+        conn.execute("INSERT OR IGNORE INTO daily_stats (day) VALUES (?)", (day,))
+        conn.execute(
+            """
+            UPDATE daily_stats
+            SET total_interviews = total_interviews + ?,
+                completed_interviews = completed_interviews + ?,
+                success_count = success_count + ?,
+                last_updated = ?
+            WHERE day = ?
+            """,
+            (delta["total"], delta["completed"], delta["success"], now, day)
+        )
+        for position, count in delta["positions"].items():
+            conn.execute(
+                """
+                INSERT INTO position_counts (day, position, count) VALUES (?, ?, ?)
+                ON CONFLICT (day, position) DO UPDATE SET count = count + excluded.count
+                """,
+                (day, position, count)
+            )
+
+    @staticmethod
+    def _increment_period(conn: sqlite3.Connection, period: str, key: str, delta: Dict, now: str) -> None:
+        """주/월 집계 증가"""
+        conn.execute(
+            """
+            INSERT INTO period_stats
+                (period, key, total_interviews, completed_interviews, success_count, last_updated)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (period, key) DO UPDATE SET
+                total_interviews = total_interviews + excluded.total_interviews,
+                completed_interviews = completed_interviews + excluded.completed_interviews,
+                success_count = success_count + excluded.success_count,
+                last_updated = excluded.last_updated
+            """,
+            (period, key, delta["total"], delta["completed"], delta["success"], now)
+        )
+        for position, count in delta["positions"].items():
+            conn.execute(
+                """
+                INSERT INTO period_position_counts (period, key, position, count) VALUES (?, ?, ?, ?)
+                ON CONFLICT (period, key, position) DO UPDATE SET count = count + excluded.count
+                """,
+                (period, key, position, count)
+            )
+
+    def load_range(self, start: date, end: date) -> Dict:
+        stats = default_stats()
+        conn = self._connect()
+        for period, key in decompose_range(start, end):
+            if period == "daily":
+                merge_stats(stats, self.load(date.fromisoformat(key)))
+                continue
+            row = conn.execute(
+                """
+                SELECT total_interviews, completed_interviews, success_count, last_updated
+                FROM period_stats WHERE period = ? AND key = ?
+                """,
+                (period, key)
+            ).fetchone()
+            if row is None:
+                continue
+            merge_stats(stats, {
+                "total_interviews": row[0],
+                "completed_interviews": row[1],
+                "success_count": row[2],
+                "last_updated": row[3],
+                "position_distribution": dict(conn.execute(
+                    "SELECT position, count FROM period_position_counts WHERE period = ? AND key = ?",
+                    (period, key)
+                ).fetchall())
+            })
+        return stats
+
+    def load(self, day: date) -> Dict:
+        stats = default_stats()
+        conn = self._connect()
+        row = conn.execute(
+            """
+            SELECT total_interviews, completed_interviews, success_count, last_updated
+            FROM daily_stats WHERE day = ?
+            """,
+            (day.isoformat(),)
+        ).fetchone()
+        if row is None:
+            return stats
+
+        stats["total_interviews"], stats["completed_interviews"], stats["success_count"] = row[:3]
+        stats["last_updated"] = row[3] or stats["last_updated"]
+        for position, count in conn.execute(
+            "SELECT position, count FROM position_counts WHERE day = ?", (day.isoformat(),)
+        ):
+            stats["position_distribution"][position] = count
+        return stats
+
+    def cleanup(self, before: date) -> None:
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM daily_stats WHERE day < ?", (before.isoformat(),))
+            conn.execute("DELETE FROM position_counts WHERE day < ?", (before.isoformat(),))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def version(self) -> Optional[Hashable]:
+        # WAL 모드에서는 커밋이 -wal 파일에, 체크포인트가 본 파일에 반영됨
+        return _file_signature(self._db_file), _file_signature(self._wal_file)
+
+class EventLogBackend(StatisticsBackend):
+    """추가 전용 이벤트 로그(JSONL) + 주기적 집계 압축 저장소
+
+    기록은 로그 끝에 한 줄을 덧붙이는 O(1) 연산이라 파일 크기와 무관하며,
+    한 번의 write로 기록하므로 여러 프로세스가 동시에 덧붙여도 줄이 섞이지 않습니다.
+    compact()는 아직 접지 않은 꼬리 이벤트를 일/주/월 집계에 반영하고 로그 오프셋을
+    함께 저장합니다. 조회는 최신 집계 + 꼬리 이벤트를 합산하며, 원본 로그는 그대로
+    남아 rebuild()로 언제든 다시 집계할 수 있습니다.
+    """
+
+    PERIODS = ("daily", "weekly", "monthly")
+
+    def __init__(
+        self,
+        stats_dir: str = StatisticsSettings.STATS_DIR,
+        compact_every: int = StatisticsSettings.COMPACT_EVERY
+    ):
+        self.stats_dir = Path(stats_dir)
+        self.stats_dir.mkdir(parents=True, exist_ok=True)
+        self.log_path = self.stats_dir / StatisticsSettings.EVENT_LOG_FILE
+        self.rollup_path = self.stats_dir / StatisticsSettings.ROLLUP_FILE
+        self.compact_every = compact_every
+        self._lock = threading.Lock()
+        # 압축 대기 이벤트 수 (재시작해도 이어지도록 로그 꼬리의 줄 수에서 시작)
+        self._pending = self._count_tail(self._load_rollups()["offset"])
+
+    def record(self, event: StatisticsEvent) -> None:
+        self.record_batch([event])
+
+    def record_batch(self, events: List[StatisticsEvent]) -> None:
+        if not events:
+            return
+        lines = "".join(json.dumps(event.to_dict(), ensure_ascii=False) + "\n" for event in events)
+        with open(self.log_path, 'a', encoding='utf-8') as f:
+            f.write(lines)
+
+        with self._lock:
+            self._pending += len(events)
+            should_compact = self._pending >= self.compact_every
+            if should_compact:
+                self._pending = 0
+        if should_compact:
+            self.compact()
+
+    def load(self, day: date) -> Dict:
+        rollups = self._load_rollups()
+        stats = default_stats()
+        stats.update(rollups["daily"].get(day.isoformat(), {}))
+        events, _ = self._read_tail(rollups["offset"])
+        for event in events:
+            if event.day == day:
+                apply_event(stats, event)
+        return stats
+
+    def load_period(self, period: str, key: str) -> Dict:
+        """주/월 단위 집계 조회 (period: daily, weekly, monthly)"""
+        key_of = {"daily": lambda d: d.isoformat(), "weekly": week_key, "monthly": month_key}[period]
+        rollups = self._load_rollups()
+        stats = default_stats()
+        stats.update(rollups[period].get(key, {}))
+        events, _ = self._read_tail(rollups["offset"])
+        for event in events:
+            if key_of(event.day) == key:
+                apply_event(stats, event)
+        return stats
+
+    def load_range(self, start: date, end: date) -> Dict:
+        rollups = self._load_rollups()
+        stats = default_stats()
+        for period, key in decompose_range(start, end):
+            if key in rollups[period]:
+                merge_stats(stats, rollups[period][key])
+        events, _ = self._read_tail(rollups["offset"])
+        for event in events:
+            if start <= event.day <= end:
+                apply_event(stats, event)
+        return stats
+
+    def compact(self) -> int:
+        """꼬리 이벤트를 집계 파일에 반영하고 반영한 이벤트 수 반환"""
+        with self._lock, _FileLock(self.stats_dir / ".compact.lock"):
+            rollups = self._load_rollups()
+            events, offset = self._read_tail(rollups["offset"])
+            if not events:
+                return 0
+            self._fold(rollups, events)
+            rollups["offset"] = offset
+            self._save_rollups(rollups)
+            return len(events)
+
+    def rebuild(self) -> None:
+        """원본 로그 전체로 집계 다시 생성"""
+        with self._lock, _FileLock(self.stats_dir / ".compact.lock"):
+            rollups = self._empty_rollups()
+            events, offset = self._read_tail(0)
+            self._fold(rollups, events)
+            rollups["offset"] = offset
+            self._save_rollups(rollups)
+
+    def cleanup(self, before: date) -> None:
+        # 일별 집계만 정리하고 주/월 집계와 원본 로그는 유지
+        with self._lock, _FileLock(self.stats_dir / ".compact.lock"):
+            rollups = self._load_rollups()
+            rollups["daily"] = {
+                day: stats for day, stats in rollups["daily"].items()
+                if date.fromisoformat(day) >= before
+            }
+            self._save_rollups(rollups)
+
+    def version(self) -> Optional[Hashable]:
+        return _file_signature(self.log_path), _file_signature(self.rollup_path)
+
+    def _fold(self, rollups: Dict, events) -> None:
+        """이벤트를 일/주/월 집계에 반영"""
+        for event in events:
+            keys = (event.day.isoformat(), week_key(event.day), month_key(event.day))
+            for period, key in zip(self.PERIODS, keys):
+                if key not in rollups[period]:
+                    rollups[period][key] = default_stats()
+                apply_event(rollups[period][key], event)
+
+    def _count_tail(self, offset: int) -> int:
+        """offset 이후 로그에 기록된 완전한 줄 수"""
+        if not self.log_path.exists():
+            return 0
+        count = 0
+        with open(self.log_path, 'rb') as f:
+            f.seek(offset)
+            for block in iter(lambda: f.read(1 << 20), b""):
+                count += block.count(b"\n")
+        return count
+
+    def _read_tail(self, offset: int):
+        """offset 이후의 완전한 줄을 읽어 (이벤트 목록, 다음 오프셋) 반환"""
+        if not self.log_path.exists():
+            return [], offset
+
+        events = []
+        with open(self.log_path, 'rb') as f:
+            f.seek(offset)
+            for raw in f:
+                # 아직 쓰는 중인 마지막 줄은 다음에 처리
+                if not raw.endswith(b"\n"):
+                    break
+                offset += len(raw)
+                try:
+                    events.append(StatisticsEvent.from_dict(json.loads(raw)))
+                except (ValueError, KeyError):
+                    continue
+        return events, offset
+
+    def _empty_rollups(self) -> Dict:
+        return {"offset": 0, **{period: {} for period in self.PERIODS}}
+
+    def _load_rollups(self) -> Dict:
+        if not self.rollup_path.exists():
+            return self._empty_rollups()
+        with open(self.rollup_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _save_rollups(self, rollups: Dict) -> None:
+        # 집계와 오프셋을 한 파일에 원자적으로 저장하여 중복 반영을 방지
+        tmp_path = self.rollup_path.with_suffix(".json.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(rollups, f, ensure_ascii=False)
+        os.replace(tmp_path, self.rollup_path)
+
+def _file_signature(path) -> Optional[Tuple[int, int]]:
+    """파일 변경 감지용 (수정 시각, 크기)"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+class _FileLock:
+    """프로세스 간 배타 잠금 (fcntl 미지원 환경에서는 잠금 생략)"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self.path, 'a')
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        self._file.close()
+
+def create_backend(kind: str = StatisticsSettings.BACKEND,
+                   stats_dir: str = StatisticsSettings.STATS_DIR) -> StatisticsBackend:
+    """설정에 맞는 저장소 생성"""
+    if kind == 'sqlite':
+        return SQLiteBackend(os.path.join(stats_dir, StatisticsSettings.SQLITE_FILE))
+    if kind == 'event_log':
+        return EventLogBackend(stats_dir)
+    if kind == 'json':
+        return JsonFileBackend(stats_dir)
+    if kind == 'sharded':
+        from .sharded import ShardedCounterBackend
+        return ShardedCounterBackend(stats_dir)
+    raise ValueError(f"지원하지 않는 통계 저장소입니다: {kind}")
@@ -1,5 +1,5 @@
-from datetime import datetime
-from typing import Dict, Optional
+from datetime import date, datetime
+from typing import Dict, List, Optional
 from dataclasses import dataclass
 
 @dataclass
@@ -19,4 +19,48 @@ class InterviewStatistics:
                 "풀스택": 0
             }
         if self.last_updated is None:
-            self.last_updated = datetime.now()
\ No newline at end of file
+            self.last_updated = datetime.now()
+
+@dataclass
+class StatisticsEvent:
+    """완료된 면접 세션 1건의 통계 이벤트"""
+    position: Optional[str] = None
+    completed: bool = False
+    success: bool = False
+    score: Optional[float] = None
+    timestamp: datetime = None
+    scores: Optional[Dict[str, List[int]]] = None  # 주제별 답변 점수 (점수 저장소/순위 색인용)
+
+    def __post_init__(self):
+        if self.timestamp is None:
+            self.timestamp = datetime.now()
+
+    def to_dict(self) -> Dict:
+        """직렬화용 딕셔너리"""
+        data = {
+            "position": self.position,
+            "completed": self.completed,
+            "success": self.success,
+            "score": self.score,
+            "timestamp": self.timestamp.isoformat()
+        }
+        if self.scores:
+            data["scores"] = self.scores
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'StatisticsEvent':
+        """딕셔너리에서 복원"""
+        return cls(
+            position=data.get("position"),
+            completed=data.get("completed", False),
+            success=data.get("success", False),
+            score=data.get("score"),
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            scores=data.get("scores")
+        )
+
+    @property
+    def day(self) -> date:
+        """집계 기준 날짜"""
+        return self.timestamp.date()
@@ -0,0 +1,136 @@
+"""포지션/주제별 평균 점수 백분위 순위"""
+
+import bisect
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .models import StatisticsEvent
+from ..config.constants import StatisticsSettings
+
+OVERALL = "__overall__"  # 주제 구분 없는 세션 전체 평균 키
+
+class PercentileIndex:
+    """(포지션, 주제)별로 정렬된 세션 평균 점수 목록
+
+    세션 평균은 덧붙이기 전용 로그 파일에 한 줄씩 기록하고(한 번의 write로 덧붙이므로
+    잠금이 필요 없음), 메모리 색인은 마지막으로 읽은 위치 이후의 줄만 읽어 정렬 상태를
+    유지합니다. 순위 조회는 정렬된 목록에서 이진 탐색(O(log n))만 수행합니다.
+    """
+
+    def __init__(self, stats_dir: str = StatisticsSettings.STATS_DIR):
+        self.stats_dir = Path(stats_dir)
+        self.stats_dir.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.stats_dir / StatisticsSettings.RANKING_FILE
+        self._lock = threading.Lock()
+        self._index: Dict[str, List[float]] = {}
+        self._offset = 0  # 로그 파일에서 읽은 위치
+
+    @staticmethod
+    def _key(position: str, topic: str) -> str:
+        return f"{position}::{topic}"
+
+    @staticmethod
+    def session_averages(scores: Dict[str, List[int]]) -> Dict[str, float]:
+        """주제별 평균과 전체 평균 (소수 둘째 자리)"""
+        averages = {
+            topic: round(sum(values) / len(values), 2)
+            for topic, values in scores.items() if topic and values
+        }
+        all_scores = [score for values in scores.values() for score in values]
+        if all_scores:
+            averages[OVERALL] = round(sum(all_scores) / len(all_scores), 2)
+        return averages
+
+    def add_session(self, position: str, scores: Dict[str, List[int]]) -> None:
+        """세션의 주제별/전체 평균 점수를 색인에 추가"""
+        self._append([(position, scores)])
+
+    def record_batch(self, events: List[StatisticsEvent]) -> None:
+        """통계 이벤트 묶음의 세션 평균을 한 번에 추가 (지연 쓰기 버퍼에서 호출)"""
+        self._append([(event.position, event.scores) for event in events if event.scores])
+
+    def _append(self, sessions: List[Tuple[Optional[str], Dict[str, List[int]]]]) -> None:
+        """세션 평균을 로그 파일에 덧붙이고 메모리 색인에 반영"""
+        lines = []
+        for position, scores in sessions:
+            averages = self.session_averages(scores)
+            if position and averages:
+                lines.append(json.dumps([position, averages], ensure_ascii=False) + "\n")
+        if not lines:
+            return
+
+        with self._lock:
+            with open(self.index_path, 'ab') as f:
+                f.write("".join(lines).encode('utf-8'))
+            self._refresh()
+
+    def rank(self, position: str, topic: str, score: float) -> Optional[Dict]:
+        """score보다 낮은 점수의 비율(백분위)과 상위 비율 반환 (데이터가 없으면 None)"""
+        with self._lock:
+            self._refresh()
+            values = self._index.get(self._key(position, topic))
+            if not values:
+                return None
+            below = bisect.bisect_left(values, score)
+            at_or_below = bisect.bisect_right(values, score)
+            total = len(values)
+
+        # 동점은 절반만 아래로 계산 (중간 순위)
+        percentile = (below + (at_or_below - below) / 2) / total * 100
+        return {
+            "percentile": round(percentile, 1),
+            "top_percent": round(100 - percentile, 1),
+            "population": total,
+        }
+
+    def rank_session(self, position: str, scores: Dict[str, List[int]]) -> Dict[str, Dict]:
+        """세션의 주제별/전체 평균 점수 순위"""
+        result = {}
+        for topic, average in self.session_averages(scores).items():
+            ranking = self.rank(position, topic, average)
+            if ranking is not None:
+                result[topic] = dict(ranking, score=average)
+        return result
+
+    def _refresh(self) -> None:
+        """로그 파일에 새로 덧붙은 줄만 읽어 색인에 반영 (호출자가 _lock 보유)"""
+        try:
+            size = os.stat(self.index_path).st_size
+        except FileNotFoundError:
+            return
+        if size <= self._offset:
+            return
+        with open(self.index_path, 'rb') as f:
+            f.seek(self._offset)
+            data = f.read(size - self._offset)
+
+        # 다른 프로세스가 쓰는 중인 마지막 줄은 다음에 읽음
+        complete = data.rfind(b"\n") + 1
+        touched = set()
+        for line in data[:complete].splitlines():
+            try:
+                position, averages = json.loads(line)
+            except ValueError:
+                continue
+            for topic, average in averages.items():
+                key = self._key(position, topic)
+                self._index.setdefault(key, []).append(average)
+                touched.add(key)
+        # 새로 추가된 값이 적으면 거의 정렬된 상태이므로 정렬 비용이 작음
+        for key in touched:
+            self._index[key].sort()
+        self._offset += complete
+
+_shared_index: Optional[PercentileIndex] = None
+_shared_index_lock = threading.Lock()
+
+def get_percentile_index() -> PercentileIndex:
+    """프로세스 공용 백분위 색인 반환"""
+    global _shared_index
+    with _shared_index_lock:
+        if _shared_index is None:
+            _shared_index = PercentileIndex()
+        return _shared_index
@@ -0,0 +1,199 @@
+"""답변 점수 컬럼형 저장소 및 분석"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .backends import _FileLock
+from .models import StatisticsEvent
+from ..config.constants import StatisticsSettings
+
+# 고정 길이 레코드 (13바이트): 기록 시각, 포지션 코드, 주제 코드, 답변 순서, 점수
+SCORE_DTYPE = np.dtype([
+    ('timestamp', '<i8'),
+    ('position', '<u1'),
+    ('topic', '<u2'),
+    ('turn', '<u1'),
+    ('score', '<u1'),
+])
+
+MAX_SCORE = 5
+
+class ScoreStore:
+    """(포지션, 주제, 답변 순서)별 점수를 고정 길이 레코드로 덧붙이는 저장소
+
+    포지션/주제 이름은 별도 사전 파일의 정수 코드로 저장하므로 레코드가 작고,
+    조회 시 파일 전체를 NumPy 배열로 한 번에 읽어 벡터 연산으로 집계합니다.
+    읽은 배열은 파일 크기가 바뀔 때까지 재사용합니다.
+    """
+
+    def __init__(self, stats_dir: str = StatisticsSettings.STATS_DIR):
+        self.stats_dir = Path(stats_dir)
+        self.stats_dir.mkdir(parents=True, exist_ok=True)
+        self.data_path = self.stats_dir / StatisticsSettings.SCORE_FILE
+        self.vocab_path = self.stats_dir / StatisticsSettings.SCORE_VOCAB_FILE
+        self._lock = threading.Lock()
+        self._vocab: Dict[str, List[str]] = {"positions": [], "topics": []}
+        self._vocab_mtime: Optional[int] = None
+        self._cached: Optional[Tuple[int, np.ndarray]] = None
+
+    def append(self, position: str, scores: Dict[str, List[int]], timestamp: Optional[float] = None) -> int:
+        """세션의 주제별 점수 기록 후 기록한 레코드 수 반환"""
+        records = self._records(position, scores, timestamp if timestamp is not None else time.time())
+        return self._write(records)
+
+    def record_batch(self, events: List[StatisticsEvent]) -> int:
+        """통계 이벤트 묶음의 점수를 한 번에 기록 (지연 쓰기 버퍼에서 호출)"""
+        records = [
+            self._records(event.position, event.scores, event.timestamp.timestamp())
+            for event in events if event.scores
+        ]
+        if not records:
+            return 0
+        return self._write(np.concatenate(records))
+
+    def _records(self, position: Optional[str], scores: Dict[str, List[int]], timestamp: float) -> np.ndarray:
+        """세션 점수를 고정 길이 레코드 배열로 변환"""
+        rows = [
+            (topic, turn, score)
+            for topic, topic_scores in scores.items()
+            for turn, score in enumerate(topic_scores)
+            if topic and score is not None
+        ]
+        if not position or not rows:
+            return np.empty(0, dtype=SCORE_DTYPE)
+
+        records = np.empty(len(rows), dtype=SCORE_DTYPE)
+        records['timestamp'] = int(timestamp)
+        with self._lock:
+            position_code = self._code("positions", position)
+            records['position'] = position_code
+            records['topic'] = [self._code("topics", topic) for topic, _, _ in rows]
+        records['turn'] = [min(turn, 255) for _, turn, _ in rows]
+        records['score'] = [max(0, min(int(score), MAX_SCORE)) for _, _, score in rows]
+        return records
+
+    def _write(self, records: np.ndarray) -> int:
+        """레코드 덧붙이기 후 기록한 레코드 수 반환"""
+        if len(records) == 0:
+            return 0
+        # 한 번의 write로 덧붙여 여러 프로세스가 동시에 기록해도 레코드가 섞이지 않음
+        with open(self.data_path, 'ab') as f:
+            f.write(records.tobytes())
+        return len(records)
+
+    def load(self) -> np.ndarray:
+        """전체 레코드 배열 (파일이 바뀌지 않았으면 캐시 사용)"""
+        try:
+            size = os.stat(self.data_path).st_size
+        except FileNotFoundError:
+            return np.empty(0, dtype=SCORE_DTYPE)
+
+        with self._lock:
+            if self._cached is not None and self._cached[0] == size:
+                return self._cached[1]
+            # 쓰는 중인 마지막 레코드는 제외
+            count = size // SCORE_DTYPE.itemsize
+            records = np.fromfile(self.data_path, dtype=SCORE_DTYPE, count=count)
+            self._cached = (size, records)
+            return records
+
+    def topic_analytics(
+        self,
+        position: Optional[str] = None,
+        since: Optional[float] = None,
+        percentiles: Tuple[int, ...] = (50, 90)
+    ) -> Dict[str, Dict]:
+        """주제별 점수 건수, 평균, 백분위수, 점수 분포"""
+        records = self.load()
+        with self._lock:
+            self._refresh_vocab()
+            positions = list(self._vocab["positions"])
+            topics = list(self._vocab["topics"])
+
+        mask = np.ones(len(records), dtype=bool)
+        if position is not None:
+            if position not in positions:
+                return {}
+            mask &= records['position'] == positions.index(position)
+        if since is not None:
+            mask &= records['timestamp'] >= since
+        selected = records[mask]
+        if len(selected) == 0:
+            return {}
+
+        topic_codes = selected['topic'].astype(np.intp)
+        score_values = selected['score'].astype(np.intp)
+        num_topics = len(topics)
+
+        counts = np.bincount(topic_codes, minlength=num_topics)
+        sums = np.bincount(topic_codes, weights=score_values, minlength=num_topics)
+        distribution = np.bincount(
+            topic_codes * (MAX_SCORE + 1) + score_values,
+            minlength=num_topics * (MAX_SCORE + 1)
+        ).reshape(num_topics, MAX_SCORE + 1)
+
+        # 주제별로 정렬된 점수에서 누적 분포로 백분위수 계산 (최근접 순위 방식)
+        cumulative = np.cumsum(distribution, axis=1)
+        percentile_values = {}
+        for p in percentiles:
+            rank = np.maximum(np.ceil(counts * p / 100.0), 1)[:, None]
+            percentile_values[p] = np.argmax(cumulative >= rank, axis=1)
+
+        result = {}
+        for code in np.nonzero(counts)[0]:
+            result[topics[code]] = {
+                "count": int(counts[code]),
+                "mean": round(float(sums[code] / counts[code]), 2),
+                **{f"p{p}": int(values[code]) for p, values in percentile_values.items()},
+                "distribution": {
+                    str(score): int(distribution[code, score]) for score in range(1, MAX_SCORE + 1)
+                },
+            }
+        return result
+
+    def _code(self, kind: str, name: str) -> int:
+        """이름의 정수 코드 (처음 보는 이름이면 사전에 추가, 호출자가 _lock 보유)"""
+        self._refresh_vocab()
+        if name in self._vocab[kind]:
+            return self._vocab[kind].index(name)
+
+        # 다른 프로세스가 먼저 추가했을 수 있으므로 잠금 후 다시 읽고 추가
+        with _FileLock(self.stats_dir / ".scores_vocab.lock"):
+            self._vocab_mtime = None
+            self._refresh_vocab()
+            if name not in self._vocab[kind]:
+                self._vocab[kind].append(name)
+                tmp_path = self.vocab_path.with_suffix(".json.tmp")
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._vocab, f, ensure_ascii=False)
+                os.replace(tmp_path, self.vocab_path)
+            return self._vocab[kind].index(name)
+
+    def _refresh_vocab(self) -> None:
+        """사전 파일이 바뀌었으면 다시 읽기 (호출자가 _lock 보유)"""
+        try:
+            mtime = os.stat(self.vocab_path).st_mtime_ns
+        except FileNotFoundError:
+            return
+        if mtime == self._vocab_mtime:
+            return
+        with open(self.vocab_path, 'r', encoding='utf-8') as f:
+            self._vocab = json.load(f)
+        self._vocab_mtime = mtime
+
+_shared_store: Optional[ScoreStore] = None
+_shared_store_lock = threading.Lock()
+
+def get_score_store() -> ScoreStore:
+    """프로세스 공용 점수 저장소 반환"""
+    global _shared_store
+    with _shared_store_lock:
+        if _shared_store is None:
+            _shared_store = ScoreStore()
+        return _shared_store
@@ -0,0 +1,229 @@
+"""프로세스별 샤드 파일에 기록하는 G-counter 통계 저장소"""
+
+import json
+import os
+import socket
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from .backends import StatisticsBackend, _FileLock, apply_event, default_stats, merge_stats, fcntl
+from .models import StatisticsEvent
+from ..config.constants import StatisticsSettings
+
+def default_shard_id() -> str:
+    """샤드 식별자 (STATS_SHARD_ID 환경 변수가 있으면 재시작 후에도 같은 샤드 사용)
+
+    기본값은 프로세스마다 달라지지만, 종료된 프로세스의 샤드는 이후 기동하는
+    프로세스가 기본 샤드로 합치고 삭제하므로 샤드 파일이 계속 늘어나지 않습니다.
+    """
+    return os.getenv('STATS_SHARD_ID') or f"{socket.gethostname()}-{os.getpid()}"
+
+class ShardedCounterBackend(StatisticsBackend):
+    """샤드별 증가 전용 카운터(G-counter) 저장소
+
+    여러 노드/프로세스가 같은 디렉토리를 공유해도 각 프로세스는 자기 샤드 파일만
+    쓰므로 쓰기 경합이나 갱신 유실이 없습니다. 각 샤드의 카운터는 증가만 하며,
+    전체 값은 모든 샤드의 합입니다. 조회 시에는 변경된 샤드 파일만 다시 읽어
+    병합 결과를 캐시합니다.
+
+    각 프로세스는 살아 있는 동안 자기 샤드의 잠금 파일(shard-<id>.lock)을 잡고 있습니다.
+    생성 시와 cleanup() 시 잠금을 잡을 수 있는(소유 프로세스가 종료된) 샤드를 기본
+    샤드(base.json)에 합친 뒤 삭제합니다. 같은 식별자로 재시작한 경우 이전 카운터도
+    기본 샤드로 합치고 자기 샤드는 비운 상태에서 시작합니다. 합친 샤드 식별자를 기본
+    샤드에 먼저 기록하고 삭제하므로 중간에 종료되어도 두 번 합산되지 않습니다.
+    fcntl이 없는 환경에서는 생존 여부를 알 수 없어 자기 식별자의 샤드만 합칩니다.
+    """
+
+    def __init__(
+        self,
+        stats_dir: str = StatisticsSettings.STATS_DIR,
+        shard_id: Optional[str] = None
+    ):
+        self.shard_dir = Path(stats_dir) / StatisticsSettings.SHARD_DIR
+        self.shard_dir.mkdir(parents=True, exist_ok=True)
+        self.shard_id = shard_id or default_shard_id()
+        self.shard_path = self.shard_dir / f"shard-{self.shard_id}.json"
+        self.base_path = self.shard_dir / StatisticsSettings.SHARD_BASE_FILE
+        self._lock = threading.Lock()
+        self._owner_lock = None
+        with _FileLock(self.shard_dir / ".fold.lock"):
+            self._owner_lock = self._try_lock(self.shard_dir / f"shard-{self.shard_id}.lock")
+            if self._owner_lock is None:
+                raise RuntimeError(f"통계 샤드 {self.shard_id}를 다른 프로세스가 사용 중입니다.")
+            # 이전 실행의 자기 샤드와 종료된 프로세스의 샤드를 기본 샤드로 합침
+            self._fold_dead_shards(include_own=True)
+        # 자기 샤드의 카운터 (이전 값은 기본 샤드에 있으므로 비운 상태에서 증가)
+        self._days: Dict[str, Dict] = {}
+        # 샤드 파일별 (시그니처, 일별 카운터)
+        self._shards: Dict[str, Tuple[Optional[Tuple[int, int]], Dict[str, Dict]]] = {}
+        self._merged: Optional[Dict[str, Dict]] = None
+        self._merged_version: Optional[Hashable] = None
+
+    def record(self, event: StatisticsEvent) -> None:
+        self.record_batch([event])
+
+    def record_batch(self, events: List[StatisticsEvent]) -> None:
+        if not events:
+            return
+        with self._lock:
+            for event in events:
+                day = event.day.isoformat()
+                if day not in self._days:
+                    self._days[day] = default_stats()
+                apply_event(self._days[day], event)
+            self._write_shard()
+
+    def load(self, day: date) -> Dict:
+        stats = default_stats()
+        merged = self._merged_days().get(day.isoformat())
+        if merged:
+            merge_stats(stats, merged)
+        return stats
+
+    def load_range(self, start: date, end: date) -> Dict:
+        stats = default_stats()
+        for day, day_stats in self._merged_days().items():
+            if start <= date.fromisoformat(day) <= end:
+                merge_stats(stats, day_stats)
+        return stats
+
+    def cleanup(self, before: date) -> None:
+        # 살아 있는 다른 샤드는 각 소유 프로세스가 정리
+        with self._lock:
+            self._days = self._keep_since(self._days, before)
+            self._write_shard()
+        with _FileLock(self.shard_dir / ".fold.lock"):
+            self._fold_dead_shards(before)
+
+    def version(self) -> Optional[Hashable]:
+        signatures = []
+        for entry in os.scandir(self.shard_dir):
+            is_shard = entry.name.startswith("shard-") and entry.name.endswith(".json")
+            if not (is_shard or entry.name == StatisticsSettings.SHARD_BASE_FILE):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            signatures.append((entry.name, stat.st_mtime_ns, stat.st_size))
+        return tuple(sorted(signatures))
+
+    def _merged_days(self) -> Dict[str, Dict]:
+        """모든 샤드를 합친 일별 카운터 (샤드가 바뀌지 않았으면 캐시 사용)"""
+        version = self.version()
+        with self._lock:
+            if self._merged is not None and version == self._merged_version:
+                return self._merged
+
+            shards = {}
+            for name, mtime_ns, size in version:
+                path = self.shard_dir / name
+                signature = (mtime_ns, size)
+                cached = self._shards.get(name)
+                if cached is not None and cached[0] == signature:
+                    shards[name] = cached
+                else:
+                    shards[name] = (signature, self._read_shard(path).get("days", {}))
+            self._shards = shards
+
+            merged: Dict[str, Dict] = {}
+            for _, days in shards.values():
+                for day, day_stats in days.items():
+                    if day not in merged:
+                        merged[day] = default_stats()
+                    merge_stats(merged[day], day_stats)
+            self._merged = merged
+            self._merged_version = version
+            return merged
+
+    def _fold_dead_shards(self, before: Optional[date] = None, include_own: bool = False) -> None:
+        """종료된 샤드를 기본 샤드에 합치고 삭제 (호출자가 .fold.lock 보유)
+
+        include_own이면 이전 실행이 남긴 자기 샤드도 합치고, before가 주어지면
+        기본 샤드에서 그 이전 날짜를 정리합니다.
+        """
+        base = self._read_shard(self.base_path)
+        days: Dict[str, Dict] = base.get("days", {})
+        # 이미 합쳤지만 삭제 전에 중단된 샤드 (다시 합치지 않고 삭제만)
+        folded = set(base.get("folded", []))
+
+        dead = []
+        for path in sorted(self.shard_dir.glob("shard-*.json")):
+            shard_id = path.name[len("shard-"):-len(".json")]
+            if shard_id == self.shard_id:
+                if include_own:
+                    dead.append((shard_id, path, None))
+                continue
+            lock = self._try_lock(path.with_suffix(".lock")) if fcntl is not None else None
+            if lock is not None:
+                dead.append((shard_id, path, lock))
+
+        try:
+            for shard_id, path, _ in dead:
+                if shard_id in folded:
+                    continue
+                for day, day_stats in self._read_shard(path).get("days", {}).items():
+                    if day not in days:
+                        days[day] = default_stats()
+                    merge_stats(days[day], day_stats)
+                folded.add(shard_id)
+            if before is not None:
+                days = self._keep_since(days, before)
+            if dead or before is not None:
+                self._write_json(self.base_path, {"days": days, "folded": sorted(folded)})
+
+            for shard_id, path, lock in dead:
+                path.unlink(missing_ok=True)
+                if lock is not None:
+                    path.with_suffix(".lock").unlink(missing_ok=True)
+            if folded:
+                # 삭제를 마친 샤드 식별자는 지워서 같은 식별자로 다시 기록할 수 있게 함
+                self._write_json(self.base_path, {"days": days, "folded": []})
+        finally:
+            for _, _, lock in dead:
+                if lock is not None:
+                    lock.close()
+
+    def _write_shard(self) -> None:
+        """자기 샤드 파일을 원자적으로 저장 (호출자가 _lock 보유)"""
+        self._write_json(self.shard_path, {
+            "shard_id": self.shard_id,
+            "updated_at": datetime.now().isoformat(),
+            "days": self._days
+        })
+
+    @staticmethod
+    def _write_json(path: Path, data: Dict) -> None:
+        """JSON 파일을 원자적으로 저장"""
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _keep_since(days: Dict[str, Dict], before: date) -> Dict[str, Dict]:
+        """before 이후 날짜의 카운터만 남김"""
+        return {day: stats for day, stats in days.items() if date.fromisoformat(day) >= before}
+
+    @staticmethod
+    def _try_lock(path: Path):
+        """잠금 파일을 기다리지 않고 배타 잠금 (다른 프로세스가 잡고 있으면 None)"""
+        file = open(path, 'a')
+        if fcntl is None:
+            return file
+        try:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            file.close()
+            return None
+        return file
+
+    @staticmethod
+    def _read_shard(path: Path) -> Dict:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
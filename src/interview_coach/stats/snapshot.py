@@ -0,0 +1,102 @@
+"""세대 번호 기반 통계 스냅샷 캐시"""
+
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from datetime import date
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+from .backends import StatisticsBackend
+from ..config.constants import StatisticsSettings
+
+class StatisticsSnapshotCache:
+    """프로세스 공용 통계 스냅샷
+
+    조회 결과를 (세대 번호, 저장소 버전)과 함께 보관합니다.
+    - 같은 프로세스의 기록은 invalidate()로 세대 번호를 올려 즉시 무효화
+    - 다른 프로세스의 기록은 저장소 version()(파일 stat 수준)이 바뀌어 무효화
+    따라서 조회는 버전 확인 O(1) 후 캐시된 스냅샷을 그대로 반환하고, 실제로
+    바뀐 경우에만 저장소를 다시 읽습니다. 버전을 알 수 없는 저장소는
+    fallback_ttl 동안만 스냅샷을 재사용합니다. 키(일자/기간)마다 최신 스냅샷
+    하나만 두고, 키 수는 max_entries로 제한해 가장 오래 조회되지 않은 키부터 버립니다.
+    """
+
+    def __init__(
+        self,
+        backend: StatisticsBackend,
+        fallback_ttl: float = StatisticsSettings.SNAPSHOT_FALLBACK_TTL,
+        clock: Callable[[], float] = time.monotonic,
+        max_entries: int = StatisticsSettings.SNAPSHOT_MAX_ENTRIES
+    ):
+        self.backend = backend
+        self.fallback_ttl = fallback_ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._snapshots: "OrderedDict[Tuple, Tuple[int, Optional[Hashable], float, Dict]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def generation(self) -> int:
+        """현재 세대 번호"""
+        with self._lock:
+            return self._generation
+
+    def invalidate(self) -> None:
+        """기록 후 호출하여 모든 스냅샷 무효화"""
+        with self._lock:
+            self._generation += 1
+
+    def get_day(self, day: date) -> Dict:
+        """일별 통계 스냅샷"""
+        return self._get(("day", day), lambda: self.backend.load(day))
+
+    def get_range(self, start: date, end: date) -> Dict:
+        """기간 통계 스냅샷"""
+        return self._get(("range", start, end), lambda: self.backend.load_range(start, end))
+
+    def _get(self, key: Tuple, load: Callable[[], Dict]) -> Dict:
+        version = self.backend.version()
+        now = self._clock()
+        with self._lock:
+            generation = self._generation
+            cached = self._snapshots.get(key)
+            if cached is not None and self._is_fresh(cached, generation, version, now):
+                self.hits += 1
+                self._snapshots.move_to_end(key)
+                return cached[3]
+            self.misses += 1
+
+        stats = load()
+        with self._lock:
+            # 읽는 동안 세대가 바뀌었으면 다음 조회에서 다시 읽도록 이전 세대로 저장
+            self._snapshots[key] = (generation, version, now, stats)
+            self._snapshots.move_to_end(key)
+            while len(self._snapshots) > self.max_entries:
+                self._snapshots.popitem(last=False)
+        return stats
+
+    def _is_fresh(self, cached: Tuple, generation: int, version: Optional[Hashable], now: float) -> bool:
+        cached_generation, cached_version, loaded_at, _ = cached
+        if cached_generation != generation:
+            return False
+        if version is None:
+            return now - loaded_at < self.fallback_ttl
+        return cached_version == version
+
+_snapshot_caches: "weakref.WeakKeyDictionary[StatisticsBackend, StatisticsSnapshotCache]" = (
+    weakref.WeakKeyDictionary()
+)
+_snapshot_caches_lock = threading.Lock()
+
+def get_snapshot_cache(backend: StatisticsBackend) -> StatisticsSnapshotCache:
+    """저장소별 프로세스 공용 스냅샷 캐시 반환"""
+    with _snapshot_caches_lock:
+        cache = _snapshot_caches.get(backend)
+        if cache is None:
+            cache = StatisticsSnapshotCache(backend)
+            _snapshot_caches[backend] = cache
+        return cache
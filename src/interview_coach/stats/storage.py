@@ -1,100 +1,120 @@
-import json
-import os
+import threading
+import time
 from pathlib import Path
-from datetime import datetime, date
-from typing import Dict, Optional
+from datetime import date, timedelta
+from typing import Dict, List, Optional
 import streamlit as st
 
+from .backends import StatisticsBackend, create_backend, default_stats
+from .models import StatisticsEvent
+from .ranking import PercentileIndex, get_percentile_index
+from .scores import ScoreStore, get_score_store
+from .snapshot import get_snapshot_cache
+from .write_behind import BufferedStatisticsBackend
+from ..config.constants import StatisticsSettings
+
+_shared_backend: Optional[StatisticsBackend] = None
+_shared_backend_lock = threading.Lock()
+
+def get_statistics_backend() -> StatisticsBackend:
+    """프로세스 공용 통계 저장소 반환 (설정에 따라 지연 쓰기 버퍼 적용)"""
+    global _shared_backend
+    with _shared_backend_lock:
+        if _shared_backend is None:
+            backend = create_backend(StatisticsSettings.BACKEND, StatisticsSettings.STATS_DIR)
+            if StatisticsSettings.WRITE_BEHIND:
+                # 점수 저장소/순위 색인도 같은 버퍼에서 묶어서 기록
+                backend = BufferedStatisticsBackend(
+                    backend, sinks=[get_score_store(), get_percentile_index()]
+                )
+            _shared_backend = backend
+        return _shared_backend
+
 class FileStatisticsManager:
     """파일 기반 통계 관리자"""
     
-    def __init__(self):
-        self.stats_dir = Path(".streamlit/statistics")
-        self.daily_stats_file = self.stats_dir / f"stats_{date.today()}.json"
+    def __init__(self, backend: Optional[StatisticsBackend] = None,
+                 score_store: Optional[ScoreStore] = None,
+                 ranking: Optional[PercentileIndex] = None):
+        self.stats_dir = Path(StatisticsSettings.STATS_DIR)
+        self.backend = backend
+        self.score_store = score_store
+        self.ranking = ranking
         self.initialize_storage()
+        self.snapshots = get_snapshot_cache(self.backend) if self.backend else None
 
     def initialize_storage(self):
         """저장소 초기화"""
         try:
-            self.stats_dir.mkdir(parents=True, exist_ok=True)
-            if not self.daily_stats_file.exists():
-                self._save_stats(self._get_default_stats())
+            if self.backend is None:
+                self.backend = get_statistics_backend()
+            if self.score_store is None:
+                self.score_store = get_score_store()
+            if self.ranking is None:
+                self.ranking = get_percentile_index()
         except Exception as e:
             st.warning(f"통계 저장소 초기화 중 오류 발생: {str(e)}")
 
+    def _direct_sinks(self) -> List:
+        """update_statistics에서 직접 기록해야 하는 점수 저장소/순위 색인"""
+        buffered_sinks = getattr(self.backend, 'sinks', [])
+        return [
+            sink for sink in (self.score_store, self.ranking)
+            if not any(sink is buffered for buffered in buffered_sinks)
+        ]
+
     @staticmethod
     def _get_default_stats() -> Dict:
         """기본 통계 데이터 구조"""
-        return {
-            "total_interviews": 0,
-            "completed_interviews": 0,
-            "position_distribution": {
-                "프론트엔드": 0,
-                "백엔드": 0,
-                "풀스택": 0
-            },
-            "success_count": 0,
-            "last_updated": datetime.now().isoformat()
-        }
+        return default_stats()
 
-    def _load_stats(self) -> Dict:
+    def _load_stats(self, day: Optional[date] = None) -> Dict:
         """통계 데이터 로드"""
         try:
-            if self.daily_stats_file.exists():
-                with open(self.daily_stats_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            return self._get_default_stats()
+            return self.backend.load(day or date.today())
         except Exception as e:
             st.warning(f"통계 데이터 로드 중 오류 발생: {str(e)}")
             return self._get_default_stats()
 
-    def _save_stats(self, stats: Dict):
-        """통계 데이터 저장"""
-        try:
-            stats["last_updated"] = datetime.now().isoformat()
-            with open(self.daily_stats_file, 'w', encoding='utf-8') as f:
-                json.dump(stats, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            st.warning(f"통계 데이터 저장 중 오류 발생: {str(e)}")
-
-    # 캐시 데코레이터를 클래스 메서드에 맞게 수정
-    @staticmethod
-    @st.cache_data(ttl=300)  # 5분간 캐시
-    def _get_cached_stats(file_path: str) -> Dict:
-        """캐시된 통계 데이터 반환"""
+    def _get_cached_stats(self, start: date, end: date) -> Dict:
+        """스냅샷 캐시를 통한 통계 데이터 반환"""
         try:
-            if Path(file_path).exists():
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+            if start == end:
+                return self.snapshots.get_day(end)
+            return self.snapshots.get_range(start, end)
         except Exception:
             pass
-        return FileStatisticsManager._get_default_stats()
+        return self._get_default_stats()
 
-    def update_statistics(self, session) -> None:
-        """면접 세션 완료 시 통계 업데이트"""
-        stats = self._load_stats()
-        
-        # 전체 면접 수 증가
-        stats["total_interviews"] += 1
-        
-        # 포지션 분포 업데이트
-        if session.position:
-            stats["position_distribution"][session.position] += 1
-        
-        # 완료된 면접 통계
-        if session.interview_complete:
-            stats["completed_interviews"] += 1
-            
-            # 성공 여부 확인 및 업데이트
-            if self._check_session_success(session):
-                stats["success_count"] += 1
-        
-        self._save_stats(stats)
+    def update_statistics(self, session) -> Dict[str, Dict]:
+        """면접 세션 완료 시 통계 업데이트 후 이 세션을 넣기 전의 점수 순위 반환"""
+        # 순위 색인은 지연 쓰기 반영 시점에 갱신되므로 기록 전에 계산해야 항상 같은 모집단과 비교
+        ranking = self.get_score_ranking(session)
+        event = StatisticsEvent(
+            position=session.position,
+            completed=session.interview_complete,
+            success=session.interview_complete and self._check_session_success(session),
+            score=self._average_score(session),
+            scores={topic: list(scores) for topic, scores in session.scores.items()}
+        )
+        try:
+            self.backend.record(event)
+            # 지연 쓰기 버퍼가 함께 기록하지 않는 저장소만 바로 기록
+            for sink in self._direct_sinks():
+                sink.record_batch([event])
+        except Exception as e:
+            st.warning(f"통계 데이터 저장 중 오류 발생: {str(e)}")
+        finally:
+            if self.snapshots:
+                self.snapshots.invalidate()
+        return ranking
 
-    def get_statistics_summary(self) -> Dict:
-        """통계 데이터 요약"""
+    def get_statistics_summary(self, start: Optional[date] = None, end: Optional[date] = None) -> Dict:
+        """통계 데이터 요약 (기간을 지정하지 않으면 오늘)"""
         # 캐시된 통계 데이터 가져오기
-        stats = self._get_cached_stats(str(self.daily_stats_file))
+        end = end or date.today()
+        start = start or end
+        stats = self._get_cached_stats(start, end)
         
         # 비율 계산
         completion_rate = (
@@ -110,33 +130,55 @@ class FileStatisticsManager:
         return {
             "total_interviews": stats["total_interviews"],
             "completion_rate": round(completion_rate, 1),
-            "position_distribution": stats["position_distribution"],
+            "position_distribution": dict(stats["position_distribution"]),
             "success_rate": round(success_rate, 1)
         }
 
+    def get_recent_summary(self, days: int) -> Dict:
+        """오늘을 포함한 최근 days일 통계 요약"""
+        today = date.today()
+        return self.get_statistics_summary(today - timedelta(days=days - 1), today)
+
+    def get_range_summaries(self, ranges: Optional[Dict[str, int]] = None) -> Dict[str, Dict]:
+        """대시보드 기간 선택용 기간별 통계 요약"""
+        ranges = ranges or StatisticsSettings.DASHBOARD_RANGES
+        return {label: self.get_recent_summary(days) for label, days in ranges.items()}
+
+    def get_score_analytics(self, position: Optional[str] = None, days: Optional[int] = None) -> Dict[str, Dict]:
+        """주제별 점수 평균/백분위수/분포"""
+        since = time.time() - days * 86400 if days else None
+        try:
+            return self.score_store.topic_analytics(position=position, since=since)
+        except Exception as e:
+            st.warning(f"점수 통계 조회 중 오류 발생: {str(e)}")
+            return {}
+
+    def get_score_ranking(self, session) -> Dict[str, Dict]:
+        """같은 포지션 지원자 대비 세션 점수 백분위 (주제별 + 전체)"""
+        if not session.position:
+            return {}
+        try:
+            return self.ranking.rank_session(session.position, session.scores)
+        except Exception as e:
+            st.warning(f"점수 순위 조회 중 오류 발생: {str(e)}")
+            return {}
+
     def _check_session_success(self, session) -> bool:
         """면접 세션의 성공 여부 판단"""
         if not session.completed_topics or not session.final_feedback:
             return False
         
-        total_score = 0
-        num_scores = 0
-        
-        for topic, conversations in session.conversations.items():
-            for msg in conversations:
-                if msg.feedback and 'completion_score' in msg.feedback:
-                    total_score += msg.feedback['completion_score']
-                    num_scores += 1
-        
-        average_score = total_score / num_scores if num_scores > 0 else 0
+        average_score = self._average_score(session) or 0
         return average_score >= 4.0
 
-    def cleanup_old_stats(self, days_to_keep: int = 30):
-        """오래된 통계 파일 정리"""
+    @staticmethod
+    def _average_score(session) -> Optional[float]:
+        """세션의 평균 답변 점수 (점수가 없으면 None)"""
+        return session.get_average_score()
+
+    def cleanup_old_stats(self, days_to_keep: int = StatisticsSettings.DAYS_TO_KEEP):
+        """오래된 통계 정리"""
         try:
-            for stats_file in self.stats_dir.glob("stats_*.json"):
-                file_date = date.fromisoformat(stats_file.stem.split('_')[1])
-                if (date.today() - file_date).days > days_to_keep:
-                    stats_file.unlink()
+            self.backend.cleanup(date.today() - timedelta(days=days_to_keep))
         except Exception as e:
-            st.warning(f"오래된 통계 파일 정리 중 오류 발생: {str(e)}")
\ No newline at end of file
+            st.warning(f"오래된 통계 정리 중 오류 발생: {str(e)}")
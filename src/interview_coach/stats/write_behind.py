@@ -0,0 +1,244 @@
+"""통계 지연 쓰기(write-behind) 버퍼"""
+
+import atexit
+import json
+import os
+import socket
+import threading
+from datetime import date
+from pathlib import Path
+from typing import Dict, Hashable, List, Optional, Sequence
+
+from .backends import StatisticsBackend, apply_event
+from .models import StatisticsEvent
+from ..config.constants import StatisticsSettings
+
+class Durability:
+    """버퍼에 쌓인 통계의 장애 대비 수준"""
+    MEMORY = 'memory'  # 메모리에만 보관 (프로세스 비정상 종료 시 최대 FLUSH_INTERVAL 분량 유실)
+    SPOOL = 'spool'  # 로컬 스풀 파일에 덧붙인 뒤 버퍼링 (OS 장애가 아니면 재시작 시 복구)
+    FSYNC = 'fsync'  # 스풀 파일 기록마다 fsync (전원 장애에도 복구)
+
+class BufferedStatisticsBackend(StatisticsBackend):
+    """지연 쓰기 통계 저장소
+
+    record()는 이벤트를 메모리 버퍼에 넣고 바로 반환하며, 백그라운드 스레드가
+    주기(flush_interval), 버퍼 크기(batch_size), 프로세스 종료 시점에 모아서
+    내부 저장소의 record_batch()로 반영합니다. 조회는 아직 반영되지 않은 버퍼를
+    합산하므로 같은 프로세스에서는 기록 직후에도 값이 보입니다.
+
+    SPOOL/FSYNC 모드에서는 버퍼링 전에 프로세스별 스풀 파일에 기록하고, 시작 시
+    종료된 프로세스가 남긴 스풀을 다시 반영합니다(최소 1회 반영).
+
+    sinks는 같은 이벤트 묶음을 받는 추가 저장소(점수 저장소, 순위 색인 등, record_batch
+    구현)입니다. 내부 저장소 반영 후 차례로 전달하며, 실패한 저장소의 묶음은 해당
+    저장소에만 다음 반영 때 다시 전달합니다.
+    """
+
+    def __init__(
+        self,
+        inner: StatisticsBackend,
+        flush_interval: float = StatisticsSettings.FLUSH_INTERVAL,
+        batch_size: int = StatisticsSettings.FLUSH_BATCH_SIZE,
+        durability: str = StatisticsSettings.DURABILITY,
+        spool_dir: str = StatisticsSettings.STATS_DIR,
+        sinks: Sequence = ()
+    ):
+        self.inner = inner
+        self.sinks = list(sinks)
+        self._sink_backlog: Dict[int, List[StatisticsEvent]] = {}
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.durability = durability
+        self.spool_dir = Path(spool_dir)
+        self._condition = threading.Condition()
+        self._pending: List[StatisticsEvent] = []
+        self._flush_lock = threading.Lock()
+        self._closed = False
+        self._generation = 0
+        self._flushes = 0
+        self._flushed_events = 0
+
+        self._spool_path: Optional[Path] = None
+        if durability != Durability.MEMORY:
+            self.spool_dir.mkdir(parents=True, exist_ok=True)
+            self._spool_path = self.spool_dir / f"pending-{socket.gethostname()}-{os.getpid()}.jsonl"
+            self._recover_spools()
+
+        self._thread = threading.Thread(target=self._run, name="stats-write-behind", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def record(self, event: StatisticsEvent) -> None:
+        with self._condition:
+            if self._spool_path is not None:
+                self._append_spool([event])
+            self._pending.append(event)
+            self._generation += 1
+            if len(self._pending) >= self.batch_size:
+                self._condition.notify()
+
+    def load(self, day: date) -> Dict:
+        stats = self.inner.load(day)
+        for event in self._pending_snapshot():
+            if event.day == day:
+                apply_event(stats, event)
+        return stats
+
+    def load_range(self, start: date, end: date) -> Dict:
+        stats = self.inner.load_range(start, end)
+        for event in self._pending_snapshot():
+            if start <= event.day <= end:
+                apply_event(stats, event)
+        return stats
+
+    def cleanup(self, before: date) -> None:
+        self.flush()
+        self.inner.cleanup(before)
+
+    def version(self) -> Optional[Hashable]:
+        # 조회에 버퍼가 포함되므로 버퍼 변경도 버전에 반영
+        inner_version = self.inner.version()
+        if inner_version is None:
+            return None
+        with self._condition:
+            return inner_version, self._generation
+
+    def flush(self) -> int:
+        """버퍼를 내부 저장소와 추가 저장소에 반영하고 반영한 이벤트 수 반환"""
+        with self._flush_lock:
+            with self._condition:
+                batch, self._pending = self._pending, []
+                if not batch and not self._sink_backlog:
+                    return 0
+                # 반영 중 들어오는 이벤트는 새 스풀 파일에 기록
+                flushing_path = self._rotate_spool() if batch else None
+
+            if batch:
+                try:
+                    self.inner.record_batch(batch)
+                except Exception:
+                    # 실패한 배치는 버퍼 앞쪽으로 되돌려 다음 주기에 재시도
+                    with self._condition:
+                        self._pending[:0] = batch
+                        if flushing_path is not None:
+                            self._append_spool(batch)
+                            flushing_path.unlink(missing_ok=True)
+                    raise
+
+                if flushing_path is not None:
+                    flushing_path.unlink(missing_ok=True)
+                self._flushes += 1
+                self._flushed_events += len(batch)
+            self._record_sinks(batch)
+            return len(batch)
+
+    def _record_sinks(self, batch: List[StatisticsEvent]) -> None:
+        """추가 저장소에 반영 (실패한 저장소는 묶음을 남겨 다음 반영 때 재시도)"""
+        error = None
+        for index, sink in enumerate(self.sinks):
+            events = self._sink_backlog.pop(index, []) + batch
+            if not events:
+                continue
+            try:
+                sink.record_batch(events)
+            except Exception as e:
+                self._sink_backlog[index] = events
+                error = error or e
+        if error is not None:
+            raise error
+
+    def close(self) -> None:
+        """백그라운드 스레드 종료 및 남은 버퍼 반영"""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        self._thread.join(timeout=self.flush_interval + 5)
+        try:
+            self.flush()
+        except Exception:
+            # 스풀 파일이 남아 다음 시작 시 복구됨
+            pass
+
+    def metrics(self) -> Dict:
+        """버퍼 지표"""
+        with self._condition:
+            return {
+                'pending': len(self._pending),
+                'flushes': self._flushes,
+                'flushed_events': self._flushed_events,
+                'sink_backlog': sum(len(events) for events in self._sink_backlog.values()),
+                'durability': self.durability,
+            }
+
+    def _run(self) -> None:
+        """주기 또는 크기 기준으로 버퍼 반영"""
+        while True:
+            with self._condition:
+                if not self._closed and len(self._pending) < self.batch_size:
+                    self._condition.wait(self.flush_interval)
+                if self._closed:
+                    return
+            try:
+                self.flush()
+            except Exception:
+                # 저장소 장애 시 다음 주기에 재시도
+                pass
+
+    def _pending_snapshot(self) -> List[StatisticsEvent]:
+        with self._condition:
+            return list(self._pending)
+
+    def _append_spool(self, events: List[StatisticsEvent]) -> None:
+        """스풀 파일에 이벤트 기록 (호출자가 _condition 보유)"""
+        lines = "".join(json.dumps(event.to_dict(), ensure_ascii=False) + "\n" for event in events)
+        with open(self._spool_path, 'a', encoding='utf-8') as f:
+            f.write(lines)
+            if self.durability == Durability.FSYNC:
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _rotate_spool(self) -> Optional[Path]:
+        """현재 스풀 파일을 반영 중 파일로 교체 (호출자가 _condition 보유)"""
+        if self._spool_path is None or not self._spool_path.exists():
+            return None
+        flushing_path = self._spool_path.with_suffix(".flushing")
+        os.replace(self._spool_path, flushing_path)
+        return flushing_path
+
+    def _recover_spools(self) -> None:
+        """종료된 프로세스가 남긴 스풀 파일 반영"""
+        host = socket.gethostname()
+        for path in self.spool_dir.glob(f"pending-{host}-*"):
+            pid = path.name.split("-")[-1].split(".")[0]
+            if pid.isdigit() and int(pid) != os.getpid() and _process_alive(int(pid)):
+                continue
+            events = []
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        events.append(StatisticsEvent.from_dict(json.loads(line)))
+                    except (ValueError, KeyError):
+                        continue
+            if events:
+                self.inner.record_batch(events)
+                try:
+                    self._record_sinks(events)
+                except Exception:
+                    # 다음 반영 때 재시도
+                    pass
+            path.unlink(missing_ok=True)
+
+def _process_alive(pid: int) -> bool:
+    """같은 호스트의 프로세스 실행 여부"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
@@ -0,0 +1,189 @@
+"""대시보드 정적 파일 (내용 해시 파일명) 및 HTML 템플릿
+
+외부 라이브러리(React, ReactDOM, Tailwind)는 components/vendor/에 내려받아 두고,
+대시보드 컴포넌트 코드는 공백/주석을 제거해 하나의 번들로 만듭니다. 각 파일은
+내용 해시를 붙인 이름으로 Streamlit 정적 디렉토리(run.py 옆 static/)에 한 번만
+기록하므로 브라우저가 오래 캐시할 수 있습니다. HTML 템플릿은 root_id별로 처음
+렌더링할 때 한 번 만들어 두고, 렌더링마다 통계 JSON만 끼워 넣습니다.
+
+vendor 파일은 빌드 단계(개발 컨테이너 생성 시 --fetch)에서만 내려받고, 앱 실행 중에는
+네트워크를 사용하지 않습니다. vendor 파일이 없으면 오류를 기록하고 CDN을 사용합니다.
+
+    PYTHONPATH=src python -m interview_coach.ui.assets --fetch   # vendor 파일 내려받기 + 정적 파일 기록
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import logging
+import threading
+import urllib.request
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import streamlit as st
+
+from .components.react_components import DASHBOARD_COMPONENT
+from ..config.constants import AssetSettings
+
+logger = logging.getLogger(__name__)
+
+VENDOR_DIR = Path(__file__).parent / "components" / "vendor"
+# run.py가 있는 앱 루트 (Streamlit은 메인 스크립트 옆 static/ 디렉토리를 제공)
+APP_ROOT = Path(__file__).resolve().parents[3]
+
+# 통계 JSON을 읽어 대시보드를 그리는 진입점 (번들 끝에 포함)
+DASHBOARD_BOOTSTRAP = """
+function renderDashboard(rootId) {
+    const root = document.getElementById(rootId);
+    try {
+        const stats = JSON.parse(document.getElementById(rootId + '-data').textContent);
+        ReactDOM.render(React.createElement(StatisticsDashboard, { statistics: stats }), root);
+    } catch (error) {
+        console.error('렌더링 오류:', error);
+        root.innerHTML = `<div style="color: red; padding: 1rem;">오류 발생: ${error.message}<pre>${error.stack}</pre></div>`;
+    }
+}
+"""
+
+def minify_js(source: str) -> str:
+    """줄 앞 공백, 빈 줄, 한 줄 주석 제거 (여러 줄 템플릿 문자열이 없는 코드 전용)"""
+    lines = (line.strip() for line in source.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+def hashed_name(name: str, content: bytes) -> str:
+    """내용 해시를 붙인 파일명 (dashboard.js -> dashboard.<hash>.js)"""
+    digest = hashlib.sha256(content).hexdigest()[:AssetSettings.HASH_LENGTH]
+    stem, _, ext = name.partition(".")
+    return f"{stem}.{digest}.{ext}"
+
+def resolve_static_dir(static_dir: str = AssetSettings.STATIC_DIR) -> Path:
+    """정적 디렉토리 경로 (상대 경로는 실행 위치가 아니라 앱 루트 기준)"""
+    path = Path(static_dir)
+    return path if path.is_absolute() else APP_ROOT / path
+
+@lru_cache(maxsize=None)
+def _dashboard_bundle() -> bytes:
+    """대시보드 컴포넌트 번들 (한 번만 생성)"""
+    return minify_js(DASHBOARD_COMPONENT + DASHBOARD_BOOTSTRAP).encode("utf-8")
+
+def _load_assets() -> List[Tuple[str, bytes]]:
+    """(파일명, 내용) 목록 (로드 순서대로, 내려받지 않은 vendor 파일은 제외)"""
+    assets = []
+    for name in AssetSettings.VENDOR_ASSETS:
+        path = VENDOR_DIR / name
+        if path.exists():
+            assets.append((name, path.read_bytes()))
+    assets.append(("dashboard.js", _dashboard_bundle()))
+    return assets
+
+# 처음 기록할 때 vendor 디렉토리를 읽고 해시 계산 (이후 재사용)
+_HASHED: Dict[str, str] = {}
+_published = False
+_publish_lock = threading.Lock()
+
+def publish_assets(static_dir: str = AssetSettings.STATIC_DIR) -> Dict[str, str]:
+    """정적 디렉토리에 해시 파일명으로 기록 (이미 있으면 건너뜀) 후 파일명별 URL 반환"""
+    global _HASHED, _published
+    with _publish_lock:
+        if not _published:
+            missing = missing_vendor_assets()
+            if missing:
+                logger.error(
+                    "vendor 파일이 없어 CDN을 사용합니다: %s (빌드 단계에서 "
+                    "'python -m interview_coach.ui.assets --fetch'를 실행하세요)",
+                    ", ".join(missing)
+                )
+            assets = _load_assets()
+            hashed = {name: hashed_name(name, content) for name, content in assets}
+            target = resolve_static_dir(static_dir)
+            target.mkdir(parents=True, exist_ok=True)
+            for name, content in assets:
+                path = target / hashed[name]
+                if not path.exists():
+                    tmp_path = path.with_name(path.name + ".tmp")
+                    tmp_path.write_bytes(content)
+                    tmp_path.replace(path)
+            _HASHED = hashed
+            _published = True
+        return {name: f"{AssetSettings.STATIC_URL}/{hashed}" for name, hashed in _HASHED.items()}
+
+def _asset_tag(name: str, url: str) -> str:
+    if name.endswith(".css"):
+        return f'<link href="{url}" rel="stylesheet">'
+    return f'<script src="{url}"></script>'
+
+def _head_tags(static_serving: bool) -> str:
+    """vendor/대시보드 태그 (정적 제공이 꺼져 있거나 vendor 파일이 없으면 CDN/인라인 사용)"""
+    urls = publish_assets() if static_serving else {}
+    tags = [
+        _asset_tag(name, urls.get(name, cdn_url))
+        for name, cdn_url in AssetSettings.VENDOR_ASSETS.items()
+    ]
+    if static_serving:
+        tags.append(_asset_tag("dashboard.js", urls["dashboard.js"]))
+    else:
+        tags.append(f"<script>{_dashboard_bundle().decode('utf-8')}</script>")
+    return "\n".join(tags)
+
+@lru_cache(maxsize=None)
+def compile_dashboard_template(root_id: str, static_serving: bool) -> Tuple[str, str]:
+    """통계 JSON 앞/뒤 HTML 조각 (root_id별로 한 번만 생성)"""
+    root_id = html.escape(root_id)
+    prefix = f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+{_head_tags(static_serving)}
+<style>body {{ margin: 0; padding: 1rem; }}</style>
+</head>
+<body>
+<div id="{root_id}"></div>
+<script type="application/json" id="{root_id}-data">"""
+    suffix = f"""</script>
+<script>renderDashboard('{root_id}');</script>
+</body>
+</html>"""
+    return prefix, suffix
+
+def render_dashboard_html(root_id: str, data: dict) -> str:
+    """통계 대시보드 HTML (템플릿은 재사용하고 통계 JSON만 새로 직렬화)"""
+    static_serving = bool(st.get_option("server.enableStaticServing"))
+    prefix, suffix = compile_dashboard_template(root_id, static_serving)
+    # </script> 로 스크립트 태그가 끝나지 않도록 이스케이프
+    payload = json.dumps(data, ensure_ascii=False).replace("</", "<\\/")
+    return prefix + payload + suffix
+
+def missing_vendor_assets() -> List[str]:
+    """vendor 디렉토리에 없는 외부 라이브러리 파일명 목록"""
+    return [name for name in AssetSettings.VENDOR_ASSETS if not (VENDOR_DIR / name).exists()]
+
+def fetch_vendor_assets(timeout: float = AssetSettings.FETCH_TIMEOUT) -> List[str]:
+    """외부 라이브러리를 vendor 디렉토리에 내려받고 받은 파일명 목록 반환 (빌드 단계 전용)"""
+    VENDOR_DIR.mkdir(parents=True, exist_ok=True)
+    fetched = []
+    for name, url in AssetSettings.VENDOR_ASSETS.items():
+        path = VENDOR_DIR / name
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            content = response.read()
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(content)
+        tmp_path.replace(path)
+        fetched.append(name)
+    return fetched
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--fetch', action='store_true', help='정적 파일 기록 전에 vendor 파일 내려받기')
+    parser.add_argument('--static-dir', default=AssetSettings.STATIC_DIR)
+    args = parser.parse_args()
+
+    if args.fetch:
+        print("내려받음:", ", ".join(fetch_vendor_assets()))
+    for name, url in publish_assets(args.static_dir).items():
+        print(f"{name:<30} {url}")
+
+if __name__ == "__main__":
+    main()
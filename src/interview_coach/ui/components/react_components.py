@@ -98,10 +98,26 @@ function StatisticsDashboard(props) {
         success_rate: 0
     };
 
-    const stats = props.statistics || defaultStats;
+    const ranges = (props.statistics && props.statistics.ranges) || {};
+    const rangeLabels = Object.keys(ranges);
+    const [selectedRange, setSelectedRange] = React.useState(rangeLabels[0]);
+
+    const stats = ranges[selectedRange] || props.statistics || defaultStats;
+    const scoreAnalytics = Object.entries((props.statistics && props.statistics.score_analytics) || {});
 
     return React.createElement('div', { className: 'space-y-6' }, [
 
+        // 기간 선택
+        rangeLabels.length > 0 && React.createElement('div', {
+            className: 'flex gap-2'
+        }, rangeLabels.map(label =>
+            React.createElement('button', {
+                key: label,
+                onClick: () => setSelectedRange(label),
+                className: `px-3 py-1 rounded-full text-sm ${label === selectedRange ? 'bg-blue-600 text-white' : 'bg-gray-100 text-gray-700'}`
+            }, label)
+        )),
+
         React.createElement('div', {
             className: 'grid grid-cols-1 md:grid-cols-3 gap-4'
         }, [
@@ -143,6 +159,37 @@ function StatisticsDashboard(props) {
                     }, count)
                 ])
             ))
+        ]),
+
+        // 주제별 점수 분석
+        scoreAnalytics.length > 0 && React.createElement('div', {
+            className: 'bg-white rounded-lg p-6 shadow-md'
+        }, [
+            React.createElement('h3', {
+                className: 'text-lg font-semibold text-gray-700 mb-4'
+            }, '주제별 답변 점수'),
+            React.createElement('table', {
+                className: 'w-full text-sm text-left'
+            }, [
+                React.createElement('thead', { key: 'head' },
+                    React.createElement('tr', { className: 'text-gray-500' },
+                        ['주제', '답변 수', '평균', '중앙값', '상위 10%'].map(label =>
+                            React.createElement('th', { key: label, className: 'py-1' }, label)
+                        )
+                    )
+                ),
+                React.createElement('tbody', { key: 'body' },
+                    scoreAnalytics.map(([topic, stat]) =>
+                        React.createElement('tr', { key: topic, className: 'border-t' }, [
+                            React.createElement('td', { key: 'topic', className: 'py-1' }, topic),
+                            React.createElement('td', { key: 'count' }, stat.count),
+                            React.createElement('td', { key: 'mean', className: 'text-blue-600 font-semibold' }, stat.mean),
+                            React.createElement('td', { key: 'p50' }, stat.p50),
+                            React.createElement('td', { key: 'p90' }, stat.p90)
+                        ])
+                    )
+                )
+            ])
         ])
     ]);
 }
@@ -1,18 +1,21 @@
 """UI 렌더링 함수"""
 
-from typing import List
+from typing import Dict, Iterable, List, Optional, Union
 
 import streamlit as st
 import streamlit.components.v1 as components
 
 from ..core.models import Conversation
+from ..stats.ranking import OVERALL
 from .components.react_components import DASHBOARD_COMPONENT
 
-def render_conversation(messages: List[Conversation]) -> None:
-    """대화형 UI 렌더링"""
-    if not messages:
-        return
-        
+def render_conversation(messages: List[Conversation],
+                        streaming_reply: Optional[Iterable[str]] = None) -> Optional[str]:
+    """대화형 UI 렌더링
+
+    streaming_reply가 주어지면 기존 대화 뒤에 면접관 응답을 생성되는 대로 표시하고
+    완성된 응답 문자열을 반환합니다.
+    """
     for msg in messages:
         if msg.role == 'interviewer':
             st.write(f"👤 면접관: {msg.content}")
@@ -35,6 +38,11 @@ def render_conversation(messages: List[Conversation]) -> None:
                 st.write("### 학습 제안")
                 for suggestion in msg.feedback['suggestions']:
                     st.write(f"- {suggestion}")
+    
+    if streaming_reply is not None:
+        st.write("👤 면접관:")
+        return st.write_stream(streaming_reply)
+    return None
 
 def render_position_selection():
     """포지션 선택 UI 렌더링"""
@@ -106,7 +114,28 @@ def render_answer_input():
                       
     return answer if submit else None
 
-def render_final_evaluation(feedback: str):
-    """최종 평가 표시"""
+def render_final_evaluation(feedback: Union[str, Iterable[str]]) -> str:
+    """최종 평가 표시 (청크 스트림이면 생성되는 대로 표시)"""
     st.write("## 📋 최종 면접 평가")
-    st.markdown(feedback)
\ No newline at end of file
+    if isinstance(feedback, str):
+        st.markdown(feedback)
+        return feedback
+    return st.write_stream(feedback)
+
+def render_score_ranking(ranking: Dict[str, Dict]):
+    """같은 포지션 지원자 대비 점수 순위 표시"""
+    if not ranking:
+        return
+    st.write("### 🏅 점수 순위")
+    overall = ranking.get(OVERALL)
+    if overall:
+        st.metric(
+            "평균 답변 점수",
+            f"{overall['score']:.2f} / 5",
+            f"상위 {overall['top_percent']:.0f}% (지원자 {overall['population']}명 중)",
+            delta_color="off"
+        )
+    for topic, rank in ranking.items():
+        if topic == OVERALL:
+            continue
+        st.write(f"- **{topic}**: {rank['score']:.2f}점 · 상위 {rank['top_percent']:.0f}%")
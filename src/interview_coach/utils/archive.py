@@ -0,0 +1,174 @@
+"""저장된 면접 세션 일괄 내보내기 (분석용 컬럼형/압축 JSONL 파일)
+
+대화 메시지 1개가 1행이며, 세션 토큰 목록을 파티션으로 나눠 프로세스 풀에서
+병렬로 변환합니다. 파티션마다 파일 하나(part-00000.parquet 등)를 씁니다.
+
+    PYTHONPATH=src python -m interview_coach.utils.archive --out archive/ --format parquet
+"""
+
+import argparse
+import gzip
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .export import InterviewExporter
+from ..core.session import InterviewSession
+from ..core.session_store import SessionStore
+from ..config.constants import ArchiveSettings, SessionSettings
+
+FORMATS = {'jsonl.gz': 'jsonl.gz', 'parquet': 'parquet'}  # 형식 -> 파일 확장자
+
+@dataclass
+class ArchiveReport:
+    """일괄 내보내기 결과"""
+    sessions: int
+    rows: int
+    files: List[str]
+    elapsed: float
+
+    @property
+    def sessions_per_minute(self) -> float:
+        return self.sessions / self.elapsed * 60 if self.elapsed else 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+def session_rows(token: str, session: InterviewSession) -> Iterator[Dict]:
+    """세션의 메시지별 행 (InterviewExporter 메시지 필드 + 세션/점수 필드)
+
+    score는 주제 내 몇 번째 지원자 답변인지에 맞춰 session.scores에서 가져오며,
+    면접관 메시지와 점수가 없는 답변은 None입니다.
+    """
+    answer_index: Dict[str, int] = {}
+    turn_index: Dict[str, int] = {}
+    for topic, msg in InterviewExporter.iter_messages(session):
+        record = InterviewExporter.message_record(topic, msg)
+        feedback = record.pop("feedback") or {}
+        turn = turn_index.get(topic, 0)
+        turn_index[topic] = turn + 1
+
+        score = None
+        if record["role"] == 'candidate':
+            index = answer_index.get(topic, 0)
+            answer_index[topic] = index + 1
+            topic_scores = session.scores.get(topic, [])
+            if index < len(topic_scores):
+                score = topic_scores[index]
+
+        yield {
+            "session_id": token,
+            "position": session.position,
+            "turn": turn,
+            **record,
+            "score": score,
+            "feedback_understanding": feedback.get('understanding'),
+            "feedback_strengths": feedback.get('strengths', []),
+            "feedback_improvements": feedback.get('improvements', []),
+            "feedback_suggestions": feedback.get('suggestions', []),
+        }
+
+def _write_jsonl_gz(rows: List[Dict], path: Path) -> None:
+    with gzip.open(path, 'wt', encoding='utf-8', compresslevel=ArchiveSettings.COMPRESSION_LEVEL) as f:
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False))
+            f.write("\n")
+
+def _write_parquet(rows: List[Dict], path: Path) -> None:
+    # pyarrow는 Parquet 내보내기에만 필요
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    strings = pa.list_(pa.string())
+    schema = pa.schema([
+        ("session_id", pa.string()),
+        ("position", pa.string()),
+        ("turn", pa.int16()),
+        ("topic", pa.string()),
+        ("role", pa.string()),
+        ("content", pa.string()),
+        ("timestamp", pa.timestamp('ms')),
+        ("score", pa.int8()),
+        ("feedback_understanding", pa.string()),
+        ("feedback_strengths", strings),
+        ("feedback_improvements", strings),
+        ("feedback_suggestions", strings),
+    ])
+    columns = {name: [row[name] for row in rows] for name in schema.names}
+    columns["timestamp"] = pa.array(columns["timestamp"], pa.string()).cast(pa.timestamp('ms'))
+    pq.write_table(pa.table(columns, schema=schema), path)
+
+_WRITERS = {'jsonl.gz': _write_jsonl_gz, 'parquet': _write_parquet}
+
+def export_partition(db_path: str, tokens: List[str], path: str, fmt: str) -> Tuple[int, int]:
+    """세션 토큰 묶음을 파일 하나로 내보내고 (세션 수, 행 수) 반환 (작업 프로세스에서 실행)"""
+    store = SessionStore(db_path)
+    rows: List[Dict] = []
+    sessions = 0
+    for token in tokens:
+        session = store.load(token)
+        if session is None:  # 목록 조회 후 만료/삭제된 세션
+            continue
+        sessions += 1
+        rows.extend(session_rows(token, session))
+    _WRITERS[fmt](rows, Path(path))
+    return sessions, len(rows)
+
+def archive_sessions(
+    out_dir: str,
+    fmt: str = ArchiveSettings.FORMAT,
+    db_path: str = SessionSettings.STORE_PATH,
+    partition_size: int = ArchiveSettings.PARTITION_SIZE,
+    workers: Optional[int] = None,
+    updated_since: Optional[float] = None
+) -> ArchiveReport:
+    """저장된 세션을 파티션별 파일로 내보내기"""
+    if fmt not in FORMATS:
+        raise ValueError(f"지원하지 않는 형식입니다: {fmt}")
+    start = time.perf_counter()
+    out_path = Path(out_dir)
+    out_path.mkdir(parents=True, exist_ok=True)
+
+    tokens = SessionStore(db_path).list_tokens(updated_since)
+    partitions = [tokens[i:i + partition_size] for i in range(0, len(tokens), partition_size)]
+    files = [str(out_path / f"part-{i:05d}.{FORMATS[fmt]}") for i in range(len(partitions))]
+
+    sessions = rows = 0
+    if partitions:
+        workers = workers or min(len(partitions), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(
+                export_partition,
+                [db_path] * len(partitions), partitions, files, [fmt] * len(partitions)
+            )
+            for partition_sessions, partition_rows in results:
+                sessions += partition_sessions
+                rows += partition_rows
+
+    return ArchiveReport(sessions=sessions, rows=rows, files=files, elapsed=time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--out', required=True, help='출력 디렉토리')
+    parser.add_argument('--format', choices=list(FORMATS), default=ArchiveSettings.FORMAT)
+    parser.add_argument('--db', default=SessionSettings.STORE_PATH, help='세션 저널 SQLite 파일')
+    parser.add_argument('--partition-size', type=int, default=ArchiveSettings.PARTITION_SIZE)
+    parser.add_argument('--workers', type=int, default=None, help='작업 프로세스 수 (기본: CPU 수)')
+    parser.add_argument('--since-days', type=float, default=None, help='최근 N일 동안 변경된 세션만')
+    args = parser.parse_args()
+
+    updated_since = time.time() - args.since_days * 86400 if args.since_days is not None else None
+    report = archive_sessions(
+        args.out, args.format, args.db, args.partition_size, args.workers, updated_since
+    )
+    print(f"세션 {report.sessions:,d}개, 행 {report.rows:,d}개 -> 파일 {len(report.files)}개 ({args.out})")
+    print(f"소요 {report.elapsed:.2f}초: {report.sessions_per_minute:,.0f} sessions/min, "
+          f"{report.rows_per_second:,.0f} rows/s")
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,108 @@
 """데이터 내보내기 유틸리티"""
 
+import json
 from datetime import datetime
-from typing import List
+from typing import Callable, Dict, Iterator, List, Tuple
 
-from ..core.session import InterviewSession
+from ..core.session import InterviewSession, feedback_dict
 from ..core.models import Conversation
 
 class InterviewExporter:
     """면접 데이터 내보내기"""
+
+    # 형식 -> (청크 생성 메서드 이름, MIME 타입, 확장자)
+    FORMATS: Dict[str, Tuple[str, str, str]] = {
+        'txt': ('iter_txt', 'text/plain', 'txt'),
+        'jsonl': ('iter_jsonl', 'application/x-ndjson', 'jsonl'),
+        'markdown': ('iter_markdown', 'text/markdown', 'md'),
+    }
+
+    @staticmethod
+    def export(session: InterviewSession, fmt: str = 'txt') -> bytes:
+        """형식별 UTF-8 내보내기 결과 (세션이 바뀌지 않았으면 이전 결과 재사용)"""
+        generate: Callable[[InterviewSession], Iterator[str]] = getattr(
+            InterviewExporter, InterviewExporter.FORMATS[fmt][0]
+        )
+        return session.cached_export(
+            fmt, lambda s: b"".join(chunk.encode('utf-8') for chunk in generate(s))
+        )
+
+    @staticmethod
+    def iter_messages(session: InterviewSession) -> Iterator[Tuple[str, Conversation]]:
+        """내보내기 대상 (주제, 메시지) 순서 (완료된 주제 순)"""
+        for topic in session.completed_topics:
+            for msg in session.conversations.get(topic, []):
+                yield topic, msg
+
+    @staticmethod
+    def message_record(topic: str, msg: Conversation) -> Dict:
+        """메시지 1개의 내보내기 필드"""
+        return {
+            "topic": topic,
+            "role": str(msg.role),
+            "content": msg.content,
+            "timestamp": msg.timestamp.isoformat(),
+            "feedback": feedback_dict(msg),
+        }
+
+    @staticmethod
+    def iter_jsonl(session: InterviewSession) -> Iterator[str]:
+        """JSON Lines 형식 청크 (세션 정보, 메시지, 최종 평가를 한 줄씩)"""
+        def line(record: Dict) -> str:
+            return json.dumps(record, ensure_ascii=False) + "\n"
+
+        yield line({
+            "type": "session",
+            "position": session.position,
+            "completed_topics": session.completed_topics,
+            "exported_at": datetime.now().isoformat(timespec='seconds'),
+        })
+        for topic, msg in InterviewExporter.iter_messages(session):
+            yield line({"type": "message", **InterviewExporter.message_record(topic, msg)})
+        if session.final_feedback:
+            yield line({"type": "final_feedback", "content": session.final_feedback})
+
+    @staticmethod
+    def iter_markdown(session: InterviewSession) -> Iterator[str]:
+        """Markdown 형식 청크 (주제와 메시지 단위)"""
+        yield (
+            f"# 📝 면접 기록\n\n"
+            f"- **직무**: {session.position}\n"
+            f"- **일시**: {datetime.now().strftime('%Y년 %m월 %d일 %H:%M')}\n"
+            f"- **진행된 주제**: {', '.join(session.completed_topics)}\n\n"
+        )
+        for topic in session.completed_topics:
+            yield f"## {topic}\n\n"
+            for msg in session.conversations.get(topic, []):
+                role = '👤 면접관' if msg.role == 'interviewer' else '🧑‍💻 지원자'
+                yield f"**{role}** `{msg.timestamp.strftime('%H:%M:%S')}`\n\n{msg.content}\n\n"
+                if msg.feedback:
+                    yield "".join([
+                        "<details><summary>🔍 피드백</summary>\n\n",
+                        f"**이해도 평가**: {msg.feedback['understanding']}\n\n",
+                        *[
+                            f"**{title}**\n\n" + "".join(f"- {item}\n" for item in msg.feedback[key]) + "\n"
+                            for title, key in (
+                                ("강점", 'strengths'),
+                                ("개선 필요", 'improvements'),
+                                ("학습 제안", 'suggestions'),
+                            )
+                        ],
+                        "</details>\n\n",
+                    ])
+        if session.final_feedback:
+            yield f"## 📋 최종 평가\n\n{session.final_feedback}\n"
     
     @staticmethod
     def to_txt(session: InterviewSession) -> str:
         """면접 내용을 텍스트 형식으로 변환"""
-        lines = []
-        
+        return "".join(InterviewExporter.iter_txt(session))
+
+    @staticmethod
+    def iter_txt(session: InterviewSession) -> Iterator[str]:
+        """텍스트 형식 청크 (헤더, 주제, 최종 평가 단위)"""
         # 헤더 정보
-        lines.extend([
+        yield '\n'.join([
             "=" * 50,
             "📝 면접 기록",
             "=" * 50,
@@ -27,18 +114,18 @@ class InterviewExporter:
         
         # 주제별 대화 내용
         for topic in session.completed_topics:
-            lines.extend(InterviewExporter._format_topic_conversation(topic, session.conversations.get(topic, [])))
+            yield '\n' + '\n'.join(
+                InterviewExporter._format_topic_conversation(topic, session.conversations.get(topic, []))
+            )
         
         # 최종 평가
         if session.final_feedback:
-            lines.extend([
+            yield '\n' + '\n'.join([
                 "📋 최종 평가",
                 "=" * 50,
                 session.final_feedback,
                 "=" * 50
             ])
-        
-        return '\n'.join(lines)
 
     @staticmethod
     def _format_topic_conversation(topic: str, conversations: List[Conversation]) -> List[str]:
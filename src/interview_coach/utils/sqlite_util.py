@@ -0,0 +1,29 @@
+"""SQLite 공용 연결 도우미 (세션 저장소/통계 백엔드 공용)"""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Union
+
+class ThreadLocalConnection:
+    """스레드별 SQLite(WAL) 연결
+
+    sqlite3 연결은 스레드 간 공유하지 않으므로 스레드마다 처음 사용할 때 연결을
+    열어 재사용합니다. 트랜잭션은 호출자가 BEGIN/COMMIT으로 직접 관리합니다.
+    """
+
+    def __init__(self, db_path: Union[str, Path], timeout: float):
+        self.db_path = str(db_path)
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def get(self) -> sqlite3.Connection:
+        """현재 스레드의 연결 반환 (없으면 WAL 모드로 새로 연결)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # isolation_level=None: 트랜잭션은 BEGIN/COMMIT으로 직접 관리
+            conn = sqlite3.connect(self.db_path, timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
@@ -0,0 +1,76 @@
+"""세션 일괄 내보내기 테스트"""
+
+import gzip
+import json
+
+import pytest
+from interview_coach.core.session import InterviewSession
+from interview_coach.core.session_store import SessionStore
+from interview_coach.utils.archive import archive_sessions, session_rows
+
+FEEDBACK = {
+    'understanding': "전반적인 개념 이해도: 중",
+    'strengths': ["기본 개념을 정확히 알고 있음"],
+    'improvements': ["실무 예시 보완"],
+    'suggestions': ["공식 문서 학습"],
+}
+
+def play_session(session: InterviewSession) -> None:
+    session.position = "백엔드"
+    session.current_topic = "Python"
+    session.add_message("interviewer", "질문")
+    session.add_message("candidate", "첫 답변")
+    session.record_score(2)
+    session.add_message("interviewer", "꼬리 질문")
+    session.add_message("candidate", "두 번째 답변", feedback=FEEDBACK)
+    session.record_score(4)
+    session.clear_current_conversation()
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "sessions.db")
+    store = SessionStore(path)
+    for _ in range(5):
+        play_session(session := InterviewSession())
+        store.attach(session)
+    return path
+
+def test_session_rows_scores_and_feedback():
+    """지원자 답변 순서대로 점수를 붙이고 피드백을 컬럼으로 펼침"""
+    session = InterviewSession()
+    play_session(session)
+    rows = list(session_rows("token", session))
+
+    assert [row["role"] for row in rows] == ["interviewer", "candidate"] * 2
+    assert [row["score"] for row in rows] == [None, 2, None, 4]
+    assert [row["turn"] for row in rows] == [0, 1, 2, 3]
+    assert rows[3]["feedback_strengths"] == FEEDBACK['strengths']
+    assert rows[0]["feedback_understanding"] is None
+    assert all(row["session_id"] == "token" and row["position"] == "백엔드" for row in rows)
+
+def test_archive_jsonl_gz(db_path, tmp_path):
+    """파티션별 jsonl.gz 파일로 내보내기"""
+    report = archive_sessions(str(tmp_path / "out"), 'jsonl.gz', db_path, partition_size=2, workers=2)
+
+    assert report.sessions == 5 and report.rows == 20
+    assert len(report.files) == 3
+    rows = []
+    for path in report.files:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            rows.extend(json.loads(line) for line in f)
+    assert len(rows) == 20
+    assert {row["topic"] for row in rows} == {"Python"}
+
+def test_archive_parquet(db_path, tmp_path):
+    """Parquet 파일로 내보내기"""
+    pq = pytest.importorskip("pyarrow.parquet")
+    report = archive_sessions(str(tmp_path / "out"), 'parquet', db_path, partition_size=10, workers=1)
+
+    table = pq.read_table(report.files[0])
+    assert table.num_rows == 20
+    assert table.column("score").to_pylist()[:4] == [None, 2, None, 4]
+    assert str(table.schema.field("timestamp").type) == "timestamp[ms]"
+
+def test_archive_rejects_unknown_format(db_path, tmp_path):
+    with pytest.raises(ValueError):
+        archive_sessions(str(tmp_path / "out"), 'csv', db_path)
@@ -0,0 +1,87 @@
+"""대시보드 정적 파일 및 템플릿 테스트"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from interview_coach.ui import assets
+
+@pytest.fixture
+def static_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(assets, "_published", False)
+    return tmp_path / "static"
+
+def test_minify_js_strips_whitespace_and_comments():
+    """들여쓰기, 빈 줄, 한 줄 주석 제거"""
+    source = "// 주석\nfunction f() {\n\n    return `a ${b}`;\n}\n"
+    assert assets.minify_js(source) == "function f() {\nreturn `a ${b}`;\n}"
+
+def test_hashed_name_changes_with_content():
+    """내용이 바뀌면 파일명도 바뀜"""
+    first = assets.hashed_name("dashboard.js", b"a")
+    assert first.startswith("dashboard.") and first.endswith(".js")
+    assert first != assets.hashed_name("dashboard.js", b"b")
+    assert first == assets.hashed_name("dashboard.js", b"a")
+
+def test_publish_assets_writes_hashed_files_once(static_dir):
+    """해시 파일명으로 한 번만 기록"""
+    urls = assets.publish_assets(str(static_dir))
+    bundle = static_dir / urls["dashboard.js"].rsplit("/", 1)[1]
+    assert bundle.exists()
+    assert "renderDashboard" in bundle.read_text(encoding="utf-8")
+
+    bundle.unlink()
+    assets.publish_assets(str(static_dir))
+    assert not bundle.exists()
+
+def test_render_uses_static_urls(static_dir):
+    """정적 제공이 켜져 있으면 번들을 URL로 참조하고 통계 JSON만 포함"""
+    assets.compile_dashboard_template.cache_clear()
+    publish = assets.publish_assets
+    with patch.object(assets.st, "get_option", return_value=True), \
+            patch.object(assets, "publish_assets", lambda: publish(str(static_dir))):
+        page = assets.render_dashboard_html("stats-root", {"total_interviews": 3})
+
+    assert f'src="app/static/{assets._HASHED["dashboard.js"]}"' in page
+    assert "function StatisticsDashboard" not in page
+    payload = page.split('id="stats-root-data">', 1)[1].split("</script>", 1)[0]
+    assert json.loads(payload) == {"total_interviews": 3}
+
+def test_render_inline_without_static_serving():
+    """정적 제공이 꺼져 있으면 번들을 인라인하고 vendor는 CDN 사용"""
+    with patch.object(assets.st, "get_option", return_value=False):
+        page = assets.render_dashboard_html("stats-root", {"name": "</script><script>alert(1)"})
+
+    assert "function StatisticsDashboard" in page
+    assert "https://unpkg.com/react@17.0.2" in page
+    assert "</script><script>alert(1)" not in page
+
+def test_template_is_reused():
+    """같은 root_id는 템플릿을 다시 만들지 않음"""
+    first = assets.compile_dashboard_template("stats-root", False)
+    assert assets.compile_dashboard_template("stats-root", False) is first
+
+def test_static_dir_resolves_from_app_root():
+    """상대 경로 정적 디렉토리는 실행 위치가 아니라 run.py 옆"""
+    assert (assets.APP_ROOT / "run.py").exists()
+    assert assets.resolve_static_dir("static") == assets.APP_ROOT / "static"
+
+def test_vendor_files_picked_up_without_reload(static_dir, tmp_path, monkeypatch):
+    """모듈 로드 이후 내려받은 vendor 파일도 기록 시 self-host"""
+    vendor_dir = tmp_path / "vendor"
+    vendor_dir.mkdir()
+    (vendor_dir / "react.production.min.js").write_text("/* react */")
+    monkeypatch.setattr(assets, "VENDOR_DIR", vendor_dir)
+
+    urls = assets.publish_assets(str(static_dir))
+    assert urls["react.production.min.js"].startswith("app/static/react.")
+    assert "react-dom.production.min.js" not in urls  # 없는 파일은 CDN 사용
+
+def test_missing_vendor_logs_error_without_network(static_dir, tmp_path, monkeypatch, caplog):
+    """vendor 파일이 없으면 렌더링 중 내려받지 않고 오류를 기록한 뒤 CDN 사용"""
+    monkeypatch.setattr(assets, "VENDOR_DIR", tmp_path / "vendor")
+    with patch.object(assets.urllib.request, "urlopen") as urlopen:
+        urls = assets.publish_assets(str(static_dir))
+    urlopen.assert_not_called()
+    assert set(urls) == {"dashboard.js"}
+    assert "react.production.min.js" in caplog.text and "--fetch" in caplog.text
@@ -0,0 +1,88 @@
+"""AsyncMockInterviewer 테스트"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from interview_coach.core.async_interviewer import AsyncMockInterviewer
+from interview_coach.core.scheduler import RequestScheduler
+from interview_coach.core.session import InterviewSession
+
+@pytest.fixture
+def interviewer():
+    return AsyncMockInterviewer("mock-api-key", max_concurrency=2)
+
+@pytest.fixture
+def session():
+    session = InterviewSession()
+    session.position = "프론트엔드"
+    session.current_topic = "JavaScript/TypeScript 기초"
+    return session
+
+def test_get_model_response_async(interviewer):
+    with patch('google.generativeai.GenerativeModel.generate_content_async',
+               new_callable=AsyncMock) as mock_generate:
+        mock_generate.return_value.text = "테스트 응답"
+        response = asyncio.run(interviewer.get_model_response_async("테스트 프롬프트"))
+        assert response == "테스트 응답"
+        mock_generate.assert_awaited_once()
+
+def test_concurrency_cap(interviewer):
+    in_flight = 0
+    peak = 0
+
+    async def fake_generate(*args, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return type('Response', (), {'text': '응답'})()
+
+    async def run_many():
+        return await asyncio.gather(*[
+            interviewer.get_model_response_async(f"프롬프트 {i}") for i in range(6)
+        ])
+
+    with patch('google.generativeai.GenerativeModel.generate_content_async', side_effect=fake_generate):
+        results = asyncio.run(run_many())
+
+    assert results == ['응답'] * 6
+    assert peak == 2
+
+def test_concurrency_cap_across_event_loops(interviewer):
+    """이벤트 루프가 바뀌어도 세마포어를 새로 만들어 경합 시 오류가 나지 않음"""
+    async def fake_generate(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return type('Response', (), {'text': '응답'})()
+
+    async def run_many():
+        return await asyncio.gather(*[
+            interviewer.get_model_response_async(f"프롬프트 {i}") for i in range(6)
+        ])
+
+    # 공용 스케줄러의 속도 제한에 막히지 않도록 별도 스케줄러 사용 (세마포어 경합 유도)
+    interviewer.scheduler = RequestScheduler(rate_per_second=1000, burst=100)
+    with patch('google.generativeai.GenerativeModel.generate_content_async', side_effect=fake_generate), \
+         patch.object(interviewer.circuit_breaker, 'record_failure') as record_failure:
+        assert asyncio.run(run_many()) == ['응답'] * 6
+        assert asyncio.run(run_many()) == ['응답'] * 6
+    record_failure.assert_not_called()
+
+def test_start_topic_async(interviewer, session):
+    with patch.object(interviewer, 'get_model_response_async',
+                      new_callable=AsyncMock, return_value="첫 질문"):
+        result = asyncio.run(interviewer.start_topic_async(session, "React/Vue/Angular 프레임워크"))
+        assert result == "첫 질문"
+        assert session.current_topic == "React/Vue/Angular 프레임워크"
+        assert session.get_current_conversation()[0].content == "첫 질문"
+
+def test_fallback_analysis_is_not_scored_async(interviewer, session):
+    """서킷 브레이커가 열려 응답이 없으면 기본 분석 점수를 기록하지 않음"""
+    with patch.object(interviewer, 'get_model_response_async', new_callable=AsyncMock, return_value=None), \
+         patch.object(interviewer, '_generate_topic_feedback_async', new_callable=AsyncMock, return_value=None), \
+         patch.object(interviewer, 'schedule_topic_summary'):
+        result = asyncio.run(interviewer.handle_answer_async(session, "테스트 답변"))
+
+    assert result['type'] == 'conclude'
+    assert session.scores == {}
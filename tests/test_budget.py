@@ -0,0 +1,75 @@
+"""PromptBudget 테스트"""
+
+from interview_coach.core.models import Conversation
+from interview_coach.prompts.budget import PromptBudget, estimate_tokens, get_budget_metrics
+
+def make_history(turns, length):
+    return [
+        Conversation(role="interviewer" if i % 2 == 0 else "candidate", content=f"{i}번" + "가" * length)
+        for i in range(turns)
+    ]
+
+def test_within_budget_is_unchanged():
+    budget = PromptBudget("test_unchanged", max_tokens=1000)
+    history, answer = budget.apply("템플릿", make_history(2, 10), formatted_history="캐시된 대화", answer="답변")
+    assert history == "캐시된 대화"
+    assert answer == "답변"
+
+def test_older_turns_are_digested_and_recent_kept():
+    history = make_history(10, 500)
+    budget = PromptBudget("test_digest", max_tokens=3000, keep_last_turns=2, digest_chars=20)
+    fitted, _ = budget.apply("템플릿", history)
+    
+    assert estimate_tokens(fitted) <= 3000
+    assert history[-1].content in fitted  # 최근 발화는 원문 유지
+    assert "생략" in fitted
+    
+    stats = get_budget_metrics().snapshot()["test_digest"]
+    assert stats["trimmed"] == 1
+    assert stats["tokens_saved"] > 0
+
+def test_oldest_turns_dropped_when_still_over():
+    budget = PromptBudget("test_drop", max_tokens=1200, keep_last_turns=1, digest_chars=400)
+    fitted, answer = budget.apply("템플릿", make_history(10, 500), answer="나" * 3000)
+    
+    assert "(이전 대화" in fitted
+    assert len(answer) < 3000
+    assert estimate_tokens(fitted) + estimate_tokens(answer) <= 1200
+
+def test_history_is_trimmed_before_answer():
+    """대화 내역만 줄여서 맞출 수 있으면 답변은 그대로 유지"""
+    budget = PromptBudget("test_answer_kept", max_tokens=4000, keep_last_turns=2, digest_chars=50)
+    answer = "답" * 3000
+    fitted, kept = budget.apply("템플릿", make_history(8, 200), answer=answer)
+
+    assert kept == answer
+    assert estimate_tokens(fitted) + estimate_tokens(kept) <= 4000
+
+def test_answer_truncated_only_by_remaining_overflow():
+    """대화 내역을 줄여도 넘치는 분량만큼만 답변 축약"""
+    budget = PromptBudget("test_answer_overflow", max_tokens=4000, keep_last_turns=4)
+    template = "템" * 1500
+    fitted, answer = budget.apply(template, make_history(4, 200), answer="답" * 3000)
+
+    total = estimate_tokens(template) + estimate_tokens(fitted) + estimate_tokens(answer)
+    assert total <= 4000
+    assert total > 3900  # 예산을 남기지 않고 사용
+    assert len(answer) > 2000
+
+def test_english_answer_keeps_its_token_budget():
+    """영문/코드 답변은 글자 수가 아니라 추정 토큰 수 기준으로 축약"""
+    answer = "def handler(request): return cache.get(request.key)\n" * 200
+    truncated = PromptBudget._truncate_answer(answer, 400)
+
+    assert estimate_tokens(truncated) <= 400
+    assert estimate_tokens(truncated) > 350
+    assert len(truncated) > 1200  # 1자=1토큰으로 자르면 380자 정도만 남음
+
+def test_truncation_never_lengthens_answer():
+    """예산 안의 답변은 그대로 두고, 조금 넘는 답변은 원문보다 짧게 축약"""
+    assert PromptBudget._truncate_answer("short answer", 10) == "short answer"
+    for answer in ("가" * 101, "a" * 404, "a" * 20):
+        max_tokens = estimate_tokens(answer) - 1
+        truncated = PromptBudget._truncate_answer(answer, max_tokens)
+        assert len(truncated) < len(answer)
+        assert estimate_tokens(truncated) <= max_tokens
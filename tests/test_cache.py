@@ -0,0 +1,85 @@
+"""ResponseCache 테스트"""
+
+import atexit
+import logging
+import time
+from unittest.mock import patch
+
+import pytest
+
+from interview_coach.core.cache import ResponseCache
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+def test_fills_pool_before_serving(clock):
+    cache = ResponseCache(variants_per_key=2, clock=clock)
+    cache.put("키", "질문1")
+    assert cache.get("키") is None  # 풀이 아직 다 차지 않음
+    
+    cache.put("키", "질문2")
+    assert [cache.get("키") for _ in range(3)] == ["질문1", "질문2", "질문1"]
+
+def test_ttl_expiry(clock):
+    cache = ResponseCache(variants_per_key=1, ttl_seconds=60, clock=clock)
+    cache.put("키", "질문")
+    assert cache.get("키") == "질문"
+    
+    clock.now += 61
+    assert cache.get("키") is None
+    assert len(cache) == 0
+
+def test_lru_eviction(clock):
+    cache = ResponseCache(max_entries=2, variants_per_key=1, clock=clock)
+    cache.put("a", "A")
+    cache.put("b", "B")
+    cache.get("a")  # a를 최근 사용으로 갱신
+    cache.put("c", "C")
+    
+    assert cache.get("a") == "A"
+    assert cache.get("b") is None
+    assert cache.get("c") == "C"
+
+def test_disk_persistence(tmp_path, clock):
+    path = tmp_path / "responses.json"
+    cache = ResponseCache(variants_per_key=1, storage_path=path, clock=clock)
+    cache.put("키", "질문")
+    cache.flush()
+    
+    restarted = ResponseCache(variants_per_key=1, storage_path=path, clock=clock)
+    assert restarted.get("키") == "질문"
+
+def test_saves_are_coalesced(tmp_path, clock):
+    path = tmp_path / "responses.json"
+    cache = ResponseCache(variants_per_key=1, storage_path=path, clock=clock, save_delay=0.05)
+    with patch.object(cache, '_save', wraps=cache._save) as save:
+        for i in range(20):
+            cache.put(f"키{i}", "질문")
+        assert not path.exists()  # 기록은 지연됨
+
+        for _ in range(100):
+            if path.exists():
+                break
+            time.sleep(0.01)
+    assert save.call_count == 1
+    assert len(ResponseCache(storage_path=path, clock=clock)) == 20
+    assert list(tmp_path.glob("*.tmp")) == []
+
+def test_save_failure_is_logged(tmp_path, clock, caplog):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    cache = ResponseCache(storage_path=blocker / "responses.json", clock=clock, save_delay=60)
+    cache.put("키", "질문")
+    with caplog.at_level(logging.WARNING, logger="interview_coach.core.cache"):
+        cache.flush()
+    assert "응답 캐시를 디스크에 저장하지 못했습니다" in caplog.text
+    assert cache._dirty  # 다음 기록 때 재시도
+    atexit.unregister(cache.flush)
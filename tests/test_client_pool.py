@@ -0,0 +1,49 @@
+"""Gemini 클라이언트 풀 테스트"""
+
+import asyncio
+import threading
+
+import pytest
+
+from interview_coach.core.client_pool import GeminiClientPool
+from interview_coach.core.interviewer import MockInterviewer
+
+@pytest.fixture
+def pool():
+    return GeminiClientPool()
+
+def test_model_shared_per_key_and_model(pool):
+    first = pool.get_model("key-a", "gemini-pro")
+    assert pool.get_model("key-a", "gemini-pro") is first
+    assert pool.get_model("key-b", "gemini-pro") is not first
+    assert first._client is pool.get_client("key-a")
+
+def test_concurrent_get_model_builds_one_client(pool):
+    models = []
+
+    def worker():
+        models.append(pool.get_model("key-a"))
+
+    threads = [threading.Thread(target=worker) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(model) for model in models}) == 1
+    assert len(pool._clients) == 1
+
+def test_async_model_per_event_loop(pool):
+    async def get():
+        return pool.get_async_model("key-a")
+
+    async def get_twice():
+        return pool.get_async_model("key-a"), pool.get_async_model("key-a")
+
+    first, second = asyncio.run(get_twice())
+    assert first is second
+    assert first._async_client is not None
+    assert asyncio.run(get()) is not first
+
+def test_interviewers_share_model():
+    assert MockInterviewer("shared-key").model is MockInterviewer("shared-key").model
@@ -0,0 +1,69 @@
+"""면접 기록 내보내기 테스트"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from interview_coach.core.session import InterviewSession
+from interview_coach.utils.export import InterviewExporter
+
+FEEDBACK = {
+    'understanding': "전반적인 개념 이해도: 중",
+    'strengths': ["기본 개념을 정확히 알고 있음"],
+    'improvements': ["실무 예시 보완"],
+    'suggestions': ["공식 문서 학습"],
+}
+
+@pytest.fixture
+def session():
+    session = InterviewSession(position="백엔드")
+    for topic in ["Python", "Database"]:
+        session.current_topic = topic
+        session.add_message("interviewer", f"{topic} 질문")
+        session.add_message("candidate", f"{topic} 답변", feedback=FEEDBACK)
+        session.clear_current_conversation()
+    session.interview_complete = True
+    session.final_feedback = "전반적으로 좋습니다"
+    return session
+
+def test_revision_increases_on_change(session):
+    """변경할 때마다 revision 증가"""
+    revision = session.revision
+    session.current_topic = "Network"
+    session.add_message("interviewer", "질문")
+    assert session.revision == revision + 2
+
+def test_export_is_memoized_by_revision(session):
+    """세션이 바뀌지 않았으면 다시 생성하지 않음"""
+    with patch.object(InterviewExporter, 'iter_txt', wraps=InterviewExporter.iter_txt) as iter_txt:
+        first = InterviewExporter.export(session, 'txt')
+        assert InterviewExporter.export(session, 'txt') is first
+        assert iter_txt.call_count == 1
+
+        session.final_feedback = "수정된 평가"
+        assert "수정된 평가" in InterviewExporter.export(session, 'txt').decode('utf-8')
+        assert iter_txt.call_count == 2
+
+def test_txt_matches_to_txt(session):
+    """TXT 내보내기는 to_txt와 같은 내용"""
+    text = InterviewExporter.to_txt(session)
+    assert text.startswith("=" * 50)
+    assert "[주제] Python" in text and "  - 기본 개념을 정확히 알고 있음" in text
+    assert text.endswith("=" * 50)
+
+def test_jsonl_records(session):
+    """JSON Lines는 세션 정보, 메시지, 최종 평가를 한 줄씩"""
+    records = [json.loads(line) for line in InterviewExporter.export(session, 'jsonl').decode('utf-8').splitlines()]
+    assert records[0]["type"] == "session" and records[0]["position"] == "백엔드"
+    messages = [record for record in records if record["type"] == "message"]
+    assert [message["topic"] for message in messages] == ["Python", "Python", "Database", "Database"]
+    assert messages[1]["role"] == "candidate" and messages[1]["feedback"] == FEEDBACK
+    assert records[-1] == {"type": "final_feedback", "content": "전반적으로 좋습니다"}
+
+def test_markdown_streams_chunks(session):
+    """Markdown은 주제/메시지 단위 청크로 생성"""
+    chunks = list(InterviewExporter.iter_markdown(session))
+    assert len(chunks) > 4
+    document = "".join(chunks)
+    assert "## Python" in document and "## 📋 최종 평가" in document
+    assert "- 공식 문서 학습" in document
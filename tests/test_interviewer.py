@@ -6,6 +6,7 @@ from unittest.mock import Mock, patch
 from interview_coach.core.interviewer import MockInterviewer
 from interview_coach.core.session import InterviewSession
 from interview_coach.core.models import Conversation
+from interview_coach.core.cache import ResponseCache
 
 @pytest.fixture
 def interviewer():
@@ -55,13 +56,27 @@ def test_handle_answer(interviewer, session):
         'feedback': '좋은 답변입니다.'
     }
     
-    with patch.object(interviewer, 'analyze_answer', return_value=mock_analysis):
+    with patch.object(interviewer, 'analyze_answer', return_value=mock_analysis), \
+         patch.object(interviewer, 'prefetch_next_topic'):
         result = interviewer.handle_answer(session, "테스트 답변")
         
         assert result['type'] == 'follow_up'
         assert result['response'] == '추가 질문입니다.'
         assert len(session.get_current_conversation()) == 2  # 답변과 추가 질문
 
+@pytest.mark.parametrize("response", [None, "해석할 수 없는 응답"])
+def test_fallback_analysis_is_not_scored(interviewer, session, response):
+    """응답이 없거나 해석하지 못한 경우의 기본 분석 점수는 기록하지 않음"""
+    with patch.object(interviewer, 'get_model_response', return_value=response), \
+         patch.object(interviewer, 'prefetch_next_topic'), \
+         patch.object(interviewer, '_generate_topic_feedback', return_value=None), \
+         patch.object(interviewer, 'schedule_topic_summary'):
+        result = interviewer.handle_answer(session, "테스트 답변")
+
+    assert result['type'] == 'conclude'
+    assert session.scores == {}
+    assert session.get_average_score() is None
+
 def test_generate_final_evaluation(interviewer, session):
     conversations = [
         Conversation(role="interviewer", content="첫 질문"),
@@ -78,4 +93,115 @@ def test_refresh_current_topic(interviewer, session):
     with patch.object(interviewer, 'get_model_response', return_value="새로운 질문"):
         result = interviewer.refresh_current_topic(session)
         assert result == "새로운 질문"
-        assert len(session.get_current_conversation()) == 1  # 새 질문만 있어야 함
\ No newline at end of file
+        assert len(session.get_current_conversation()) == 1  # 새 질문만 있어야 함
+
+def test_start_topic_uses_prefetched_question(interviewer, session):
+    next_topic = "React/Vue/Angular 프레임워크"
+    with patch.object(interviewer.prefetcher, '_generate', return_value="미리 준비된 질문"):
+        interviewer.prefetch_next_topic(session)
+        assert interviewer.prefetcher.is_scheduled(session.position, next_topic)
+    
+    session.clear_current_conversation()
+    with patch.object(interviewer, 'get_model_response') as mock_response:
+        result = interviewer.start_topic(session, next_topic)
+        assert result == "미리 준비된 질문"
+        mock_response.assert_not_called()
+    assert not interviewer.prefetcher.is_scheduled(session.position, next_topic)
+
+def test_final_evaluation_discards_prefetched_question(interviewer, session):
+    next_topic = "React/Vue/Angular 프레임워크"
+    with patch.object(interviewer.prefetcher, '_generate', return_value="미리 준비된 질문"):
+        interviewer.prefetch_next_topic(session)
+    session.add_message("interviewer", "질문")
+    session.completed_topics.append(session.current_topic)
+
+    with patch.object(interviewer, '_final_evaluation_prompt', return_value="프롬프트"), \
+         patch.object(interviewer, 'stream_model_response', return_value=iter(["평가"])):
+        assert list(interviewer.stream_final_evaluation(session)) == ["평가"]
+    assert not interviewer.prefetcher.is_scheduled(session.position, next_topic)
+
+def test_get_model_response_uses_cache(interviewer):
+    interviewer.response_cache = ResponseCache(variants_per_key=1)
+    with patch('google.generativeai.GenerativeModel.generate_content') as mock_generate:
+        mock_generate.return_value.text = "첫 질문"
+        first = interviewer.get_model_response("프롬프트", cache_key="키")
+        second = interviewer.get_model_response("프롬프트", cache_key="키")
+        assert first == second == "첫 질문"
+        mock_generate.assert_called_once()
+
+def test_stream_start_topic(interviewer, session):
+    session.clear_current_conversation()
+    next_topic = "React/Vue/Angular 프레임워크"
+    with patch.object(interviewer, 'stream_model_response', return_value=iter(["첫 ", "질문"])):
+        chunks = list(interviewer.stream_start_topic(session, next_topic))
+    
+    assert chunks == ["첫 ", "질문"]
+    assert session.current_topic == next_topic
+    assert session.get_current_conversation()[0].content == "첫 질문"
+
+def test_stream_final_evaluation(interviewer, session):
+    session.add_message("interviewer", "첫 질문")
+    session.add_message("candidate", "첫 답변")
+    session.clear_current_conversation()
+    
+    with patch('google.generativeai.GenerativeModel.generate_content') as mock_generate:
+        mock_generate.return_value = [Mock(text="최종 "), Mock(text="평가")]
+        chunks = list(interviewer.stream_final_evaluation(session))
+        assert ''.join(chunks) == "최종 평가"
+        assert mock_generate.call_args.kwargs['stream'] is True
+
+def test_conclude_uses_combined_feedback(interviewer, session):
+    mock_response = """```json
+    {
+        "action": "CONCLUDE",
+        "completion_score": 4,
+        "next_response": "수고하셨습니다. 다음 주제로 넘어가겠습니다.",
+        "feedback": "핵심을 잘 설명했습니다.",
+        "topic_feedback": {
+            "understanding": "상",
+            "strengths": ["개념 설명이 정확함"],
+            "improvements": ["실무 예시 보완"],
+            "suggestions": ["이벤트 루프 심화 학습"]
+        }
+    }
+    ```"""
+    
+    with patch.object(interviewer, 'get_model_response', return_value=mock_response) as mock_call, \
+         patch.object(interviewer, 'prefetch_next_topic'), \
+         patch.object(interviewer, 'schedule_topic_summary'):
+        result = interviewer.handle_answer(session, "테스트 답변")
+    
+    assert result['type'] == 'conclude'
+    assert result['feedback']['strengths'] == ["개념 설명이 정확함"]
+    assert mock_call.call_count == 1  # 피드백을 위한 추가 호출 없음
+
+def test_parse_feedback_response(interviewer):
+    response = """
+    이해도 평가:
+    - 전반적인 개념 이해도: 중
+    
+    강점:
+    - 기본 개념을 정확히 알고 있음
+    
+    개선 필요:
+    - 구체적인 사례 부족
+    
+    학습 제안:
+    - 공식 문서 학습
+    """
+    feedback = interviewer._parse_feedback_response(response)
+    assert feedback['understanding'] == "전반적인 개념 이해도: 중"
+    assert feedback['strengths'] == ["기본 개념을 정확히 알고 있음"]
+    assert feedback['suggestions'] == ["공식 문서 학습"]
+
+def test_final_evaluation_reduces_over_topic_summaries(interviewer, session):
+    session.add_message("interviewer", "첫 질문")
+    session.add_message("candidate", "아주 긴 원본 답변")
+    with patch.object(interviewer, 'get_model_response', return_value="- 핵심 요약"):
+        interviewer.schedule_topic_summary(session)
+        session.collect_topic_summaries(timeout=5)
+    session.clear_current_conversation()
+    
+    prompt = interviewer._final_evaluation_prompt(session)
+    assert "- 핵심 요약" in prompt
+    assert "아주 긴 원본 답변" not in prompt
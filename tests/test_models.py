@@ -0,0 +1,36 @@
+"""데이터 모델 테스트"""
+
+from datetime import datetime
+
+from interview_coach.core.models import Conversation, InterviewFeedback, Role
+
+FEEDBACK = {
+    'understanding': "전반적인 개념 이해도: 중",
+    'strengths': ["기본 개념을 정확히 알고 있음"],
+    'improvements': ["실무 예시 보완"],
+    'suggestions': ["공식 문서 학습"],
+}
+
+def test_conversation_is_slotted():
+    """인스턴스 __dict__ 없이 기존 방식으로 접근"""
+    msg = Conversation(role="candidate", content="답변", feedback=FEEDBACK)
+    assert not hasattr(msg, '__dict__')
+    assert msg.role == 'candidate' and msg.role is Role.CANDIDATE
+    assert isinstance(msg.timestamp, datetime)
+    assert isinstance(msg.feedback, InterviewFeedback)
+
+def test_feedback_dict_access():
+    """피드백은 dict와 같은 방식으로 읽을 수 있음"""
+    feedback = Conversation(role="candidate", content="답변", feedback=FEEDBACK).feedback
+    assert feedback['understanding'] == FEEDBACK['understanding']
+    assert list(feedback['strengths']) == FEEDBACK['strengths']
+    assert feedback.get('missing', "기본값") == "기본값"
+    assert feedback.to_dict() == FEEDBACK
+    assert feedback == FEEDBACK
+
+def test_timestamp_is_epoch_seconds():
+    """시각은 epoch 초로 보관"""
+    when = datetime(2024, 5, 1, 9, 30, 15, 123456)
+    msg = Conversation(role="interviewer", content="질문", timestamp=when)
+    assert msg.timestamp == when.replace(microsecond=0)
+    assert Conversation(role="interviewer", content="질문", timestamp=msg.epoch) == msg
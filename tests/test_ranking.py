@@ -0,0 +1,48 @@
+"""점수 백분위 색인 테스트"""
+
+import pytest
+
+from interview_coach.stats.ranking import OVERALL, PercentileIndex
+
+@pytest.fixture
+def index(tmp_path):
+    return PercentileIndex(str(tmp_path))
+
+def test_rank_against_population(index):
+    for average in (1, 2, 3, 4, 5):
+        index.add_session("백엔드", {"API 설계": [average]})
+
+    assert index.rank("백엔드", "API 설계", 4.5) == {
+        "percentile": 80.0, "top_percent": 20.0, "population": 5
+    }
+    # 동점은 절반만 아래로 계산
+    assert index.rank("백엔드", "API 설계", 3)["percentile"] == 50.0
+    assert index.rank("프론트엔드", "API 설계", 3) is None
+
+def test_index_stays_sorted_and_persists(index, tmp_path):
+    for scores in ([5, 5], [1], [3, 4]):
+        index.add_session("풀스택", {"시스템 설계": scores})
+    assert index._index["풀스택::시스템 설계"] == [1.0, 3.5, 5.0]
+
+    reloaded = PercentileIndex(str(tmp_path))
+    assert reloaded.rank("풀스택", OVERALL, 5.0)["population"] == 3
+
+def test_rank_session(index):
+    index.add_session("백엔드", {"API 설계": [2], "캐싱": [2]})
+    ranking = index.rank_session("백엔드", {"API 설계": [4], "캐싱": [1, 3]})
+    assert ranking["API 설계"]["percentile"] == 100.0
+    assert ranking["캐싱"]["score"] == 2.0
+    assert ranking[OVERALL]["score"] == 2.67
+
+def test_log_is_append_only_and_shared(index, tmp_path):
+    """기록은 로그 끝에 덧붙이기만 하고, 다른 인스턴스는 새로 덧붙은 줄만 읽음"""
+    other = PercentileIndex(str(tmp_path))
+    index.add_session("백엔드", {"API 설계": [2]})
+    assert other.rank("백엔드", "API 설계", 3)["population"] == 1
+
+    size = index.index_path.stat().st_size
+    head = index.index_path.read_bytes()
+    other.add_session("백엔드", {"API 설계": [4]})
+    assert index.index_path.read_bytes()[:size] == head
+    assert index.rank("백엔드", "API 설계", 3)["percentile"] == 50.0
+    assert other._offset == index._offset == index.index_path.stat().st_size
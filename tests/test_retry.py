@@ -0,0 +1,136 @@
+"""재시도 정책 및 서킷 브레이커 테스트"""
+
+import pytest
+from unittest.mock import patch
+from google.api_core import exceptions as api_exceptions
+
+from interview_coach.core.interviewer import MockInterviewer
+from interview_coach.core.retry import (
+    CircuitBreaker, ErrorKind, RetryPolicy, classify_error, retry_after_hint
+)
+from interview_coach.core.scheduler import RequestScheduler
+from interview_coach.core.session import InterviewSession
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def interviewer():
+    interviewer = MockInterviewer("mock-api-key")
+    interviewer.retry_policy = RetryPolicy(base_delay=0, max_delay=0)
+    interviewer.circuit_breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+    interviewer.scheduler = RequestScheduler(rate_per_second=1000, burst=100)
+    return interviewer
+
+def test_classify_error():
+    assert classify_error(api_exceptions.ResourceExhausted("quota")) is ErrorKind.RATE_LIMIT
+    assert classify_error(api_exceptions.ServiceUnavailable("down")) is ErrorKind.TRANSIENT
+    assert classify_error(api_exceptions.InvalidArgument("bad")) is ErrorKind.PERMANENT
+
+def test_retry_after_hint_is_honored():
+    error = api_exceptions.ResourceExhausted("quota")
+    error.retry_after = 3
+    policy = RetryPolicy(base_delay=0.1, max_delay=10)
+    
+    assert retry_after_hint(error) == 3.0
+    assert policy.compute_delay(0, error) >= 3.0
+
+def test_backoff_is_bounded():
+    policy = RetryPolicy(base_delay=1, max_delay=4, rate_limit_multiplier=1)
+    error = api_exceptions.ServiceUnavailable("down")
+    delays = [policy.compute_delay(attempt, error) for attempt in range(10)]
+    assert all(0 <= delay <= 4 for delay in delays)
+
+def test_circuit_breaker_transitions():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert not breaker.allow_request()
+    
+    clock.now = 10
+    assert breaker.allow_request()  # half-open 시험 호출
+    assert not breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+def test_permanent_error_is_not_retried(interviewer):
+    with patch('google.generativeai.GenerativeModel.generate_content',
+               side_effect=api_exceptions.InvalidArgument("bad")) as mock_generate:
+        with pytest.raises(api_exceptions.InvalidArgument):
+            interviewer.get_model_response("프롬프트")
+        assert mock_generate.call_count == 1
+
+def test_open_breaker_serves_fallback(interviewer):
+    session = InterviewSession(position="프론트엔드")
+    with patch('google.generativeai.GenerativeModel.generate_content',
+               side_effect=api_exceptions.ServiceUnavailable("down")) as mock_generate:
+        with pytest.raises(api_exceptions.ServiceUnavailable):
+            interviewer.get_model_response("프롬프트")  # 3번째 실패로 브레이커 열림
+        assert mock_generate.call_count == 3
+        assert interviewer.get_model_response("프롬프트") is None
+        
+        result = interviewer.start_topic(session, "웹 보안과 인증")
+        assert result == "웹 보안과 인증에 대해 설명해주시겠습니까?"
+        assert mock_generate.call_count == 3  # 열린 동안 호출하지 않음
+
+def open_breaker_for_trial(interviewer) -> FakeClock:
+    """브레이커를 열고 대기 시간을 지나 half_open으로 만들기"""
+    clock = FakeClock()
+    interviewer.circuit_breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    interviewer.circuit_breaker.record_failure()
+    clock.now = 10
+    return clock
+
+def test_trial_is_released_on_scheduler_timeout(interviewer):
+    """시험 호출이 스케줄러 대기 시간 초과로 끝나도 다음 호출은 시험 가능"""
+    open_breaker_for_trial(interviewer)
+    with patch.object(interviewer.scheduler, 'acquire', side_effect=TimeoutError):
+        assert interviewer.get_model_response("프롬프트") is None
+
+    with patch('google.generativeai.GenerativeModel.generate_content') as mock_generate:
+        mock_generate.return_value.text = "응답"
+        assert interviewer.get_model_response("프롬프트") == "응답"
+    assert interviewer.circuit_breaker.state == CircuitBreaker.CLOSED
+
+def test_trial_is_released_when_stream_is_closed(interviewer):
+    """시험 스트림을 중간에 닫아도 다음 호출은 시험 가능"""
+    open_breaker_for_trial(interviewer)
+    chunk = type("Chunk", (), {"text": "첫 청크"})()
+    with patch('google.generativeai.GenerativeModel.generate_content', return_value=iter([chunk, chunk])):
+        stream = interviewer.stream_model_response("프롬프트")
+        assert next(stream) == "첫 청크"
+        stream.close()
+
+    assert interviewer.circuit_breaker.allow_request()
+
+def test_release_trial_requires_trial_token():
+    """시험 호출 토큰이 아닌 호출이 정리해도 시험 호출은 하나만 유지"""
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    closed_permit = breaker.allow_request()
+    breaker.record_failure()
+    clock.now = 10
+
+    trial = breaker.allow_request()
+    assert trial is not None
+    breaker.release_trial(closed_permit)  # 열리기 전에 시작한 다른 호출의 종료
+    assert breaker.allow_request() is None
+
+    breaker.release_trial(trial)
+    assert breaker.allow_request() is not None
+
+def test_permanent_error_keeps_breaker_open(interviewer):
+    """4xx 오류는 서비스 복구의 근거가 아니므로 브레이커를 닫지 않음"""
+    open_breaker_for_trial(interviewer)
+    with patch('google.generativeai.GenerativeModel.generate_content',
+               side_effect=api_exceptions.InvalidArgument("bad")):
+        with pytest.raises(api_exceptions.InvalidArgument):
+            interviewer.get_model_response("프롬프트")
+
+    assert interviewer.circuit_breaker.state == CircuitBreaker.HALF_OPEN
+    assert interviewer.circuit_breaker.allow_request() is not None  # 시험 호출은 정리됨
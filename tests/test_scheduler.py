@@ -0,0 +1,96 @@
+"""RequestScheduler 테스트"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from interview_coach.core.scheduler import RequestPriority, RequestScheduler
+
+def test_burst_is_served_immediately():
+    scheduler = RequestScheduler(rate_per_second=1, burst=3)
+    waits = [scheduler.acquire(RequestPriority.ANSWER_ANALYSIS) for _ in range(3)]
+    assert all(wait < 0.05 for wait in waits)
+    assert scheduler.metrics()['wait_time']['ANSWER_ANALYSIS']['requests'] == 3
+
+def test_higher_priority_is_dispatched_first():
+    scheduler = RequestScheduler(rate_per_second=20, burst=1)
+    scheduler.acquire()  # 버킷 비우기
+    order = []
+    
+    def worker(priority):
+        scheduler.acquire(priority)
+        order.append(priority)
+    
+    low = threading.Thread(target=worker, args=(RequestPriority.FINAL_EVALUATION,))
+    low.start()
+    time.sleep(0.01)
+    high = threading.Thread(target=worker, args=(RequestPriority.ANSWER_ANALYSIS,))
+    high.start()
+    low.join()
+    high.join()
+    
+    assert order == [RequestPriority.ANSWER_ANALYSIS, RequestPriority.FINAL_EVALUATION]
+
+def test_acquire_timeout_leaves_queue_clean():
+    scheduler = RequestScheduler(rate_per_second=0.1, burst=1)
+    scheduler.acquire()
+    with pytest.raises(TimeoutError):
+        scheduler.acquire(RequestPriority.TOPIC_FEEDBACK, timeout=0.05)
+    
+    metrics = scheduler.metrics()
+    assert metrics['queue_depth'] == 0
+    assert metrics['wait_time']['TOPIC_FEEDBACK']['timeouts'] == 1
+
+def test_acquire_async_waits_for_refill_without_threads():
+    scheduler = RequestScheduler(rate_per_second=20, burst=1)
+    scheduler.acquire()  # 버킷 비우기
+    threads_before = threading.active_count()
+
+    async def run():
+        return await asyncio.gather(*(
+            scheduler.acquire_async(RequestPriority.TOPIC_FEEDBACK) for _ in range(3)
+        ))
+
+    started = time.monotonic()
+    waits = asyncio.run(run())
+    assert time.monotonic() - started >= 0.1  # 초당 20개 -> 3개에 약 0.15초
+    assert sorted(waits)[0] > 0
+    assert threading.active_count() == threads_before
+    assert scheduler.metrics()['queue_depth'] == 0
+
+def test_acquire_async_shares_priority_queue():
+    scheduler = RequestScheduler(rate_per_second=20, burst=1)
+    scheduler.acquire()
+    order = []
+
+    async def worker(priority, delay):
+        await asyncio.sleep(delay)
+        await scheduler.acquire_async(priority)
+        order.append(priority)
+
+    async def run():
+        await asyncio.gather(
+            worker(RequestPriority.FINAL_EVALUATION, 0),
+            worker(RequestPriority.ANSWER_ANALYSIS, 0.01)
+        )
+
+    asyncio.run(run())
+    assert order == [RequestPriority.ANSWER_ANALYSIS, RequestPriority.FINAL_EVALUATION]
+
+def test_acquire_async_timeout_and_cancel_leave_queue_clean():
+    scheduler = RequestScheduler(rate_per_second=0.1, burst=1)
+    scheduler.acquire()
+
+    async def run():
+        with pytest.raises(TimeoutError):
+            await scheduler.acquire_async(RequestPriority.TOPIC_FEEDBACK, timeout=0.05)
+        task = asyncio.ensure_future(scheduler.acquire_async(RequestPriority.TOPIC_FEEDBACK))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    assert scheduler.metrics()['queue_depth'] == 0
@@ -0,0 +1,111 @@
+"""답변 점수 저장소 테스트"""
+
+import numpy as np
+import pytest
+
+from interview_coach.core.session import InterviewSession
+from interview_coach.stats.backends import SQLiteBackend
+from interview_coach.stats.ranking import PercentileIndex
+from interview_coach.stats.scores import SCORE_DTYPE, ScoreStore
+from interview_coach.stats.storage import FileStatisticsManager
+from interview_coach.stats.write_behind import BufferedStatisticsBackend, Durability
+
+@pytest.fixture
+def store(tmp_path):
+    return ScoreStore(str(tmp_path))
+
+def test_append_and_analytics(store):
+    store.append("백엔드", {"데이터베이스": [2, 4, 5], "API 설계": [3]})
+    store.append("백엔드", {"데이터베이스": [1]})
+    store.append("프론트엔드", {"데이터베이스": [5]})
+
+    assert store.load().dtype == SCORE_DTYPE
+    assert len(store.load()) == 6
+
+    analytics = store.topic_analytics(position="백엔드")
+    db = analytics["데이터베이스"]
+    assert db["count"] == 4
+    assert db["mean"] == 3.0
+    assert db["p50"] == 2
+    assert db["p90"] == 5
+    assert db["distribution"] == {"1": 1, "2": 1, "3": 0, "4": 1, "5": 1}
+    assert analytics["API 설계"]["count"] == 1
+
+    assert store.topic_analytics()["데이터베이스"]["count"] == 5
+    assert store.topic_analytics(position="풀스택") == {}
+
+def test_percentiles_match_numpy(store):
+    rng = np.random.default_rng(0)
+    values = rng.integers(1, 6, size=500).tolist()
+    store.append("풀스택", {"시스템 설계": values})
+
+    stat = store.topic_analytics()["시스템 설계"]
+    expected = np.percentile(values, [50, 90], method="inverted_cdf")
+    assert [stat["p50"], stat["p90"]] == [int(v) for v in expected]
+    assert stat["mean"] == round(float(np.mean(values)), 2)
+
+def test_vocab_shared_between_instances(tmp_path):
+    ScoreStore(str(tmp_path)).append("백엔드", {"API 설계": [4]})
+    other = ScoreStore(str(tmp_path))
+    other.append("백엔드", {"캐싱": [2]})
+    assert set(ScoreStore(str(tmp_path)).topic_analytics()) == {"API 설계", "캐싱"}
+
+def test_session_scores_drive_success(tmp_path):
+    session = InterviewSession(position="백엔드", current_topic="API 설계", interview_complete=True)
+    session.record_score(4)
+    session.record_score(5)
+    session.completed_topics.append("API 설계")
+    session.final_feedback = "잘했습니다"
+
+    manager = FileStatisticsManager(
+        backend=SQLiteBackend(str(tmp_path / "stats.db")),
+        score_store=ScoreStore(str(tmp_path)),
+        ranking=PercentileIndex(str(tmp_path))
+    )
+    assert manager._check_session_success(session)
+    manager.update_statistics(session)
+
+    assert manager.get_statistics_summary()["success_rate"] == 100.0
+    assert manager.get_score_analytics("백엔드")["API 설계"]["mean"] == 4.5
+    assert manager.get_score_ranking(session)["API 설계"]["population"] == 1
+
+def test_buffered_backend_writes_scores_on_flush(tmp_path):
+    """지연 쓰기 버퍼를 쓰면 점수/순위도 update_statistics가 아니라 반영 시점에 기록"""
+    store, ranking = ScoreStore(str(tmp_path)), PercentileIndex(str(tmp_path))
+    backend = BufferedStatisticsBackend(
+        SQLiteBackend(str(tmp_path / "stats.db")), flush_interval=60,
+        durability=Durability.SPOOL, spool_dir=str(tmp_path), sinks=[store, ranking]
+    )
+    manager = FileStatisticsManager(backend=backend, score_store=store, ranking=ranking)
+    session = InterviewSession(position="백엔드", current_topic="API 설계")
+    session.record_score(3)
+    manager.update_statistics(session)
+
+    assert len(store.load()) == 0
+    assert manager.get_score_ranking(session) == {}
+
+    backend.close()
+    assert manager.get_score_analytics("백엔드")["API 설계"]["count"] == 1
+    assert manager.get_score_ranking(session)["API 설계"]["population"] == 1
+
+def test_session_ranking_excludes_itself(tmp_path):
+    """순위는 지연 쓰기 반영 여부와 관계없이 이 세션을 뺀 모집단 기준"""
+    store, ranking = ScoreStore(str(tmp_path)), PercentileIndex(str(tmp_path))
+    ranking.add_session("백엔드", {"API 설계": [2]})
+    ranking.add_session("백엔드", {"API 설계": [4]})
+    backend = BufferedStatisticsBackend(
+        SQLiteBackend(str(tmp_path / "stats.db")), flush_interval=60,
+        durability=Durability.SPOOL, spool_dir=str(tmp_path), sinks=[store, ranking]
+    )
+    manager = FileStatisticsManager(backend=backend, score_store=store, ranking=ranking)
+    session = InterviewSession(position="백엔드", current_topic="API 설계")
+    session.record_score(3)
+
+    session.score_ranking = manager.update_statistics(session)
+    assert session.score_ranking["API 설계"]["population"] == 2
+    assert session.score_ranking["API 설계"]["percentile"] == 50.0
+
+    backend.close()
+    assert manager.get_score_ranking(session)["API 설계"]["population"] == 3
+    restored = InterviewSession.from_state(session.to_state())
+    assert restored.score_ranking == session.score_ranking
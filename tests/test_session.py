@@ -66,4 +66,47 @@ def test_reset(session):
     assert len(session.conversations) == 0
     assert len(session.completed_topics) == 0
     assert not session.interview_complete
-    assert session.final_feedback is None
\ No newline at end of file
+    assert session.final_feedback is None
+
+def test_formatted_conversation_is_incremental(session):
+    session.add_message("interviewer", "테스트 질문")
+    assert session.get_formatted_conversation() == "면접관: 테스트 질문"
+    
+    session.add_message("candidate", "테스트 답변")
+    assert session.get_formatted_conversation() == "면접관: 테스트 질문\n지원자: 테스트 답변"
+    
+    session.reset_current_conversation()
+    assert session.get_formatted_conversation() == ""
+
+def test_formatted_conversation_after_replay_retry(session):
+    """같은 길이의 새 대화로 교체되어도 이전 대화록을 재사용하지 않음"""
+    session.add_message("interviewer", "이전 질문")
+    assert session.get_formatted_conversation() == "면접관: 이전 질문"
+
+    topic = session.current_topic
+    session.apply_journal_entry('retry', {'t': topic})
+    session.apply_journal_entry('msg', {'t': topic, 'r': 'interviewer', 'c': "새 질문", 'ts': 0.0})
+    assert session.get_formatted_conversation() == "면접관: 새 질문"
+
+def test_formatted_all_conversations_cache(session):
+    session.add_message("interviewer", "첫 번째 질문")
+    session.clear_current_conversation()
+    
+    first = session.get_formatted_all_conversations()
+    assert first == "면접관: 첫 번째 질문"
+    assert session.get_all_conversations() is session.get_all_conversations()
+    
+    session.current_topic = "React/Vue/Angular 프레임워크"
+    session.add_message("interviewer", "두 번째 질문")
+    session.clear_current_conversation()
+    assert session.get_formatted_all_conversations() == "면접관: 첫 번째 질문\n면접관: 두 번째 질문"
+
+def test_record_score(session):
+    assert session.get_average_score() is None
+    session.record_score(3)
+    session.record_score(5)
+    assert session.scores[session.current_topic] == [3, 5]
+    assert session.get_average_score() == 4.0
+    
+    session.reset_current_conversation()
+    assert session.get_average_score() is None
@@ -0,0 +1,110 @@
+"""활성 세션 LRU 관리자 테스트"""
+
+import gc
+
+import pytest
+from interview_coach.core.session_manager import SessionManager, estimate_session_bytes
+from interview_coach.core.session_store import SessionStore
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+@pytest.fixture
+def store(tmp_path):
+    return SessionStore(str(tmp_path / "sessions.db"))
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+def make_manager(store, clock, **kwargs):
+    options = dict(max_sessions=2, memory_ceiling=10 * 1024 * 1024, idle_seconds=600)
+    options.update(kwargs)
+    return SessionManager(store, clock=clock, **options)
+
+def fill(session, topic: str = "Python", chars: int = 100) -> None:
+    session.position = "백엔드"
+    session.current_topic = topic
+    session.add_message("interviewer", "질문")
+    session.add_message("candidate", "답" * chars)
+
+def test_lru_evicts_oldest(store, clock):
+    """최대 세션 수를 넘으면 가장 오래 쓰지 않은 세션을 내보냄"""
+    manager = make_manager(store, clock)
+    first, session = manager.create()
+    fill(session)
+    second, _ = manager.create()
+    manager.get(first)  # first를 최근 사용으로
+    manager.create()
+
+    metrics = manager.metrics()
+    assert metrics["active_sessions"] == 2
+    assert metrics["evictions"] == 1
+    assert second not in manager._active and first in manager._active
+
+def test_rehydrates_from_disk(store, clock):
+    """참조가 모두 해제된 세션은 저장소에서 다시 읽어옴"""
+    manager = make_manager(store, clock)
+    token, session = manager.create()
+    fill(session)
+    state = session.to_state()
+    assert manager.evict(token)
+    del session
+    gc.collect()
+
+    restored = manager.get(token)
+    assert restored.to_state() == state
+    assert manager.metrics()["rehydrations"] == 1
+
+def test_revives_referenced_session(store, clock):
+    """아직 참조 중인 세션은 같은 객체를 되살림"""
+    manager = make_manager(store, clock)
+    token, session = manager.create()
+    manager.evict(token)
+    fill(session)  # 내보낸 뒤에도 진행 중인 실행이 계속 변경
+
+    assert manager.get(token) is session
+    assert manager.metrics()["revivals"] == 1
+    assert store.load(token).to_state() == session.to_state()
+
+def test_idle_sessions_are_evicted(store, clock):
+    """유휴 시간이 지난 세션만 내보냄"""
+    manager = make_manager(store, clock, max_sessions=10, idle_seconds=60)
+    idle, _ = manager.create()
+    clock.now = 30
+    active, _ = manager.create()
+    clock.now = 70
+
+    assert manager.evict_idle() == 1
+    assert idle not in manager._active and active in manager._active
+
+def test_memory_ceiling(store, clock):
+    """추정 메모리 합계가 상한을 넘으면 내보냄"""
+    manager = make_manager(store, clock, max_sessions=10, memory_ceiling=6000)
+    tokens = []
+    for _ in range(3):
+        token, session = manager.create()
+        fill(session, chars=1000)
+        tokens.append(token)
+        manager.get(token)  # 크기 갱신
+
+    metrics = manager.metrics()
+    assert metrics["resident_bytes"] <= 6000
+    assert metrics["evictions"] >= 1
+    assert tokens[-1] in manager._active
+
+def test_estimate_session_bytes(store, clock):
+    """대화가 길수록 추정 크기 증가"""
+    manager = make_manager(store, clock)
+    _, session = manager.create()
+    empty = estimate_session_bytes(session)
+    fill(session, chars=500)
+    assert estimate_session_bytes(session) > empty + 1000
+
+def test_unknown_token(store, clock):
+    """없는 토큰은 None"""
+    assert make_manager(store, clock).get("missing") is None
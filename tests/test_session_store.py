@@ -0,0 +1,89 @@
+"""세션 저널 저장소 테스트"""
+
+import pytest
+from interview_coach.core.session import InterviewSession
+from interview_coach.core.session_store import SessionStore
+
+@pytest.fixture
+def store(tmp_path):
+    return SessionStore(str(tmp_path / "sessions.db"), snapshot_every=5)
+
+def play_topic(session: InterviewSession, topic: str) -> None:
+    session.current_topic = topic
+    session.add_message("interviewer", f"{topic} 질문")
+    session.add_message("candidate", f"{topic} 답변", feedback={"score": 4})
+    session.record_score(4)
+    session.clear_current_conversation()
+
+def journal_count(store: SessionStore, token: str) -> int:
+    return store._connect().execute(
+        "SELECT COUNT(*) FROM journal WHERE token = ?", (token,)
+    ).fetchone()[0]
+
+def test_resume_replays_journal(store):
+    """저널 재적용으로 같은 상태 복원"""
+    session = InterviewSession()
+    token = store.attach(session)
+    session.position = "백엔드"
+    session.current_topic = "Python"
+    session.add_message("interviewer", "GIL이란?")
+    session.reset_current_conversation()
+    session.add_message("interviewer", "데코레이터란?")
+    session.add_message("candidate", "함수를 감싸는 함수입니다", feedback={"score": 3})
+    session.record_score(3)
+
+    restored = store.load(token)
+    assert restored.to_state() == session.to_state()
+    assert restored.get_formatted_conversation() == session.get_formatted_conversation()
+
+def test_snapshot_compacts_journal(store):
+    """SNAPSHOT_EVERY건마다 스냅샷 저장 후 이전 저널 삭제"""
+    session = InterviewSession(position="백엔드")
+    token = store.attach(session)
+    for topic in ["Python", "Database", "Network"]:
+        play_topic(session, topic)
+
+    assert journal_count(store, token) < store.snapshot_every
+    restored = store.load(token)
+    assert restored.to_state() == session.to_state()
+    assert restored.completed_topics == ["Python", "Database", "Network"]
+
+def test_restored_session_keeps_journaling(store):
+    """복원한 세션의 이후 변경도 이어서 기록"""
+    session = InterviewSession(position="백엔드")
+    token = store.attach(session)
+    play_topic(session, "Python")
+
+    restored = store.load(token)
+    play_topic(restored, "Database")
+    restored.interview_complete = True
+    restored.final_feedback = "좋습니다"
+
+    again = SessionStore(str(store.db_path)).load(token)
+    assert again.to_state() == restored.to_state()
+
+def test_reset_is_journaled(store):
+    """세션 초기화도 복원 시 반영"""
+    session = InterviewSession(position="백엔드")
+    token = store.attach(session)
+    play_topic(session, "Python")
+    session.reset()
+
+    restored = store.load(token)
+    assert restored.position is None
+    assert restored.conversations == {}
+    assert restored.scores == {}
+
+def test_unknown_and_deleted_token(store):
+    """없는 토큰은 None"""
+    assert store.load("missing") is None
+    token = store.attach(InterviewSession())
+    store.delete(token)
+    assert store.load(token) is None
+
+def test_cleanup_expired(store):
+    """보관 기간이 지난 세션 정리"""
+    token = store.attach(InterviewSession())
+    store._connect().execute("UPDATE sessions SET updated_at = 0 WHERE token = ?", (token,))
+    assert store.cleanup(ttl_days=1) == 1
+    assert store.load(token) is None
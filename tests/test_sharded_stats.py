@@ -0,0 +1,96 @@
+"""샤드 카운터 통계 저장소 테스트"""
+
+import json
+import multiprocessing
+from datetime import date, datetime, timedelta
+
+from interview_coach.stats.models import StatisticsEvent
+from interview_coach.stats.sharded import ShardedCounterBackend
+
+def test_each_replica_writes_own_shard(tmp_path):
+    first = ShardedCounterBackend(str(tmp_path), shard_id="node-a")
+    second = ShardedCounterBackend(str(tmp_path), shard_id="node-b")
+    first.record(StatisticsEvent(position="백엔드", completed=True))
+    second.record(StatisticsEvent(position="백엔드"))
+    second.record(StatisticsEvent(position="풀스택", completed=True, success=True))
+
+    assert sorted(p.name for p in first.shard_dir.glob("shard-*.json")) == ["shard-node-a.json", "shard-node-b.json"]
+    for backend in (first, second):
+        stats = backend.load(date.today())
+        assert stats["total_interviews"] == 3
+        assert stats["completed_interviews"] == 2
+        assert stats["success_count"] == 1
+        assert stats["position_distribution"] == {"프론트엔드": 0, "백엔드": 2, "풀스택": 1}
+
+def test_restart_continues_own_counters(tmp_path):
+    ShardedCounterBackend(str(tmp_path), shard_id="node-a").record(StatisticsEvent(position="백엔드"))
+    restarted = ShardedCounterBackend(str(tmp_path), shard_id="node-a")
+    restarted.record(StatisticsEvent(position="백엔드"))
+    assert restarted.load(date.today())["total_interviews"] == 2
+
+def test_merged_view_cached_until_shard_changes(tmp_path):
+    backend = ShardedCounterBackend(str(tmp_path), shard_id="node-a")
+    backend.record(StatisticsEvent(position="백엔드"))
+    merged = backend._merged_days()
+    assert backend._merged_days() is merged
+
+    ShardedCounterBackend(str(tmp_path), shard_id="node-b").record(StatisticsEvent(position="백엔드"))
+    assert backend._merged_days() is not merged
+    assert backend.load(date.today())["total_interviews"] == 2
+
+def test_range_and_cleanup(tmp_path):
+    backend = ShardedCounterBackend(str(tmp_path), shard_id="node-a")
+    backend.record(StatisticsEvent(position="백엔드", timestamp=datetime.now() - timedelta(days=40)))
+    backend.record(StatisticsEvent(position="백엔드", timestamp=datetime.now() - timedelta(days=2)))
+    assert backend.load_range(date.today() - timedelta(days=7), date.today())["total_interviews"] == 1
+
+    backend.cleanup(date.today() - timedelta(days=30))
+    assert backend.load_range(date.today() - timedelta(days=60), date.today())["total_interviews"] == 1
+
+def _record_shard(stats_dir, shard_id, count):
+    backend = ShardedCounterBackend(stats_dir, shard_id=shard_id)
+    for _ in range(count):
+        backend.record(StatisticsEvent(position="백엔드"))
+
+def test_concurrent_replicas_lose_no_increments(tmp_path):
+    processes = [
+        multiprocessing.Process(target=_record_shard, args=(str(tmp_path), f"node-{i}", 50))
+        for i in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+    reader = ShardedCounterBackend(str(tmp_path), shard_id="reader")
+    assert reader.load(date.today())["total_interviews"] == 200
+
+def test_dead_shards_are_folded_into_base(tmp_path):
+    """종료된 프로세스의 샤드는 다음 기동 시 기본 샤드로 합치고 삭제"""
+    _record_shard(str(tmp_path), "pid-1", 3)
+    _record_shard(str(tmp_path), "pid-2", 2)
+    live = ShardedCounterBackend(str(tmp_path), shard_id="pid-3")
+    live.record(StatisticsEvent(position="백엔드"))
+
+    names = sorted(p.name for p in live.shard_dir.glob("*.json"))
+    assert names == ["base.json", "shard-pid-3.json"]
+    assert live.load(date.today())["total_interviews"] == 6
+
+    # 살아 있는 샤드는 다른 프로세스가 합치지 않음
+    ShardedCounterBackend(str(tmp_path), shard_id="pid-4")
+    assert (live.shard_dir / "shard-pid-3.json").exists()
+    assert live.load(date.today())["total_interviews"] == 6
+
+def test_interrupted_fold_is_not_double_counted(tmp_path):
+    _record_shard(str(tmp_path), "pid-1", 3)
+    backend = ShardedCounterBackend(str(tmp_path), shard_id="reader")
+    # 기본 샤드 기록 후 삭제 전에 중단된 상황 재현
+    shard_path = backend.shard_dir / "shard-pid-1.json"
+    shard_path.write_text('{"days": {"%s": {"total_interviews": 3}}}' % date.today().isoformat())
+    base = json.loads(backend.base_path.read_text())
+    backend._write_json(backend.base_path, dict(base, folded=["pid-1"]))
+
+    backend.cleanup(date.today() - timedelta(days=30))
+    assert not shard_path.exists()
+    assert backend.load(date.today())["total_interviews"] == 3
@@ -0,0 +1,17 @@
+"""SQLite 공용 연결 도우미 테스트"""
+
+import threading
+
+from interview_coach.utils.sqlite_util import ThreadLocalConnection
+
+def test_connection_per_thread(tmp_path):
+    connections = ThreadLocalConnection(tmp_path / "test.db", timeout=1.0)
+    conn = connections.get()
+    assert connections.get() is conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(connections.get()))
+    thread.start()
+    thread.join()
+    assert other[0] is not conn
@@ -0,0 +1,163 @@
+"""통계 저장소 백엔드 테스트"""
+
+import multiprocessing
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from interview_coach.core.session import InterviewSession
+from interview_coach.stats.backends import EventLogBackend, JsonFileBackend, SQLiteBackend, decompose_range
+from interview_coach.stats.models import StatisticsEvent
+from interview_coach.stats.ranking import PercentileIndex
+from interview_coach.stats.scores import ScoreStore
+from interview_coach.stats.storage import FileStatisticsManager
+
+@pytest.fixture(params=['sqlite', 'event_log', 'json'])
+def backend(request, tmp_path):
+    if request.param == 'sqlite':
+        return SQLiteBackend(str(tmp_path / "stats.db"))
+    if request.param == 'event_log':
+        return EventLogBackend(str(tmp_path), compact_every=2)
+    return JsonFileBackend(str(tmp_path))
+
+def test_record_and_load(backend):
+    backend.record(StatisticsEvent(position="백엔드", completed=True, success=True))
+    backend.record(StatisticsEvent(position="백엔드", completed=False))
+    backend.record(StatisticsEvent(position="프론트엔드", completed=True))
+
+    stats = backend.load(date.today())
+    assert stats["total_interviews"] == 3
+    assert stats["completed_interviews"] == 2
+    assert stats["success_count"] == 1
+    assert stats["position_distribution"] == {"프론트엔드": 1, "백엔드": 2, "풀스택": 0}
+
+def test_cleanup_removes_old_days(backend):
+    old_day = datetime.now() - timedelta(days=40)
+    backend.record(StatisticsEvent(position="풀스택", timestamp=old_day))
+    backend.record(StatisticsEvent(position="풀스택"))
+
+    backend.cleanup(date.today() - timedelta(days=30))
+    assert backend.load(old_day.date())["total_interviews"] == 0
+    assert backend.load(date.today())["total_interviews"] == 1
+
+def test_summary_output_unchanged(tmp_path):
+    manager = FileStatisticsManager(
+        backend=SQLiteBackend(str(tmp_path / "stats.db")),
+        score_store=ScoreStore(str(tmp_path)),
+        ranking=PercentileIndex(str(tmp_path))
+    )
+    session = InterviewSession(position="백엔드", interview_complete=True)
+    manager.update_statistics(session)
+    manager.update_statistics(InterviewSession(position="풀스택"))
+
+    summary = manager.get_statistics_summary()
+    assert summary == {
+        "total_interviews": 2,
+        "completion_rate": 50.0,
+        "position_distribution": {"프론트엔드": 0, "백엔드": 1, "풀스택": 1},
+        "success_rate": 0.0
+    }
+
+def _record_many(db_path, count):
+    backend = SQLiteBackend(db_path)
+    for i in range(count):
+        backend.record(StatisticsEvent(position="백엔드", completed=i % 2 == 0))
+
+def test_concurrent_processes_lose_no_increments(tmp_path):
+    db_path = str(tmp_path / "stats.db")
+    SQLiteBackend(db_path)
+    processes = [
+        multiprocessing.Process(target=_record_many, args=(db_path, 50))
+        for _ in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+    stats = SQLiteBackend(db_path).load(date.today())
+    assert stats["total_interviews"] == 200
+    assert stats["completed_interviews"] == 100
+    assert stats["position_distribution"]["백엔드"] == 200
+
+def test_event_log_compaction_matches_tail(tmp_path):
+    backend = EventLogBackend(str(tmp_path), compact_every=1000)
+    for i in range(5):
+        backend.record(StatisticsEvent(position="백엔드", completed=True, score=float(i)))
+
+    before = backend.load(date.today())
+    assert backend.compact() == 5
+    assert backend.compact() == 0
+
+    after = backend.load(date.today())
+    for key in ("total_interviews", "completed_interviews", "position_distribution", "score_sum", "score_count"):
+        assert after[key] == before[key]
+    assert after["score_sum"] == 10.0
+
+    backend.record(StatisticsEvent(position="풀스택"))
+    assert backend.load(date.today())["total_interviews"] == 6
+    assert backend.load_period("monthly", date.today().strftime("%Y-%m"))["total_interviews"] == 6
+
+def test_event_log_ignores_partial_line_and_rebuilds(tmp_path):
+    backend = EventLogBackend(str(tmp_path), compact_every=2)
+    backend.record(StatisticsEvent(position="백엔드"))
+    backend.record(StatisticsEvent(position="백엔드"))  # 자동 압축
+    with open(backend.log_path, 'a', encoding='utf-8') as f:
+        f.write('{"position": "풀스')
+
+    assert backend.load(date.today())["total_interviews"] == 2
+
+    backend.rollup_path.unlink()
+    backend.rebuild()
+    assert backend.load(date.today())["position_distribution"]["백엔드"] == 2
+
+def test_event_log_compaction_survives_restart(tmp_path):
+    """압축 주기는 메모리 카운터가 아니라 로그에 쌓인 미압축 이벤트 수 기준"""
+    backend = EventLogBackend(str(tmp_path), compact_every=3)
+    backend.record(StatisticsEvent(position="백엔드"))
+    backend.record(StatisticsEvent(position="백엔드"))
+
+    restarted = EventLogBackend(str(tmp_path), compact_every=3)
+    restarted.record(StatisticsEvent(position="풀스택"))
+    assert restarted.compact() == 0  # 세 번째 기록에서 이미 압축됨
+    assert restarted.load(date.today())["total_interviews"] == 3
+
+def test_decompose_range_uses_month_and_week_rollups():
+    keys = decompose_range(date(2024, 1, 1), date(2024, 2, 14))
+    assert keys[0] == ("monthly", "2024-01")
+    assert ("weekly", "2024-W06") in keys  # 2024-02-05 ~ 02-11
+    assert len(keys) < 45
+
+    covered = set()
+    for period, key in keys:
+        if period == "daily":
+            covered.add(date.fromisoformat(key))
+    assert date(2024, 2, 1) in covered and date(2024, 2, 14) in covered
+
+def test_load_range_matches_daily_sum(backend):
+    today = datetime.now()
+    for offset in (0, 3, 9, 20, 45):
+        backend.record(StatisticsEvent(
+            position="백엔드", completed=True, timestamp=today - timedelta(days=offset)
+        ))
+
+    start = date.today() - timedelta(days=29)
+    stats = backend.load_range(start, date.today())
+    assert stats["total_interviews"] == 4
+    assert stats["position_distribution"]["백엔드"] == 4
+    assert backend.load_range(date.today(), date.today())["total_interviews"] == 1
+
+def test_range_summaries(tmp_path):
+    manager = FileStatisticsManager(
+        backend=SQLiteBackend(str(tmp_path / "stats.db")),
+        score_store=ScoreStore(str(tmp_path)),
+        ranking=PercentileIndex(str(tmp_path))
+    )
+    manager.backend.record(StatisticsEvent(position="백엔드", timestamp=datetime.now() - timedelta(days=3)))
+    manager.update_statistics(InterviewSession(position="풀스택", interview_complete=True))
+
+    summaries = manager.get_range_summaries({"오늘": 1, "최근 7일": 7})
+    assert summaries["오늘"]["total_interviews"] == 1
+    assert summaries["최근 7일"]["total_interviews"] == 2
+    assert summaries["최근 7일"]["completion_rate"] == 50.0
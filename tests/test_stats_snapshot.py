@@ -0,0 +1,73 @@
+"""통계 스냅샷 캐시 테스트"""
+
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from interview_coach.core.session import InterviewSession
+from interview_coach.stats.backends import JsonFileBackend, SQLiteBackend
+from interview_coach.stats.models import StatisticsEvent
+from interview_coach.stats.snapshot import StatisticsSnapshotCache
+from interview_coach.stats.ranking import PercentileIndex
+from interview_coach.stats.scores import ScoreStore
+from interview_coach.stats.storage import FileStatisticsManager
+
+@pytest.fixture
+def backend(tmp_path):
+    return SQLiteBackend(str(tmp_path / "stats.db"))
+
+def test_hit_until_backend_changes(backend):
+    cache = StatisticsSnapshotCache(backend)
+    first = cache.get_day(date.today())
+    with patch.object(backend, 'load', wraps=backend.load) as load:
+        assert cache.get_day(date.today()) is first
+        load.assert_not_called()
+
+    # 다른 프로세스의 기록은 파일 버전 변경으로 감지
+    SQLiteBackend(str(backend.db_path)).record(StatisticsEvent(position="백엔드"))
+    assert cache.get_day(date.today())["total_interviews"] == 1
+
+def test_invalidate_bumps_generation(backend):
+    cache = StatisticsSnapshotCache(backend)
+    cache.get_day(date.today())
+    with patch.object(backend, 'version', return_value="고정"):
+        cache.get_day(date.today())
+        cache.invalidate()
+        with patch.object(backend, 'load', wraps=backend.load) as load:
+            cache.get_day(date.today())
+            load.assert_called_once()
+    assert cache.generation == 1
+
+def test_fallback_ttl_when_version_unknown(backend):
+    now = [0.0]
+    cache = StatisticsSnapshotCache(backend, fallback_ttl=5, clock=lambda: now[0])
+    with patch.object(backend, 'version', return_value=None), \
+         patch.object(backend, 'load', wraps=backend.load) as load:
+        cache.get_day(date.today())
+        cache.get_day(date.today())
+        now[0] = 6
+        cache.get_day(date.today())
+        assert load.call_count == 2
+
+def test_summary_fresh_right_after_update(tmp_path):
+    manager = FileStatisticsManager(
+        backend=JsonFileBackend(str(tmp_path)),
+        score_store=ScoreStore(str(tmp_path)),
+        ranking=PercentileIndex(str(tmp_path))
+    )
+    assert manager.get_statistics_summary()["total_interviews"] == 0
+    manager.update_statistics(InterviewSession(position="백엔드"))
+    assert manager.get_statistics_summary()["total_interviews"] == 1
+
+def test_snapshots_are_capped_lru(backend):
+    cache = StatisticsSnapshotCache(backend, max_entries=2)
+    today = date.today()
+    first = cache.get_range(date(2024, 1, 1), today)
+    cache.get_range(date(2024, 2, 1), today)
+    assert cache.get_range(date(2024, 1, 1), today) is first  # 최근 조회로 갱신
+    cache.get_range(date(2024, 3, 1), today)
+
+    assert len(cache._snapshots) == 2
+    assert ("range", date(2024, 2, 1), today) not in cache._snapshots
+    assert cache.get_range(date(2024, 1, 1), today) is first
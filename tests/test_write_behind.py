@@ -0,0 +1,115 @@
+"""지연 쓰기 통계 버퍼 테스트"""
+
+import json
+import socket
+from datetime import date
+from typing import List
+
+import pytest
+
+from interview_coach.stats.backends import SQLiteBackend
+from interview_coach.stats.models import StatisticsEvent
+from interview_coach.stats.write_behind import BufferedStatisticsBackend, Durability
+
+class CountingBackend(SQLiteBackend):
+    """record_batch 호출 횟수를 세는 저장소"""
+
+    def __init__(self, db_path):
+        super().__init__(db_path)
+        self.batches: List[int] = []
+
+    def record_batch(self, events):
+        self.batches.append(len(events))
+        super().record_batch(events)
+
+@pytest.fixture
+def inner(tmp_path):
+    return CountingBackend(str(tmp_path / "stats.db"))
+
+def test_buffers_until_flush(inner, tmp_path):
+    buffered = BufferedStatisticsBackend(inner, flush_interval=60, batch_size=100,
+                                         durability=Durability.MEMORY, spool_dir=str(tmp_path))
+    for _ in range(3):
+        buffered.record(StatisticsEvent(position="백엔드", completed=True))
+
+    assert inner.batches == []
+    assert inner.load(date.today())["total_interviews"] == 0
+    assert buffered.load(date.today())["total_interviews"] == 3  # 버퍼 포함 조회
+
+    assert buffered.flush() == 3
+    assert inner.batches == [3]
+    assert inner.load(date.today())["position_distribution"]["백엔드"] == 3
+    buffered.close()
+
+def test_close_flushes_remaining(inner, tmp_path):
+    buffered = BufferedStatisticsBackend(inner, flush_interval=60, batch_size=100,
+                                         durability=Durability.SPOOL, spool_dir=str(tmp_path))
+    buffered.record(StatisticsEvent(position="풀스택"))
+    buffered.close()
+
+    assert inner.load(date.today())["total_interviews"] == 1
+    assert list(tmp_path.glob("pending-*")) == []
+
+def test_batch_size_triggers_background_flush(inner, tmp_path):
+    buffered = BufferedStatisticsBackend(inner, flush_interval=60, batch_size=2,
+                                         durability=Durability.MEMORY, spool_dir=str(tmp_path))
+    buffered.record(StatisticsEvent(position="백엔드"))
+    buffered.record(StatisticsEvent(position="백엔드"))
+
+    for _ in range(100):
+        if inner.batches:
+            break
+        buffered._thread.join(0.02)
+    assert inner.batches == [2]
+    buffered.close()
+
+def test_recovers_orphan_spool(inner, tmp_path):
+    orphan = tmp_path / "pending-otherhost-999999.jsonl"
+    orphan.write_text(json.dumps(StatisticsEvent(position="백엔드").to_dict()) + "\n", encoding='utf-8')
+    # 다른 호스트의 스풀은 건드리지 않음
+    buffered = BufferedStatisticsBackend(inner, flush_interval=60, durability=Durability.SPOOL,
+                                         spool_dir=str(tmp_path))
+    assert orphan.exists()
+    buffered.close()
+
+    local_orphan = tmp_path / f"pending-{socket.gethostname()}-999999.jsonl"
+    orphan.rename(local_orphan)
+    buffered = BufferedStatisticsBackend(inner, flush_interval=60, durability=Durability.SPOOL,
+                                         spool_dir=str(tmp_path))
+    assert not local_orphan.exists()
+    assert inner.load(date.today())["total_interviews"] == 1
+    buffered.close()
+
+class FlakySink:
+    """첫 호출만 실패하는 추가 저장소"""
+
+    def __init__(self):
+        self.calls = 0
+        self.events: List[StatisticsEvent] = []
+
+    def record_batch(self, events):
+        self.calls += 1
+        if self.calls == 1:
+            raise OSError("디스크 오류")
+        self.events.extend(events)
+
+def test_sinks_receive_flushed_batch_and_retry(inner, tmp_path):
+    sink = FlakySink()
+    buffered = BufferedStatisticsBackend(inner, flush_interval=60, batch_size=100,
+                                         durability=Durability.MEMORY, spool_dir=str(tmp_path),
+                                         sinks=[sink])
+    buffered.record(StatisticsEvent(position="백엔드", scores={"API 설계": [3]}))
+    assert sink.calls == 0  # 기록 시점에는 쓰지 않음
+
+    with pytest.raises(OSError):
+        buffered.flush()
+    assert inner.batches == [1]
+    assert buffered.metrics()['sink_backlog'] == 1
+
+    # 내부 저장소에는 다시 반영하지 않고 실패한 저장소에만 재전달
+    buffered.record(StatisticsEvent(position="백엔드"))
+    buffered.flush()
+    assert inner.batches == [1, 1]
+    assert len(sink.events) == 2
+    assert sink.events[0].scores == {"API 설계": [3]}
+    buffered.close()